@@ -28,6 +28,7 @@ from .configuration.iam_constants import (
     CONFIGURATION_PATH_TEMPLATE,
     LOG_FILE_PATH,
     COMPONENT_NAME,
+    INDEXED_ATTRIBUTES,
 )
 from . import base
 
@@ -81,6 +82,7 @@ class IAM(DefaultFacade):
         self.persistency_controller = IAMPersistenceController(
             request, response, iam_action_mapper, configuration
         )
+        self.persistency_controller.register_search(INDEXED_ATTRIBUTES)
         self.users_controller = IAMUsersController(
             request=request,
             response=response,
@@ -66,3 +66,6 @@ AUTHENTICATED_USERS = "authenticated_users"
 UNAUTHENTICATED_USERS = "unauthenticated_users"
 
 ADMIN_USERS = "admin_users"
+
+# the attributes of the records indexed by the IndexedSearch by record type
+INDEXED_ATTRIBUTES = {"User": ["callsign", "CN", "status"]}
@@ -1,9 +1,7 @@
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, List
 import uuid
-from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker, scoped_session
-from sqlalchemy.pool import NullPool
 
 # import tables in initialization order
 from digitalpy.core.IAM.persistence.session_contact import SessionContact
@@ -20,6 +18,8 @@ from digitalpy.core.network.domain.client_status import ClientStatus
 from digitalpy.core.IAM.persistence.permissions import Permissions
 
 from digitalpy.core.main.controller import Controller
+from digitalpy.core.main.object_factory import ObjectFactory
+from digitalpy.core.persistence.impl.engine_registry import EngineRegistry
 from ..persistence.iam_base import IAMBase
 from ..configuration.iam_constants import (
     AUTHENTICATED_USERS,
@@ -49,11 +49,6 @@ class IAMPersistenceController(Controller):
         configuration (Configuration): the configuration object
     """
 
-    # create the engine as a class variable to avoid creating it multiple times
-    # implementation ref https://docs.sqlalchemy.org/en/20/core/pooling.html#using-connection-pools-with-multiprocessing-or-os-fork
-    engine = None
-    engine_pid = None
-
     def __init__(
         self,
         request: "Request",
@@ -70,9 +65,9 @@ class IAMPersistenceController(Controller):
         Returns:
             Session: the session connecting the db
         """
-        # use NullPool to prevent connections from remaning open, this allows
-        # us to delete the component and it's database at runtime (component management)
-        engine = create_engine(DB_PATH, poolclass=NullPool)
+        # the engine is shared by all controllers of the process, its connections are
+        # closed by the EngineRegistry when the component and it's database are deleted
+        engine = EngineRegistry.get_engine(DB_PATH)
         # create a configured "Session" class
         SessionClass = sessionmaker(bind=engine, expire_on_commit=False)
         # create a Session
@@ -80,11 +75,54 @@ class IAMPersistenceController(Controller):
 
     def intialize_db(self):
         """create the tables in the database"""
-        # use NullPool to prevent connections from remaning open, this allows
-        # us to delete the component and it's database at runtime (component management)
-        engine = create_engine(DB_PATH, poolclass=NullPool)
+        engine = EngineRegistry.get_engine(DB_PATH)
         IAMBase.metadata.create_all(engine, checkfirst=True)
 
+    def register_search(self, indexed_attributes: Dict[str, List[str]]):
+        """index the attributes of the IAM records in the configured IndexedSearch, the
+        records stored in the database are indexed when the search is registered and the
+        index is kept up to date by the records saved and removed by this controller
+
+        Args:
+            indexed_attributes (Dict[str, List[str]]): the indexed attributes by record type
+        """
+        if not ObjectFactory.get_instance("Configuration").has_section("IndexedSearch"):
+            return
+        search = ObjectFactory.get_instance("IndexedSearch")
+        for record_type, attributes in indexed_attributes.items():
+            search.add_indexed_type(record_type, attributes)
+        search.register(ObjectFactory.get_instance("PersistenceFacade"))
+        # the tables are created so that the records of previous runs can be indexed
+        self.intialize_db()
+        for mapper in IAMBase.registry.mappers:
+            if mapper.class_.__name__ in indexed_attributes:
+                for record in self.ses.query(mapper.class_):
+                    search.add_to_index(record)
+
+    def _get_search(self, record_type: type):
+        """get the configured IndexedSearch if it indexes the records of the given type
+
+        Args:
+            record_type (type): the class of the records
+
+        Returns:
+            IndexedSearch: the search or None if the records are not indexed
+        """
+        if not ObjectFactory.get_instance("Configuration").has_section("IndexedSearch"):
+            return None
+        search = ObjectFactory.get_instance("IndexedSearch")
+        if record_type.__name__ not in search.indexed_attributes:
+            return None
+        return search
+
+    def _record_saved(self, record):
+        """notify the persistence facade of a committed record"""
+        ObjectFactory.get_instance("PersistenceFacade").object_saved(record)
+
+    def _record_deleted(self, uid: str):
+        """notify the persistence facade of the committed deletion of a record"""
+        ObjectFactory.get_instance("PersistenceFacade").object_deleted(uid)
+
     def save_user(self, user: User, *args, **kwargs):
         """this function is responsible for creating a user in the IAM
         system. The user is created with a default group and a default
@@ -97,6 +135,7 @@ class IAMPersistenceController(Controller):
             raise TypeError("'user' must be an instance of NetworkClient")
         self.ses.add(user)
         self.ses.commit()
+        self._record_saved(user)
 
     def remove_user(self, user: User, *args, **kwargs):
         """this function is responsible for removing a user from the IAM
@@ -107,8 +146,10 @@ class IAMPersistenceController(Controller):
         """
         if not isinstance(user, User):
             raise TypeError("'user' must be an instance of NetworkClient")
+        uid = user.uid
         self.ses.delete(user)
         self.ses.commit()
+        self._record_deleted(uid)
 
     def get_user(self, user_id: str, *args, **kwargs) -> User:
         """this function is responsible for getting a user from the IAM
@@ -136,7 +177,14 @@ class IAMPersistenceController(Controller):
         """
         if not isinstance(cn, str):
             raise TypeError("'user_name' must be an instance of str")
-        return self.ses.query(User).filter(User.CN == cn)
+        search = self._get_search(User)
+        if search is None:
+            return self.ses.query(User).filter(User.CN == cn).all()
+        # the users are looked up by their primary key rather than scanning the table
+        uids = search.find_term("CN", cn)
+        if not uids:
+            return []
+        return self.ses.query(User).filter(User.uid.in_(uids)).all()
 
     def get_all_users(self, *args, **kwargs) -> list[User]:
         """this function is responsible for getting all users from the IAM
@@ -164,10 +212,12 @@ class IAMPersistenceController(Controller):
         """
         if not isinstance(session, DBSession):
             raise TypeError("'session' must be an instance of Session")
+        uid = session.uid
         for ses_con in session.session_contacts:
             self.ses.delete(ses_con)
         self.ses.delete(session)
         self.ses.commit()
+        self._record_deleted(uid)
 
     def save_session(self, session: DBSession, user: User, *args, **kwargs):
         """this function is responsible for saving a session in the IAM
@@ -184,6 +234,7 @@ class IAMPersistenceController(Controller):
         ses_con = SessionContact(uid=str(uuid.uuid4()), session=session, user=user)
         self.ses.add(ses_con)
         self.ses.commit()
+        self._record_saved(session)
 
     def get_all_sessions(self, *args, **kwargs) -> list[DBSession]:
         """this function is responsible for getting all sessions from the IAM
@@ -471,6 +522,7 @@ class IAMPersistenceController(Controller):
             raise TypeError("'permissions' must be an instance of Permissions")
         self.ses.add(permission)
         self.ses.commit()
+        self._record_saved(permission)
 
     def create_group(self, group: SystemGroup, *args, **kwargs):
         """this function is responsible for creating a group in the IAM
@@ -483,6 +535,7 @@ class IAMPersistenceController(Controller):
             raise TypeError("'group' must be an instance of SystemUserGroups")
         self.ses.add(group)
         self.ses.commit()
+        self._record_saved(group)
 
     def get_group_by_name(self, group_name: str, *args, **kwargs) -> SystemGroup:
         """this function is responsible for getting a group from the IAM
@@ -524,6 +577,7 @@ class IAMPersistenceController(Controller):
             )
         self.ses.add(group_permission)
         self.ses.commit()
+        self._record_saved(group_permission)
 
     def get_all_system_users(self, *args, **kwargs) -> list[SystemUser]:
         """this function is responsible for getting all system users from the IAM
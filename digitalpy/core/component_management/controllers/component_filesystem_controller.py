@@ -24,6 +24,8 @@ from digitalpy.core.component_management.domain.builder.error_builder import \
 from digitalpy.core.component_management.domain.model.component import \
     Component
 from digitalpy.core.main.controller import Controller
+from digitalpy.core.persistence.impl.engine_registry import EngineRegistry
+from digitalpy.core.parsing.load_configuration import LoadConfiguration
 
 from .component_management_persistence_controller_impl import \
     Component_managementPersistenceControllerImpl
@@ -104,6 +106,8 @@ class ComponentFilesystemController(Controller):
             zip_ref.extractall(
                 self._get_component_path(component),
             )
+        # the extracted files keep the modification time of the archive
+        LoadConfiguration.invalidate(self._get_component_path(component))
 
         # move the blueprint to the blueprint directory
         os.rename(
@@ -142,6 +146,9 @@ class ComponentFilesystemController(Controller):
         Args:
             component (Component): the component to delete
         """
+        # close the connections to the databases of the component before deleting them
+        EngineRegistry.dispose_engines(self._get_component_path(component))
+        LoadConfiguration.invalidate(self._get_component_path(component))
         shutil.rmtree(self._get_component_path(component))
 
         # remove the blueprint from the blueprint directory
@@ -1,7 +1,5 @@
 from typing import TYPE_CHECKING, List, Union
-from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import NullPool
 
 # import tables in initialization order
 from digitalpy.core.component_management.persistence.component import (
@@ -18,6 +16,7 @@ from digitalpy.core.component_management.domain.model.actionkey import ActionKey
 from digitalpy.core.component_management.domain.model.error import Error
 
 from digitalpy.core.main.controller import Controller
+from digitalpy.core.persistence.impl.engine_registry import EngineRegistry
 from digitalpy.core.component_management.persistence.component_management_base import (
     Component_managementBase,
 )
@@ -53,14 +52,13 @@ class Component_managementPersistenceController(Controller):
         Returns:
             Session: the session connecting the db
         """
-        # use NullPool to prevent connections from remaning open, this allows
-        # us to delete the component and it's database at runtime (component management)
-        engine = create_engine(DB_PATH, poolclass=NullPool)
+        # the engine is shared by all controllers of the process and the tables are
+        # created once when it is created, its connections are closed by the
+        # EngineRegistry when the component and it's database are deleted
+        engine = EngineRegistry.get_engine(DB_PATH, Component_managementBase.metadata)
         # create a configured "Session" class
         SessionClass = sessionmaker(bind=engine, expire_on_commit=False)
 
-        Component_managementBase.metadata.create_all(engine)
-
         # create a Session
         return SessionClass
 
@@ -121,6 +121,14 @@ class DefaultFacade(Controller):
         super().initialize(request, response)
         self.request.set_sender(self.__class__.__name__)
 
+    def reset(self):
+        """release the request scoped state of the facade and of its sub-controllers, which
+        are bound to the request and response by the initialize method of the facade"""
+        super().reset()
+        for value in self.__dict__.values():
+            if isinstance(value, Controller) and value is not self:
+                value.reset()
+
     def execute(self, method=None) -> None:
         self.request.set_value("logger", self.logger)
         self.request.set_value("config_loader", self.config_loader)
@@ -6,9 +6,6 @@ from digitalpy.core.main.singleton_configuration_factory import (
 )
 from digitalpy.core.zmanager.controller_message import ControllerMessage
 from digitalpy.core.digipy_configuration.domain.model.actionkey import ActionKey
-from digitalpy.core.digipy_configuration.configuration.digipy_configuration_constants import (
-    ACTION_MAPPING_SECTION,
-)
 from digitalpy.core.zmanager.configuration.zmanager_constants import (
     ZMANAGER_MESSAGE_DELIMITER as DEL,
     DEFAULT_ENCODING,
@@ -38,30 +35,12 @@ class ActionKeyController:
         Raises:
             ValueError: If no action key is found
         """
-        action_mapping: dict[str, ActionKey] = (
-            SingletonConfigurationFactory.get_configuration_object(
-                ACTION_MAPPING_SECTION
-            )
+        resolved = SingletonConfigurationFactory.resolve_action_key(
+            action_key.source, action_key.context, action_key.action
         )
-        match (action_key.source, action_key.context, action_key.action):
-            case (s, c, a) if (s and c and a) and f"{s}?{c}?{a}" in action_mapping:
-                key = f"{s}?{c}?{a}"
-            case (s, c, a) if (s and a) and f"{s}??{a}" in action_mapping:
-                key = f"{s}??{a}"
-            case (s, c, a) if (c and a) and f"?{c}?{a}" in action_mapping:
-                key = f"?{c}?{a}"
-            case (s, c, a) if (s and c) and f"{s}?{c}?" in action_mapping:
-                key = f"{s}?{c}?"
-            case (s, c, a) if s and f"{s}??" in action_mapping:
-                key = f"{s}??"
-            case (s, c, a) if a and f"??{a}" in action_mapping:
-                key = f"??{a}"
-            case (s, c, a) if c and f"?{c}?" in action_mapping:
-                key = f"?{c}?"
-            case (_, _, _):
-                raise ValueError("No action key found for " + str(action_key))
-
-        return action_mapping[key]
+        if resolved is None:
+            raise ValueError("No action key found for " + str(action_key))
+        return resolved
 
     def build_from_controller_message(
         self, controller_message: ControllerMessage
@@ -2,7 +2,7 @@
 """
 
 import re
-from typing import Optional
+from typing import Iterable, Optional
 
 from digitalpy.core.digipy_configuration.domain.model.actionkey import ActionKey
 from digitalpy.core.zmanager.controller_message import ControllerMessage
@@ -31,9 +31,12 @@ class ActionFlowController:
 
     def create_action_flow(self, file: File):
         """This operation parses the flow at the specified file and saves
-        the result to the CofigurationFactory.
+        the result to the CofigurationFactory. Flows are only saved once all
+        of their actions are parsed so that the flow tables of the
+        ConfigurationFactory are built from the complete flow.
         """
         new_flow: ActionFlow
+        new_flows: list[ActionFlow] = []
         for line in file.contents.splitlines():
             line_str = line.decode(DEFAULT_ENCODING)
             if line_str == "":
@@ -41,7 +44,7 @@ class ActionFlowController:
             elif re.match(r"^\[(.*)\]", line_str):
                 new_flow = ActionFlow(None, None)
                 new_flow.config_id = line_str[1:-1]
-                SingletonConfigurationFactory.add_action_flow(new_flow)
+                new_flows.append(new_flow)
 
             elif re.match(r"^[\w^\-_]*\?[\w^\-_]*(@[\w^\-_]+)?\?[\w^\-_]*", line_str):
                 new_action = self.serializer_action_key.deserialize_from_ini(line_str)
@@ -51,6 +54,9 @@ class ActionFlowController:
             else:
                 pass
 
+        for flow in new_flows:
+            SingletonConfigurationFactory.add_action_flow(flow)
+
     def get_all_flow_actions(self, action: ActionKey) -> list[ActionKey]:
         """This method will return all the actions in any flow which matches the given action key.
         for example, imagine the following flows:
@@ -65,13 +71,13 @@ class ActionFlowController:
         if the action key submitted contains only action 1, the method will return the first actionkeys
         of both flows as they both match the action key queried.
         """
-        flows = SingletonConfigurationFactory.get_action_flows()
-        actions = []
-        for flow in flows:
-            for f_action in flow.actions:
-                if f_action == action:
-                    actions.append(f_action)
-        return actions
+        return list(SingletonConfigurationFactory.get_all_flow_actions(action))
+
+    def get_flow_actions_matching(self, actions: Iterable[ActionKey]) -> list[ActionKey]:
+        """This method will return all the actions in any flow which matches one of the given
+        action keys, the flows are only searched once for all action keys.
+        """
+        return list(SingletonConfigurationFactory.get_flow_actions_matching(actions))
 
     def get_next_message_action(
         self, controller_message: ControllerMessage
@@ -85,18 +91,7 @@ class ActionFlowController:
         """This method will return the next action of the flow in which the given action key is part of.
         If the current Action is the final one, a None value will be returned
         """
-        flow = SingletonConfigurationFactory.get_action_flow(action.config)
-        if flow is None:
-            return None
-        i = 0
-        for f_action in flow.actions:
-            if f_action == action:
-                break
-            i += 1
-        if len(flow.actions) > i + 1:
-            return flow.actions[i + 1]
-        else:
-            return None
+        return SingletonConfigurationFactory.get_next_flow_action(action)
 
     def is_end_of_flow(self, action: ActionKey) -> bool:
         """This method will return True if the given action is the final one in the flow.
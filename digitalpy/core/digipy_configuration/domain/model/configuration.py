@@ -19,6 +19,10 @@ class Configuration(ABC):
     to have very flexible application configurations for different scenarios,
     users and roles."""
 
+    # incremented on every change of the configuration so that anything derived from
+    # it can be invalidated
+    revision: int = 0
+
     @abstractmethod
     def get_configurations(self) -> list:
         """Get a list of available configurations."""
@@ -86,7 +86,7 @@ class InifileConfiguration(Configuration):
 
     def _config_changed(self):
         """Notify configuration change listeners"""
-        raise NotImplementedError("this method has not yet been implemented")
+        self.revision += 1
 
     def _process_file(
         self,
@@ -237,6 +237,7 @@ class InifileConfiguration(Configuration):
                 raise ValueError(
                     f"section: {section} is invalid with error: {str(ex)}"
                 ) from ex
+        self._config_changed()
 
     def has_value(self, key, section):
         return self._lookup(section, key) is not None
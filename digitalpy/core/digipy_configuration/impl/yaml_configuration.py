@@ -96,6 +96,11 @@ class YamlConfiguration(Configuration):
                 raise ValueError(
                     f"section: {section} is invalid with error: {str(ex)}"
                 ) from ex
+        self._config_changed()
+
+    def _config_changed(self):
+        """Notify configuration change listeners"""
+        self.revision += 1
 
     def get_sections(self) -> list[str]:
         """Get all section names."""
@@ -141,14 +146,17 @@ class YamlConfiguration(Configuration):
     def set_value(self, key: str, value: Any, section: str):
         """Set a configuration value."""
         self.config_array[section][key] = value
+        self._config_changed()
 
     def remove_section(self, section: str):
         """Remove a section."""
         self.config_array.pop(section)
+        self._config_changed()
 
     def remove_key(self, key: str, section: str):
         """Remove a key from a section."""
         self.config_array[section].pop(key)
+        self._config_changed()
 
     def remove_configuration(self, name: str):
         """Remove a configuration and all of its sections and keys from the configuration.
@@ -22,6 +22,9 @@ class Domain(DefaultFacade):
     for handling all public routing and forwards all requests to the internal routing
     """
 
+    # the facade and its controllers keep no state between actions
+    pooled = True
+
     def __init__(
         self,
         sync_action_mapper,
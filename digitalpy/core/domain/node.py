@@ -1,7 +1,7 @@
 from functools import lru_cache
 import uuid
 import re
-from typing import Dict, Any, Union
+from typing import Callable, Dict, Any, Union
 from digitalpy.core.persistence.impl.default_persistent_object import DefaultPersistentObject
 from digitalpy.core.parsing.load_configuration import ModelConfiguration
 from digitalpy.core.domain.object_id import ObjectId
@@ -13,6 +13,19 @@ from digitalpy.core.main.object_factory import ObjectFactory
 UNLIMITED_OCCURANCES = "*"
 
 
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    return re.compile(pattern, re.MULTILINE)
+
+
+def _pattern_predicate(pattern: re.Pattern) -> Callable[[Any], bool]:
+    return lambda value: value is not None and pattern.search(str(value)) is not None
+
+
+def _equality_predicate(expected: Any) -> Callable[[Any], bool]:
+    return lambda value: value == expected
+
+
 class Node(DefaultPersistentObject):
     """Node adds the concept of relations to PersistentObject. It is the basic
     component for building object trees (although a Node can have more than one
@@ -56,6 +69,11 @@ class Node(DefaultPersistentObject):
             model_configuration = ModelConfiguration()
         self._model_configuration = model_configuration
         self._children: Dict[str, Node] = {}
+        # secondary indexes over the children by type and by relationship role, kept in
+        # sync with the children by add_child and delete_child
+        self._children_by_type: Dict[str, Dict[str, Node]] = {}
+        self._children_by_role: Dict[str, Dict[str, Node]] = {}
+        self._child_roles: Dict[str, str] = {}
         self._parents: Dict[str, Node] = {}
         self._depth = -1
         self._path = ""
@@ -157,25 +175,36 @@ class Node(DefaultPersistentObject):
         properties=None,
         use_regex=True,
     ):
-        """Get the children that match given conditions."""
-        if role is not None:
-            child_roles = self.get_possible_children()
-            if child_roles[role]:
-                raise Exception("No child role defined with name %s" % role)
-            nodes = super().get_value(role)
-            if not isinstance(nodes, list):
-                nodes = [nodes]
-            children = []
-            for cur_node in nodes:
-                if isinstance(cur_node, PersistentObject):
-                    children = cur_node
-            return self.filter(
-                children, oid, children_type, values, properties, use_regex
-            )
+        """Get the children that match given conditions. The children are looked up by the
+        most selective of the oid, the relationship role and the children type before the
+        remaining conditions are applied.
+
+        Args:
+            oid (Union[str, ObjectId], optional): the oid of the child. Defaults to None.
+            role (str, optional): the name of the relationship of the child. Defaults to None.
+            children_type (str, optional): the type of the children. Defaults to None.
+            values (dict, optional): the conditions on the values of the children, see filter. Defaults to None.
+            properties (dict, optional): the conditions on the properties of the children, see filter. Defaults to None.
+            use_regex (bool, optional): whether string conditions are regular expressions. Defaults to True.
+        """
+        if oid is not None:
+            child = self._children.get(str(oid))
+            candidates = {child.oid: child} if child is not None else {}
+        elif role is not None:
+            candidates = self._children_by_role.get(role, {})
+        elif children_type is not None:
+            candidates = self._children_by_type.get(children_type, {})
         else:
-            return self.filter(
-                self.get_children(), oid, children_type, values, properties, use_regex
-            )
+            candidates = self._children
+
+        if role is not None:
+            role_children = self._children_by_role.get(role, {})
+            candidates = {
+                key: child for key, child in candidates.items() if key in role_children
+            }
+        return self.filter(
+            candidates, oid, children_type, values, properties, use_regex
+        )
 
     def get_possible_children(self):
         result = []
@@ -185,22 +214,59 @@ class Node(DefaultPersistentObject):
         return result
 
     def get_num_children(self, children_type=None):
-        count = 0
         if children_type:
-            for child in self._children.values():
-                if child.get_type() == children_type:
-                    count += 1
-            return count
+            return len(self._children_by_type.get(children_type, {}))
         else:
             return len(self._children)
 
-    def add_child(self, child: 'Node'):
+    def add_child(self, child: 'Node', role: str = None):
+        """add a child to the node
+
+        Args:
+            child (Node): the child to be added
+            role (str, optional): the name of the relationship of the child, defaults to
+                the only relationship targeting the type of the child if there is one.
+        """
         if self.validate_child_addition(child):
-            self._children[child.oid] = child
+            oid = child.oid
+            if oid in self._children:
+                self._unindex_child(oid)
+            self._children[oid] = child
+            self._index_child(oid, child, role)
             child.set_parent(self)
         else:
             raise TypeError("child must be an instance of Node")
 
+    def _index_child(self, oid: str, child: 'Node', role: Union[str, None]):
+        self._children_by_type.setdefault(child.get_type(), {})[oid] = child
+        if role is None:
+            role = self._get_child_role(child.get_type())
+        if role is not None:
+            self._children_by_role.setdefault(role, {})[oid] = child
+            self._child_roles[oid] = role
+
+    def _unindex_child(self, oid: str):
+        child = self._children[oid]
+        children = self._children_by_type.get(child.get_type())
+        if children is not None:
+            children.pop(oid, None)
+        role = self._child_roles.pop(oid, None)
+        if role is not None:
+            self._children_by_role[role].pop(oid, None)
+
+    def _get_child_role(self, child_type: str) -> Union[str, None]:
+        """get the name of the only relationship targeting the given type"""
+        if self._relationship_definition is None:
+            return None
+        roles = [
+            name
+            for name, relationship in self._relationship_definition.relationships.items()
+            if relationship.target_class == child_type
+        ]
+        if len(roles) == 1:
+            return roles[0]
+        return None
+
     def validate_child_addition(self, child):
         if isinstance(child, Node):
             child_type = child.get_type()
@@ -208,7 +274,7 @@ class Node(DefaultPersistentObject):
                 relationship_requirements = self._relationship_definition.relationships[
                     child_type
                 ]
-                children = self.get_children_ex(children_type=child_type)
+                children = self._children_by_type.get(child_type, {})
                 if relationship_requirements.max_occurs != UNLIMITED_OCCURANCES and relationship_requirements.max_occurs < len(children):
                     raise ValueError(
                         "Maximum number of related objects exceeded")
@@ -217,6 +283,8 @@ class Node(DefaultPersistentObject):
             raise TypeError("children must inherit from type Node")
 
     def delete_child(self, child_id):
+        child_id = str(child_id)
+        self._unindex_child(child_id)
         del self._children[child_id]
 
     def validate_child_removal(self, child):
@@ -238,41 +306,72 @@ class Node(DefaultPersistentObject):
         else:
             self._parents[parent.get_id()] = parent
 
+    @staticmethod
+    def compile_predicates(
+        conditions: Dict[str, Any], use_regex: bool = True
+    ) -> Dict[str, Callable[[Any], bool]]:
+        """compile the conditions of a filter to predicates, the compiled predicates can be
+        passed to filter and get_children_ex in place of the conditions to reuse them
+
+        Args:
+            conditions (Dict[str, Any]): the conditions by attribute name, a condition is
+                either a predicate called with the attribute value, a compiled regular
+                expression searched in the attribute value, a string which is a regular
+                expression if use_regex is true or a value the attribute must be equal to.
+            use_regex (bool, optional): whether string conditions are regular expressions. Defaults to True.
+
+        Returns:
+            Dict[str, Callable[[Any], bool]]: the predicates by attribute name
+        """
+        predicates = {}
+        for name, condition in conditions.items():
+            if isinstance(condition, str) and use_regex:
+                condition = _compile_pattern(condition)
+            if isinstance(condition, re.Pattern):
+                predicates[name] = _pattern_predicate(condition)
+            elif callable(condition):
+                predicates[name] = condition
+            else:
+                predicates[name] = _equality_predicate(condition)
+        return predicates
+
     def filter(self, node_list, oid, node_type, values, properties, use_regex):
-        """Get Nodes that match given conditions from a list."""
+        """Get Nodes that match given conditions from a dictionary of nodes by oid."""
+        if oid is not None:
+            oid = str(oid)
+        property_predicates = (
+            self.compile_predicates(properties, use_regex)
+            if isinstance(properties, dict)
+            else {}
+        )
+        value_predicates = (
+            self.compile_predicates(values, use_regex)
+            if isinstance(values, dict)
+            else {}
+        )
         return_array = []
-        for key, node in node_list.items():
-            if isinstance(node, PersistentObject):
-                match = True
-                # check id
-                if oid != None and node.get_oid() != oid:
-                    match = False
-                # check type
-                if node_type != None and node.get_type() != node_type:
-                    match = False
-                # check properties
-                if properties != None and isinstance(properties, dict):
-                    for key, value in properties.items():
-                        node_property = node.get_property(key)
-                        if use_regex and not re.match(
-                            "/" + value + "/m", node_property
-                        ):
-                            match = False
-                            break
-
-                        elif not hasattr(node, key) and not use_regex:
-                            match = False
-                            break
-
-                # check values
-                if values != None and isinstance(values, dict):
-                    for key, value in properties.items():
-                        node_value = self.get_value(key)
-                        if use_regex and not re.match("/" + value + "/m", node_value):
-                            match = False
-                            break
-                if match:
-                    return_array.append(node)
+        for node in node_list.values():
+            if not isinstance(node, PersistentObject):
+                continue
+            # check id
+            if oid is not None and str(node.get_oid()) != oid:
+                continue
+            # check type
+            if node_type is not None and node.get_type() != node_type:
+                continue
+            # check properties
+            if not all(
+                predicate(getattr(node, name, None))
+                for name, predicate in property_predicates.items()
+            ):
+                continue
+            # check values
+            if not all(
+                predicate(node.get_value(name))
+                for name, predicate in value_predicates.items()
+            ):
+                continue
+            return_array.append(node)
         return return_array
 
     def get_next_sibling(self):
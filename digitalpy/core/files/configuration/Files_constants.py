@@ -31,3 +31,6 @@ DB_PATH = "sqlite:///" + str(CURRENT_COMPONENT_PATH / "persistence/Files.db")
 FOLDER = "Folder"
 FILE = "File"
 ERROR = "Error"
+
+# the attributes of the objects indexed by the IndexedSearch by object type
+INDEXED_ATTRIBUTES = {FOLDER: ["name", "path"], FILE: ["name", "path"]}
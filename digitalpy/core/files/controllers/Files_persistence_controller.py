@@ -1,7 +1,5 @@
-from typing import TYPE_CHECKING, List, Union
-from sqlalchemy import create_engine
+from typing import TYPE_CHECKING, Dict, List, Union
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import NullPool
 
 # import tables in initialization order
 from digitalpy.core.files.persistence.folder import Folder as DBFolder
@@ -14,6 +12,8 @@ from digitalpy.core.files.domain.model.file import File
 from digitalpy.core.files.domain.model.error import Error
 
 from digitalpy.core.main.controller import Controller
+from digitalpy.core.main.object_factory import ObjectFactory
+from digitalpy.core.persistence.impl.engine_registry import EngineRegistry
 from digitalpy.core.files.persistence.Files_base import FilesBase
 from digitalpy.core.files.configuration.Files_constants import DB_PATH
 
@@ -45,17 +45,45 @@ class FilesPersistenceController(Controller):
         Returns:
             Session: the session connecting the db
         """
-        # use NullPool to prevent connections from remaning open, this allows
-        # us to delete the component and it's database at runtime (component management)
-        engine = create_engine(DB_PATH, poolclass=NullPool)
+        # the engine is shared by all controllers of the process and the tables are
+        # created once when it is created, its connections are closed by the
+        # EngineRegistry when the component and it's database are deleted
+        engine = EngineRegistry.get_engine(DB_PATH, FilesBase.metadata)
         # create a configured "Session" class
         SessionClass = sessionmaker(bind=engine, expire_on_commit=False)
 
-        FilesBase.metadata.create_all(engine)
-
         # create a Session
         return SessionClass
 
+    def register_search(self, indexed_attributes: Dict[str, List[str]]):
+        """index the attributes of the Files objects in the configured IndexedSearch, the
+        records stored in the database are indexed when the search is registered and the
+        index is kept up to date by the objects saved and removed by this controller
+
+        Args:
+            indexed_attributes (Dict[str, List[str]]): the indexed attributes by object type
+        """
+        if not ObjectFactory.get_instance("Configuration").has_section("IndexedSearch"):
+            return
+        search = ObjectFactory.get_instance("IndexedSearch")
+        for object_type, attributes in indexed_attributes.items():
+            search.add_indexed_type(object_type, attributes)
+        search.register(ObjectFactory.get_instance("PersistenceFacade"))
+        # the records are indexed under the type and oid of the domain objects they store
+        with self.ses.begin() as session:
+            for mapper in FilesBase.registry.mappers:
+                if mapper.class_.__name__ in indexed_attributes:
+                    for record in session.query(mapper.class_):
+                        search.add_to_index(record)
+
+    def _object_saved(self, obj):
+        """notify the persistence facade of a committed object"""
+        ObjectFactory.get_instance("PersistenceFacade").object_saved(obj)
+
+    def _object_deleted(self, obj):
+        """notify the persistence facade of the committed deletion of an object"""
+        ObjectFactory.get_instance("PersistenceFacade").object_deleted(obj.get_oid())
+
     # Begin methods for folder table
 
 
@@ -71,7 +99,8 @@ class FilesPersistenceController(Controller):
             db_folder.name = folder.name
             session.add(db_folder)
             session.commit()
-            return db_folder
+        self._object_saved(folder)
+        return db_folder
 
 
     def remove_folder(self, folder: Folder, *args, **kwargs):
@@ -81,6 +110,7 @@ class FilesPersistenceController(Controller):
             folder_db = self.get_folder(oid=folder.oid)[0]
             session.delete(folder_db)
             session.commit()
+        self._object_deleted(folder)
 
     def get_folder(self, path:Union['str', None] = None, size:Union['float', None] = None, permissions:Union['str', None] = None, name:Union['str', None] = None, oid: 'str' = None, *args, **kwargs) -> List[DBFolder]:
         with self.ses.begin() as session:
@@ -114,6 +144,7 @@ class FilesPersistenceController(Controller):
             folder_db.permissions = folder.permissions
             folder_db.name = folder.name
             session.commit()
+        self._object_saved(folder)
 
     # Begin methods for folder table
 
@@ -132,7 +163,8 @@ class FilesPersistenceController(Controller):
             db_file.name = file.name
             session.add(db_file)
             session.commit()
-            return db_file
+        self._object_saved(file)
+        return db_file
 
 
     def remove_file(self, file: File, *args, **kwargs):
@@ -142,6 +174,7 @@ class FilesPersistenceController(Controller):
             file_db = self.get_file(oid=file.oid)[0]
             session.delete(file_db)
             session.commit()
+        self._object_deleted(file)
 
     def get_file(self, path:Union['str', None] = None, permissions:Union['str', None] = None, size:Union['float', None] = None, name:Union['str', None] = None, oid: 'str' = None, *args, **kwargs) -> List[DBFile]:
         with self.ses.begin() as session:
@@ -175,6 +208,7 @@ class FilesPersistenceController(Controller):
             file_db.size = file.size
             file_db.name = file.name
             session.commit()
+        self._object_saved(file)
 
     # Begin methods for file table
 
@@ -190,7 +224,8 @@ class FilesPersistenceController(Controller):
             db_error.name = error.name
             session.add(db_error)
             session.commit()
-            return db_error
+        self._object_saved(error)
+        return db_error
 
 
     def remove_error(self, error: Error, *args, **kwargs):
@@ -200,6 +235,7 @@ class FilesPersistenceController(Controller):
             error_db = self.get_error(oid=error.oid)[0]
             session.delete(error_db)
             session.commit()
+        self._object_deleted(error)
 
     def get_error(self, name:Union['str', None] = None, oid: 'str' = None, *args, **kwargs) -> List[DBError]:
         with self.ses.begin() as session:
@@ -224,6 +260,7 @@ class FilesPersistenceController(Controller):
             error_db = self.get_error(oid = error.oid)[0]
             error_db.name = error.name
             session.commit()
+        self._object_saved(error)
 
     # Begin methods for error table
 
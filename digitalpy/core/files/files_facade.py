@@ -12,6 +12,7 @@ from digitalpy.core.zmanager.response import Response
 from . import base
 from .configuration.Files_constants import (ACTION_MAPPING_PATH,
                                             CONFIGURATION_PATH_TEMPLATE,
+                                            INDEXED_ATTRIBUTES,
                                             INTERNAL_ACTION_MAPPING_PATH,
                                             LOG_FILE_PATH,
                                             LOGGING_CONFIGURATION_PATH,
@@ -24,6 +25,9 @@ class Files(DefaultFacade):
     """
     """
 
+    # the facade and its controllers keep no state between actions
+    pooled = True
+
     def __init__(self, sync_action_mapper: DefaultActionMapper, request: Request,
                  response: Response, configuration,
                  action_mapper: AsyncActionMapper = None,  # type: ignore
@@ -56,6 +60,7 @@ class Files(DefaultFacade):
         )
         self.persistence_controller = FilesPersistenceController(
             request, response, sync_action_mapper, configuration)
+        self.persistence_controller.register_search(INDEXED_ATTRIBUTES)
         self.Files_controller = FilesControllerImpl(
             request, response, sync_action_mapper, configuration)
 
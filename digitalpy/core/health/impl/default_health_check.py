@@ -1,8 +1,8 @@
 import logging
-import re
-from typing import Dict
 
 from digitalpy.core.digipy_configuration.domain.model.configuration import Configuration
+from digitalpy.core.health.impl.log_health_evaluator import LogHealthEvaluator
+from digitalpy.core.main.impl.default_file_logger import DefaultFileLogger
 from digitalpy.core.zmanager.action_mapper import ActionMapper
 from digitalpy.core.main.controller import Controller
 from digitalpy.core.zmanager.request import Request
@@ -31,28 +31,29 @@ class DefaultHealthCheckController(Controller):
             self.response.set_value("error", str(e))
 
     def get_health(self, logger: logging.Logger, **kwargs) -> None:
-        """Check the component's health by searching for critical errors in the log file
+        """Check the component's health by searching for critical errors in the log file,
+        only the lines appended to the log file since the last health check are read
 
         Args:
             logger: logger for the component
 
         Returns:
-            None: the health and error are set on the response object
+            None: the health, the error and the errors and warnings of the recent window
+                are set on the response object
         """
-        healthy = True
-        error = ""
-
-        # read the log file in chunks and search for critical errors
-        chunk_size = 4096  # read the log file in 4KB chunks
-        with open(logger.parent.handlers[0].baseFilename, "r") as f:
-            while True:
-                chunk = f.read(chunk_size)
-                if not chunk:  # end of file reached
-                    break
-                if re.search(".* CRITICAL .*", chunk):
-                    healthy = False
-                    error = chunk
-                    break
-
-        self.response.set_value("health", healthy)
-        self.response.set_value("error", error)
+        evaluator = LogHealthEvaluator.get_evaluator(self._get_log_file(logger))
+        for key, value in evaluator.evaluate().items():
+            self.response.set_value(key, value)
+
+    @staticmethod
+    def _get_log_file(logger: logging.Logger) -> str:
+        """get the file written by the logger or the first of its ancestors writing one"""
+        current = logger
+        while current is not None:
+            log_files = DefaultFileLogger.get_files_of(current)
+            if log_files:
+                return log_files[0]
+            if not current.propagate:
+                break
+            current = current.parent
+        raise ValueError(f"logger {logger.name} doesn't write a log file")
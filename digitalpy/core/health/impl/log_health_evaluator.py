@@ -0,0 +1,192 @@
+"""This module contains the LogHealthEvaluator which incrementally tails a log file to
+evaluate the health of a component."""
+
+import os
+import re
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+# the levels of the lines counted by the evaluator, the log files are written
+# with the format "%(asctime)s %(name)-12s %(levelname)-8s %(message)s"
+LEVEL_PATTERN = re.compile(rb" (CRITICAL|ERROR|WARNING) ")
+
+CRITICAL = b"CRITICAL"
+WARNING = b"WARNING"
+
+
+class LogHealthEvaluator:
+    """LogHealthEvaluator evaluates the health of a component from its log file. Only
+    the bytes appended to the log since the last evaluation are scanned, so the cost of
+    an evaluation does not grow with the size of the log. The evaluator remembers the
+    offset and the inode of the log and detects when the log is rotated or truncated.
+
+    The component is unhealthy if the current log file contains a critical line, in
+    addition the errors and warnings are counted in a rolling window in memory.
+
+    The evaluators are shared by all health checks of a process, get_evaluator returns
+    the evaluator of a log file.
+    """
+
+    # the evaluators by the path of their log file, shared by all health checks of the process
+    evaluators: Dict[str, "LogHealthEvaluator"] = {}
+    _evaluators_lock = threading.Lock()
+
+    def __init__(
+        self,
+        path: str,
+        window: float = 300,
+        bucket_size: float = 10,
+        chunk_size: int = 65536,
+    ):
+        """
+        Args:
+            path (str): the path of the log file
+            window (float, optional): the seconds over which errors and warnings are
+                counted. Defaults to 300.
+            bucket_size (float, optional): the seconds counted by every bucket of the
+                window. Defaults to 10.
+            chunk_size (int, optional): the number of bytes read at once. Defaults to 65536.
+        """
+        self.path = path
+        self.window = window
+        self.bucket_size = bucket_size
+        self.chunk_size = chunk_size
+        self.offset = 0
+        # the device and inode of the log file, None until the log file was opened
+        self.file_id: Optional[tuple[int, int]] = None
+        # the start of the last line which was not completely written yet
+        self.partial_line = b""
+        # the first critical line of the current log file
+        self.critical_line: Optional[str] = None
+        # the error and warning counts by the start time of their bucket
+        self.buckets: deque[list] = deque()
+        self._fd: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_evaluator(cls, path: str, **kwargs) -> "LogHealthEvaluator":
+        """get the evaluator of the log file, the evaluator is created with the keyword
+        arguments if the log file has no evaluator yet
+
+        Args:
+            path (str): the path of the log file
+
+        Returns:
+            LogHealthEvaluator: the evaluator of the log file
+        """
+        path = os.path.abspath(path)
+        evaluator = cls.evaluators.get(path)
+        if evaluator is not None:
+            return evaluator
+        with cls._evaluators_lock:
+            evaluator = cls.evaluators.get(path)
+            if evaluator is None:
+                evaluator = cls(path, **kwargs)
+                cls.evaluators = {**cls.evaluators, path: evaluator}
+            return evaluator
+
+    @classmethod
+    def clear(cls):
+        """close and discard all evaluators of the process"""
+        with cls._evaluators_lock:
+            evaluators, cls.evaluators = cls.evaluators, {}
+        for evaluator in evaluators.values():
+            evaluator.close()
+
+    def evaluate(self, now: Optional[float] = None) -> dict:
+        """scan the lines appended to the log file since the last evaluation
+
+        Args:
+            now (float, optional): the current monotonic time. Defaults to None.
+
+        Returns:
+            dict: the health of the component, the first critical line of the log
+                and the errors and warnings in the window
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._scan(now)
+            self._expire(now)
+            errors = sum(bucket[1] for bucket in self.buckets)
+            warnings = sum(bucket[2] for bucket in self.buckets)
+            return {
+                "health": self.critical_line is None,
+                "error": self.critical_line or "",
+                "errors": errors,
+                "warnings": warnings,
+            }
+
+    def close(self):
+        with self._lock:
+            self._close_file()
+
+    def _scan(self, now: float):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            # the log is being rotated, the new file is opened once it was created
+            if self._fd is not None:
+                self._read(now)
+            return
+        file_id = (stat.st_dev, stat.st_ino)
+        if self._fd is not None and file_id != self.file_id:
+            # the log was rotated, finish reading the old file before the new one
+            self._read(now)
+            self._count([self.partial_line], now)
+            self._close_file()
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_RDONLY)
+            self.file_id = file_id
+            self._reset()
+        elif stat.st_size < self.offset:
+            # the log was truncated in place
+            self._reset()
+        self._read(now)
+
+    def _reset(self):
+        self.offset = 0
+        self.partial_line = b""
+        self.critical_line = None
+
+    def _read(self, now: float):
+        while True:
+            # pread doesn't move the offset shared with forked processes
+            chunk = os.pread(self._fd, self.chunk_size, self.offset)
+            if not chunk:
+                return
+            self.offset += len(chunk)
+            lines = (self.partial_line + chunk).split(b"\n")
+            self.partial_line = lines.pop()
+            self._count(lines, now)
+
+    def _count(self, lines: list, now: float):
+        errors = warnings = 0
+        for line in lines:
+            match = LEVEL_PATTERN.search(line)
+            if match is None:
+                continue
+            level = match.group(1)
+            if level == WARNING:
+                warnings += 1
+                continue
+            errors += 1
+            if level == CRITICAL and self.critical_line is None:
+                self.critical_line = line.decode(errors="replace")
+        if not errors and not warnings:
+            return
+        bucket_start = now - now % self.bucket_size
+        if not self.buckets or self.buckets[-1][0] != bucket_start:
+            self.buckets.append([bucket_start, 0, 0])
+        self.buckets[-1][1] += errors
+        self.buckets[-1][2] += warnings
+
+    def _expire(self, now: float):
+        while self.buckets and self.buckets[0][0] + self.bucket_size <= now - self.window:
+            self.buckets.popleft()
+
+    def _close_file(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
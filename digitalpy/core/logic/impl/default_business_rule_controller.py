@@ -4,16 +4,120 @@ from digitalpy.core.main.object_factory import ObjectFactory
 from digitalpy.core.zmanager.action_mapper import ActionMapper
 
 import rule_engine
-from typing import Dict, Callable, List, Union
+from rule_engine import ast
+from rule_engine.types import coerce_value
+from collections import Counter
+from typing import Any, Dict, Callable, List, Optional, Union
 import json
+import os
 
 from digitalpy.core.zmanager.request import Request
 from digitalpy.core.zmanager.response import Response
 
 
+# the literal expressions of which the value can be used as the key of an index
+INDEXABLE_LITERALS = (
+    ast.StringExpression,
+    ast.FloatExpression,
+    ast.BooleanExpression,
+    ast.NullExpression,
+)
+
+
+def _equality_tests(expression: ast.ExpressionBase) -> List[tuple]:
+    """get the (attribute, value) tests which must all hold for the expression to match,
+    these are the equality tests of a symbol and a literal joined by "and"
+
+    Args:
+        expression (ast.ExpressionBase): the expression of a parsed rule
+
+    Returns:
+        List[tuple]: the attributes and the values they are required to equal
+    """
+    if isinstance(expression, ast.LogicExpression) and expression.type == "and":
+        return _equality_tests(expression.left) + _equality_tests(expression.right)
+    if isinstance(expression, ast.ComparisonExpression) and expression.type == "eq":
+        for symbol, literal in (
+            (expression.left, expression.right),
+            (expression.right, expression.left),
+        ):
+            if (
+                isinstance(symbol, ast.SymbolExpression)
+                and symbol.scope is None
+                and isinstance(literal, INDEXABLE_LITERALS)
+            ):
+                return [(symbol.name, literal.value)]
+    return []
+
+
+class RuleSetIndex:
+    """an index of the sub rules of a rule set by the attribute which most of them require to
+    equal a literal. An evaluation only visits the rules requiring the value of the attribute
+    of the matchable and the rules which don't test the attribute, in their defined order.
+    """
+
+    def __init__(self, rule_dict: dict):
+        self.rule_dict = rule_dict
+        self.rules: List[str] = list(rule_dict["rules"])
+        tests = {
+            rule: dict(_equality_tests(rule_engine.Rule(rule).statement.expression))
+            for rule in self.rules
+        }
+        attributes = Counter(
+            attribute for rule_tests in tests.values() for attribute in rule_tests
+        )
+        self.attribute: Optional[str] = None
+        if attributes and attributes.most_common(1)[0][1] > 1:
+            self.attribute = attributes.most_common(1)[0][0]
+
+        self.unindexed: List[str] = []
+        self.candidates_by_value: Dict[Any, List[str]] = {}
+        if self.attribute is None:
+            return
+        for rule in self.rules:
+            if self.attribute in tests[rule]:
+                value = tests[rule][self.attribute]
+                self.candidates_by_value.setdefault(value, [])
+            else:
+                self.unindexed.append(rule)
+        for value in self.candidates_by_value:
+            self.candidates_by_value[value] = [
+                rule
+                for rule in self.rules
+                if tests[rule].get(self.attribute, value) == value
+            ]
+
+    def candidates(self, matchable: Union[dict, object], resolver: Callable) -> List[str]:
+        """get the rules which can match the matchable
+
+        Args:
+            matchable (Union[dict, object]): the object to be matched against the rules
+            resolver (Callable): the rule_engine resolver of the attributes of the matchable
+
+        Returns:
+            List[str]: the candidate rules in their defined order
+        """
+        if self.attribute is None:
+            return self.rules
+        try:
+            value = coerce_value(resolver(matchable, self.attribute))
+            return self.candidates_by_value.get(value, self.unindexed)
+        except Exception:
+            # let the rules report the unresolvable or unhashable attribute
+            return self.rules
+
+
 class DefaultBusinessRuleController(Controller):
     """this is the default base class from which all controllers which use business rules should take advantage of
     """
+
+    # the compiled rules by rule text and resolver shared by all controllers of the process
+    compiled_rules: Dict[tuple, rule_engine.Rule] = {}
+
+    # the business rules loaded by path with the modification time of their file and
+    # the indexes of their rule sets by the id of the rule set
+    loaded_business_rules: Dict[str, tuple] = {}
+
     def __init__(
         self,
         business_rules_path: Dict[str, List[Callable]],
@@ -29,7 +133,24 @@ class DefaultBusinessRuleController(Controller):
         super().__init__(**kwargs)
         self.internal_action_mapper = internal_action_mapper
         self.business_rules_path = business_rules_path
-        self.reload_business_rules(business_rules_path)
+        self.load_business_rules(business_rules_path)
+
+    def load_business_rules(self, business_rules_path: str=None):
+        """load the business rules, the rules are only read again if their file was modified
+        since they were loaded by any controller of this process
+
+        Args:
+            business_rules_path (str, optional): the path to the business rules. Defaults to None.
+        """
+        if business_rules_path is None:
+            business_rules_path = self.business_rules_path
+        loaded = DefaultBusinessRuleController.loaded_business_rules.get(
+            str(business_rules_path)
+        )
+        if loaded is None or loaded[0] != os.stat(business_rules_path).st_mtime_ns:
+            self.reload_business_rules(business_rules_path)
+        else:
+            _, self.business_rules, self.rule_set_indexes = loaded
 
     def reload_business_rules(self, business_rules_path: str=None):
         """reload the business rules
@@ -39,10 +160,58 @@ class DefaultBusinessRuleController(Controller):
         """
         if business_rules_path is None:
             business_rules_path = self.business_rules_path
+        modified = os.stat(business_rules_path).st_mtime_ns
         with open(
-            self.business_rules_path, "r", encoding="utf-8"
+            business_rules_path, "r", encoding="utf-8"
         ) as business_rules_file:
             self.business_rules = json.load(business_rules_file)
+        self.rule_set_indexes = self._index_rule_sets(self.business_rules)
+        DefaultBusinessRuleController.loaded_business_rules = {
+            **DefaultBusinessRuleController.loaded_business_rules,
+            str(business_rules_path): (
+                modified,
+                self.business_rules,
+                self.rule_set_indexes,
+            ),
+        }
+
+    def _index_rule_sets(self, rule_dict: dict, indexes: Dict[int, RuleSetIndex] = None) -> Dict[int, RuleSetIndex]:
+        """index the rule set and all nested rule sets of a rule dictionary
+
+        Args:
+            rule_dict (dict): a dictionary of business rules
+            indexes (Dict[int, RuleSetIndex], optional): the indexes to be extended. Defaults to None.
+
+        Returns:
+            Dict[int, RuleSetIndex]: the indexes by the id of their rule set
+        """
+        if indexes is None:
+            indexes = {}
+        if isinstance(rule_dict, dict) and isinstance(rule_dict.get("rules"), dict):
+            indexes[id(rule_dict)] = RuleSetIndex(rule_dict)
+            for sub_rule_dict in rule_dict["rules"].values():
+                self._index_rule_sets(sub_rule_dict, indexes)
+        return indexes
+
+    @staticmethod
+    def compile_rule(rule: str, resolver: Callable) -> rule_engine.Rule:
+        """get the compiled rule of a rule text and resolver, rules are compiled once per process
+
+        Args:
+            rule (str): the rule text
+            resolver (Callable): the rule_engine resolver of the attributes of the matchable
+
+        Returns:
+            rule_engine.Rule: the compiled rule
+        """
+        key = (rule, resolver)
+        compiled = DefaultBusinessRuleController.compiled_rules.get(key)
+        if compiled is None:
+            compiled = rule_engine.Rule(
+                rule, context=rule_engine.Context(resolver=resolver)
+            )
+            DefaultBusinessRuleController.compiled_rules[key] = compiled
+        return compiled
 
     def evaluate_request(
         self, matchable: Union[dict, object] = None, rule_dict: dict = None, *args, **kwargs
@@ -86,11 +255,13 @@ class DefaultBusinessRuleController(Controller):
             rule_dict (dict): a dictionary of business rules
             resolver (Resolver): a rule_engine resolver capable of resolving the attributes of the matchable type
         """
-        for sub_rule in rule_dict["rules"]:
-            if rule_engine.Rule(
-                sub_rule,
-                context=rule_engine.Context(resolver=resolver),
-            ).matches(matchable):
+        index = self.rule_set_indexes.get(id(rule_dict))
+        if index is not None and index.rule_dict is rule_dict:
+            sub_rules = index.candidates(matchable, resolver)
+        else:
+            sub_rules = rule_dict["rules"]
+        for sub_rule in sub_rules:
+            if self.compile_rule(sub_rule, resolver).matches(matchable):
                 self.evaluate_request(rule_dict=rule_dict["rules"][sub_rule])
 
     def _get_resolver(self, matchable: Union[object, dict], rule_dict: dict):
@@ -29,6 +29,11 @@ class Controller(ABC):
 
     started_transaction = False
 
+    # whether the action mapper may reuse the controller for subsequent actions, only
+    # controllers which keep no state between actions and are reinitialized by initialize
+    # opt in to pooling
+    pooled = False
+
     def __init__(
         self,
         request: Request,
@@ -45,6 +50,12 @@ class Controller(ABC):
         self.request = request
         self.response = response
 
+    def reset(self):
+        """release the request scoped state before the controller is pooled for reuse,
+        the request and response of the next action are bound by initialize"""
+        self.request = None
+        self.response = None
+
     def validate(self):
         return True
 
@@ -120,25 +120,40 @@ class CoreService(threading.Thread):
         self.integration_manager_pusher.setup()
         self.subject_pusher.setup()
         self._subscribe_to_actions()
-        self._subscribe_to_flow_actions()
 
     def _subscribe_to_actions(self):
-        """subscribe to the actions that the service will be listening to."""
+        """subscribe to the actions that the service will be listening to and the actions
+        within flows which match them."""
+        self.update_subscriptions()
+
+    def update_subscriptions(self):
+        """subscribe to the topics required by the action mapping and the flows, only the
+        subscriptions which changed are applied so this should be called whenever the
+        flows change."""
+        self.integration_manager_subscriber.set_subscriptions(self._get_subscription_topics())
+
+    def _get_subscription_topics(self) -> list[bytes]:
+        """get the topics of the actions that the service will be listening to, these are
+        the published actions of the action mapping and the actions within flows matching
+        the action mapping."""
+        serializer_action_key = self.integration_manager_subscriber.serializer_action_key
+        topics = []
+        action_keys = []
         for entry in self.action_mapping[ACTION_MAPPING_SECTION].items():
             ak = self.action_key_controller.build_from_dictionary_entry(entry)
             ak_res = self.action_key_controller.resolve_action_key(ak)
-            ak_res.decorator = PUBLISH_DECORATOR
-            self.integration_manager_subscriber.subscribe_to_action(ak_res)
-
-    def _subscribe_to_flow_actions(self):
-        """subscribe to the actions within flows that the service will be listening to.
-        TODO: This method is inneficient and should be refactored to avoid the nested loop.
-        """
-        for entry in self.action_mapping[ACTION_MAPPING_SECTION].items():
-            ak = self.action_key_controller.build_from_dictionary_entry(entry)
-            ak_res = self.action_key_controller.resolve_action_key(ak)
-            for action in self.action_flow_controller.get_all_flow_actions(ak_res):
-                self.integration_manager_subscriber.subscribe_to_action(action)
+            action_keys.append(ak_res)
+            # the resolved action key is shared so the published action is a copy of it
+            published = self.action_key_controller.new_action_key()
+            published.config = ak_res.config
+            published.source = ak_res.source
+            published.context = ak_res.context
+            published.action = ak_res.action
+            published.decorator = PUBLISH_DECORATOR
+            topics.append(serializer_action_key.to_generic_topic(published))
+        for action in self.action_flow_controller.get_flow_actions_matching(action_keys):
+            topics.append(serializer_action_key.to_generic_topic(action))
+        return topics
 
     def run(self) -> None:
         """This is the main entry point for the thread. It will start the event loop and
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Callable
+from concurrent.futures import Future
+from typing import Callable, Optional, Union
 from digitalpy.core.main.event import Event
 
 # TODO decide whether or not to deprecate this class
@@ -16,7 +17,19 @@ class EventManager(ABC):
         """Remove a listener for a given event"""
         raise NotImplementedError
 
+    def has_listeners(self, event_name: str) -> bool:
+        """Check if any listener is registered for a given event"""
+        return True
+
     @abstractmethod
-    def dispatch(self, event_name: str, event: Event):
-        """Notify listeners about the given event."""
-        raise NotImplementedError
\ No newline at end of file
+    def dispatch(
+        self,
+        event_name: str,
+        event: Union[Event, Callable[[], Event]],
+        asynchronous: bool = False,
+    ) -> Optional[Future]:
+        """Notify listeners about the given event. The event can be passed as a callable
+        creating it, so that no event is created if nobody listens to it. Asynchronous
+        events are passed to the listeners in the background and a future of the
+        dispatch is returned."""
+        raise NotImplementedError
@@ -1,5 +1,6 @@
 from importlib import import_module
-from typing import Any, Optional
+import sys
+from typing import Any, Iterable, Optional
 
 from digitalpy.core.serialization.controllers.serializer_action_key import (
     SerializerActionKey,
@@ -12,6 +13,10 @@ from digitalpy.core.digipy_configuration.configuration.digipy_configuration_cons
 from digitalpy.core.digipy_configuration.domain.model.configuration import Configuration
 from digitalpy.core.domain.node import Node
 
+# the maximum number of entries of the action key index, resolved lookups are no longer
+# added to the index once it is full
+MAX_ACTION_KEY_INDEX_SIZE = 10000
+
 
 class ConfigurationFactory:
     """ConfigurationFactory class to create and retrieve configuration objects."""
@@ -19,7 +24,17 @@ class ConfigurationFactory:
     def __init__(self):
         self.configuration_objects: dict[str, Node] = {}
         self.action_mapping: dict[str, ActionKey] = {}
+        # resolution index of (source, context, action) to the matching action mapping entry,
+        # misses are not stored as an action mapped later must be resolved
+        self.action_key_index: dict[tuple[str, str, str], ActionKey] = {}
         self.action_flows: dict[str, ActionFlow] = {}
+        # successor table of every flow, mapping the (source, context, decorator, action)
+        # tuple of a step to the step which follows it
+        self.flow_successors: dict[str, dict[tuple[str, str, str, str], Optional[ActionKey]]] = {}
+        # reverse index of the (source, context, decorator, action) tuple of every step
+        # to the (flow, position) pairs at which it occurs
+        self.flow_action_index: dict[tuple[str, str, str, str], tuple[tuple[str, int], ...]] = {}
+        self.flow_action_query_cache: dict[tuple[str, str, str, str], tuple[ActionKey, ...]] = {}
         self.serializer_action_key: SerializerActionKey = SerializerActionKey()
 
     def add_configuration(self, configuration: Configuration):
@@ -40,6 +55,149 @@ class ConfigurationFactory:
             action_flow (ActionFlow): The action flow to add.
         """
         self.action_flows[action_flow.config_id] = action_flow
+        self._index_action_flow(action_flow)
+
+    def get_next_flow_action(self, action: ActionKey) -> Optional[ActionKey]:
+        """Get the action which follows the given action in the flow referenced by it's config.
+
+        Args:
+            action (ActionKey): The current action of the flow.
+
+        Returns:
+            Optional[ActionKey]: The next action or None if the action is the final one.
+        """
+        successors = self.flow_successors.get(action.config)
+        if successors is None:
+            return None
+        key = self.flow_action_key(action)
+        try:
+            return successors[key]
+        except KeyError:
+            pass
+        # the action contains wildcards which aren't part of the table so fall back to
+        # matching against the steps of the flow
+        actions = self.action_flows[action.config].actions
+        for i, f_action in enumerate(actions):
+            if f_action == action:
+                return actions[i + 1] if len(actions) > i + 1 else None
+        return None
+
+    def get_all_flow_actions(self, action: ActionKey) -> tuple[ActionKey, ...]:
+        """Get every step of any flow which matches the given action.
+
+        Args:
+            action (ActionKey): The action to match.
+
+        Returns:
+            tuple[ActionKey, ...]: The matching steps ordered by flow and position.
+        """
+        query = self.flow_action_key(action)
+        try:
+            return self.flow_action_query_cache[query]
+        except KeyError:
+            pass
+        positions: list[tuple[str, int]] = []
+        for key, key_positions in self.flow_action_index.items():
+            if self._flow_action_keys_match(key, query):
+                positions.extend(key_positions)
+        flow_order = {config_id: i for i, config_id in enumerate(self.action_flows)}
+        positions.sort(key=lambda position: (flow_order[position[0]], position[1]))
+        result = tuple(
+            self.action_flows[config_id].actions[i] for config_id, i in positions
+        )
+        self.flow_action_query_cache[query] = result
+        return result
+
+    def get_flow_actions_matching(
+        self, actions: Iterable[ActionKey]
+    ) -> tuple[ActionKey, ...]:
+        """Get every step of any flow which matches one of the given actions. Unlike
+        calling get_all_flow_actions for every action the steps of the flows are only
+        visited once.
+
+        Args:
+            actions (Iterable[ActionKey]): The actions to match.
+
+        Returns:
+            tuple[ActionKey, ...]: The matching steps ordered by flow and position.
+        """
+        exact_queries: set[tuple[str, str, str, str]] = set()
+        wildcard_queries: set[tuple[str, str, str, str]] = set()
+        for action in actions:
+            query = self.flow_action_key(action)
+            (exact_queries if all(query) else wildcard_queries).add(query)
+
+        positions: list[tuple[str, int]] = []
+        for key, key_positions in self.flow_action_index.items():
+            if (
+                key in exact_queries
+                or any(self._flow_action_keys_match(key, query) for query in wildcard_queries)
+                or (
+                    not all(key)
+                    and any(self._flow_action_keys_match(key, query) for query in exact_queries)
+                )
+            ):
+                positions.extend(key_positions)
+        flow_order = {config_id: i for i, config_id in enumerate(self.action_flows)}
+        positions.sort(key=lambda position: (flow_order[position[0]], position[1]))
+        return tuple(self.action_flows[config_id].actions[i] for config_id, i in positions)
+
+    @staticmethod
+    def flow_action_key(action: ActionKey) -> tuple[str, str, str, str]:
+        """Get the key of an action in the flow tables, this consists of the
+        fields considered by ActionKey equality."""
+        return (action.source, action.context, action.decorator, action.action)
+
+    @staticmethod
+    def _flow_action_keys_match(
+        key: tuple[str, str, str, str], query: tuple[str, str, str, str]
+    ) -> bool:
+        """Match two flow action keys with the same semantics as ActionKey equality,
+        an empty field matches any value."""
+        return all(k == q or not k or not q for k, q in zip(key, query))
+
+    def _index_action_flow(self, action_flow: ActionFlow):
+        """Build the successor table of the given flow and add it's steps to the
+        reverse index. A step is only added to the successor table when no earlier
+        step matches it, as lookups always resolve to the first matching step.
+
+        Args:
+            action_flow (ActionFlow): The action flow to index.
+        """
+        config_id = action_flow.config_id
+        if config_id in self.flow_successors:
+            self._remove_action_flow_index(config_id)
+
+        actions = action_flow.actions
+        successors: dict[tuple[str, str, str, str], Optional[ActionKey]] = {}
+        index: dict[tuple[str, str, str, str], list[tuple[str, int]]] = {}
+        for i, f_action in enumerate(actions):
+            key = self.flow_action_key(f_action)
+            if not any(self._flow_action_keys_match(prev, key) for prev in index):
+                successors[key] = actions[i + 1] if len(actions) > i + 1 else None
+            index.setdefault(key, []).append((config_id, i))
+
+        for key, positions in index.items():
+            self.flow_action_index[key] = self.flow_action_index.get(key, ()) + tuple(
+                positions
+            )
+        self.flow_successors[config_id] = successors
+        self.flow_action_query_cache = {}
+
+    def _remove_action_flow_index(self, config_id: str):
+        """Remove the steps of the given flow from the flow tables.
+
+        Args:
+            config_id (str): The id of the action flow to remove.
+        """
+        self.flow_successors.pop(config_id, None)
+        for key, positions in list(self.flow_action_index.items()):
+            remaining = tuple(position for position in positions if position[0] != config_id)
+            if remaining:
+                self.flow_action_index[key] = remaining
+            else:
+                del self.flow_action_index[key]
+        self.flow_action_query_cache = {}
 
     def get_action_flow(self, config_id: str) -> Optional[ActionFlow]:
         """Get an action flow from the factory.
@@ -69,6 +227,78 @@ class ConfigurationFactory:
         else:
             return self.configuration_objects.get(name, None)
 
+    def resolve_action_key(
+        self, source: str, context: str, action: str
+    ) -> Optional[ActionKey]:
+        """Resolve the action mapping entry which best matches the given source, context
+        and action. Matches are memoized in the action key index until it is full.
+
+        Args:
+            source (str): The source of the action key.
+            context (str): The context of the action key.
+            action (str): The action of the action key.
+
+        Returns:
+            Optional[ActionKey]: The matching action mapping entry or None if there is no match.
+        """
+        index_key = (source, context, action)
+        try:
+            return self.action_key_index[index_key]
+        except KeyError:
+            pass
+        resolved = self._match_action_mapping(source, context, action)
+        if resolved is not None and len(self.action_key_index) < MAX_ACTION_KEY_INDEX_SIZE:
+            self.action_key_index[
+                (sys.intern(source), sys.intern(context), sys.intern(action))
+            ] = resolved
+        return resolved
+
+    def _match_action_mapping(
+        self, source: str, context: str, action: str
+    ) -> Optional[ActionKey]:
+        """Probe the action mapping from the most to the least specific key.
+
+        Args:
+            source (str): The source of the action key.
+            context (str): The context of the action key.
+            action (str): The action of the action key.
+
+        Returns:
+            Optional[ActionKey]: The matching action mapping entry or None if there is no match.
+        """
+        action_mapping = self.action_mapping
+        match (source, context, action):
+            case (s, c, a) if (s and c and a) and f"{s}?{c}?{a}" in action_mapping:
+                key = f"{s}?{c}?{a}"
+            case (s, c, a) if (s and a) and f"{s}??{a}" in action_mapping:
+                key = f"{s}??{a}"
+            case (s, c, a) if (c and a) and f"?{c}?{a}" in action_mapping:
+                key = f"?{c}?{a}"
+            case (s, c, a) if (s and c) and f"{s}?{c}?" in action_mapping:
+                key = f"{s}?{c}?"
+            case (s, c, a) if s and f"{s}??" in action_mapping:
+                key = f"{s}??"
+            case (s, c, a) if a and f"??{a}" in action_mapping:
+                key = f"??{a}"
+            case (s, c, a) if c and f"?{c}?" in action_mapping:
+                key = f"?{c}?"
+            case (_, _, _):
+                return None
+        return action_mapping[key]
+
+    def _build_action_key_index(self):
+        """Rebuild the action key index from the current action mapping. Every mapping
+        key of the form source?context?action resolves to itself, so these entries are
+        compiled eagerly while less specific lookups are added as they are resolved.
+        """
+        index: dict[tuple[str, str, str], ActionKey] = {}
+        for key, action_key in self.action_mapping.items():
+            parts = key.split("?")
+            if len(parts) != 3 or not any(parts):
+                continue
+            index[tuple(sys.intern(part) for part in parts)] = action_key  # type: ignore
+        self.action_key_index = index
+
     def _initialize_configuration_section(
         self, configuration: Configuration, section_name: str
     ):
@@ -102,6 +332,7 @@ class ConfigurationFactory:
                     key, configuration.get_value(key, section_name)
                 )
             )
+        self._build_action_key_index()
 
     def _initialize_generic_configuration_object(
         self, configuration: Configuration, section_name: str
@@ -195,5 +426,10 @@ class ConfigurationFactory:
             config (Configuration): The configuration object to remove.
         """
         for section_name in config.get_sections():
-            self.configuration_objects.pop(section_name, None)
+            if section_name == ACTION_MAPPING_SECTION:
+                for key in config.get_section(section_name).keys():
+                    self.action_mapping.pop(key, None)
+                self._build_action_key_index()
+            else:
+                self.configuration_objects.pop(section_name, None)
         self._publish_updates()
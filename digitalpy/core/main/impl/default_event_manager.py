@@ -1,26 +1,125 @@
-from multiprocessing import Event
-from typing import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+import os
+import threading
+from typing import Callable, Dict, Optional, Tuple, Union
 
+from digitalpy.core.main.event import Event
 from digitalpy.core.main.event_manager import EventManager
 
 
 class DefaultEventManager(EventManager):
-    """DefaultEventManager is a simple EventManager implementation."""
-    
-    __listeners = []
+    """DefaultEventManager is a simple EventManager implementation.
+
+    The listeners of an event are kept in a tuple which is replaced whenever a listener
+    is added or removed, so dispatching an event never locks or copies the listeners and
+    an event without listeners only costs a dictionary lookup. Asynchronous events are
+    dispatched by a bounded thread pool, once max_pending events wait for the pool the
+    dispatching thread is blocked until a listener finished.
+    """
+
+    def __init__(self, max_workers: int = 4, max_pending: int = 1000):
+        """
+        Args:
+            max_workers (int, optional): the number of threads dispatching asynchronous
+                events. Defaults to 4.
+            max_pending (int, optional): the number of asynchronous events which may wait
+                to be dispatched. Defaults to 1000.
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        # the listeners by event name, replaced as a whole when a listener changes
+        self.listeners: Dict[str, Tuple[Callable, ...]] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Optional[threading.BoundedSemaphore] = None
+        self._executor_pid: Optional[int] = None
 
     def add_listener(self, event_name, callback: Callable):
-        if event_name not in self.__listeners:
-            self.__listeners[event_name] = []
-        self.__listeners[event_name].append(callback)
-    
+        with self._lock:
+            self.listeners = {
+                **self.listeners,
+                event_name: self.listeners.get(event_name, ()) + (callback,),
+            }
+
     def remove_listener(self, event_name, callback: Callable):
-        if event_name in self.__listeners:
-            self.__listeners[event_name].remove(callback)
-            
-    def dispatch(self, event_name, event: Event):
-        if event_name in self.__listeners:
-            for callback in self.__listeners[event_name]:
-                callback(event)
-                if event.is_stopped():
-                    break
\ No newline at end of file
+        with self._lock:
+            listeners = list(self.listeners.get(event_name, ()))
+            if callback not in listeners:
+                return
+            listeners.remove(callback)
+            updated = {**self.listeners, event_name: tuple(listeners)}
+            if not listeners:
+                # events without listeners are not looked up when dispatched
+                del updated[event_name]
+            self.listeners = updated
+
+    def has_listeners(self, event_name) -> bool:
+        return event_name in self.listeners
+
+    def dispatch(
+        self,
+        event_name,
+        event: Union[Event, Callable[[], Event]],
+        asynchronous: bool = False,
+    ) -> Optional[Future]:
+        listeners = self.listeners.get(event_name)
+        if not listeners:
+            return None
+        if not isinstance(event, Event):
+            event = event()
+        if not asynchronous:
+            self._notify(listeners, event)
+            return None
+        executor, pending = self._get_executor()
+        pending.acquire()
+        try:
+            future = executor.submit(self._notify, listeners, event)
+        except BaseException:
+            pending.release()
+            raise
+        future.add_done_callback(lambda _: pending.release())
+        return future
+
+    def shutdown(self, wait: bool = True):
+        """stop the threads dispatching asynchronous events
+
+        Args:
+            wait (bool, optional): whether to wait for the pending events to be
+                dispatched. Defaults to True.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None and self._executor_pid == os.getpid():
+            executor.shutdown(wait=wait)
+
+    @staticmethod
+    def _notify(listeners: Tuple[Callable, ...], event: Event):
+        for callback in listeners:
+            callback(event)
+            if event.is_stopped():
+                break
+
+    def _get_executor(self) -> Tuple[ThreadPoolExecutor, threading.BoundedSemaphore]:
+        # the threads of the executor don't exist in a forked process
+        if self._executor is None or self._executor_pid != os.getpid():
+            with self._lock:
+                if self._executor is None or self._executor_pid != os.getpid():
+                    self._pending = threading.BoundedSemaphore(self.max_pending)
+                    self._executor = ThreadPoolExecutor(
+                        self.max_workers, thread_name_prefix="event_manager"
+                    )
+                    self._executor_pid = os.getpid()
+        return self._executor, self._pending
+
+    def __getstate__(self):
+        """delete objects that cannot be pickled"""
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        state["_executor"] = None
+        state["_pending"] = None
+        state["_executor_pid"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -1,12 +1,35 @@
+from dataclasses import dataclass
 import inspect
 import threading
-from typing import Any
+from typing import Any, Optional
 from digitalpy.core.digipy_configuration.domain.model.configuration import Configuration
 from digitalpy.core.main.factory import Factory
 import json
 import importlib
 
 
+@dataclass(frozen=True)
+class ConstructionParameter:
+    """a constructor parameter of a class and where its value is injected from"""
+
+    name: str
+    # the key of an already registered instance to be injected
+    instance_key: str
+    # the configuration section of the instance to be injected, None if there is none
+    section: Optional[str]
+    setter_name: str
+    required: bool
+
+
+@dataclass(frozen=True)
+class ConstructionPlan:
+    """the resolved class, interface and constructor parameters used to create instances"""
+
+    instance_class: type
+    interface: Optional[type]
+    parameters: tuple[ConstructionParameter, ...]
+
+
 class DefaultFactory(Factory):
     required_interfaces = {
         "event_manager": "digitalpy.core.main.event_manager.EventManager",
@@ -25,22 +48,30 @@ class DefaultFactory(Factory):
         "principal_factory": "principal_factory.PrincipalFactory",
     }
 
-    def __init__(self, configuration: Configuration):
+    def __init__(self, configuration: Configuration, track_stack: bool = False):
         self.configuration = configuration
+        # whether or not to record the names of the instances currently being created in
+        # current_stack, this is only intended for debugging
+        self.track_stack = track_stack
         self.current_stack = []
         # factory instance is registered for use by the routing worker so that
         # the instances in the instance dictionary can be preserved when the
-        # new object factory is instantiated in the sub-process
+        # new object factory is instantiated in the sub-process.
+        # the dictionary is copy-on-write, it is never modified once published so
+        # that it can be read without locking while writers replace it atomically
         self.instances = {
             "configuration": self.configuration,
             "factory": self,
         }
         # store imported modules to prevent multiple imports
         self.modules = {}
+        # construction plans by name and class, valid for one revision of the configuration
+        self._construction_plans: dict[tuple[str, str], ConstructionPlan] = {}
+        self._construction_plans_revision = self.configuration.revision
         self.stack_lock = threading.Lock()
         self._module_lock = threading.Lock()
+        # serializes writers of the instance dictionary
         self._instances_lock = threading.Lock()
-        self._instances_condition = threading.Condition(self._instances_lock)
 
     def add_interfaces(self, interfaces: dict):
         raise NotImplementedError("this method has not yet been implemented")
@@ -55,6 +86,7 @@ class DefaultFactory(Factory):
             self.current_stack = []
         with self._module_lock:
             self.modules = {}
+        self._construction_plans = {}
         DefaultFactory.required_interfaces = {
             "event_manager": "digitalpy.core.main.event_manager.EventManager",
             "logger": "logger.Logger",
@@ -73,23 +105,28 @@ class DefaultFactory(Factory):
         }
 
     def get_instance(self, name, dynamic_configuration={}) -> object:
-        instance = None
-
-        with self.stack_lock:
-            self.current_stack.append(name)
+        if self.track_stack:
+            with self.stack_lock:
+                self.current_stack.append(name)
+            try:
+                return self._get_instance(name, dynamic_configuration)
+            finally:
+                with self.stack_lock:
+                    self.current_stack.pop()
+        return self._get_instance(name, dynamic_configuration)
 
+    def _get_instance(self, name, dynamic_configuration: dict) -> object:
         instance_key = self.get_instance_key(name, dynamic_configuration)
+        # read a single snapshot of the instances as it may be replaced concurrently
+        instances = self.instances
         if (
-            instance_key in self.instances
+            instance_key in instances
             and dynamic_configuration.get("__cached", True) is True
         ):
-            instance = self._access_instance(instance_key)
-        else:
-            static_configuration = self.configuration.get_section(name, True)
-            configuration = dict(static_configuration, **dynamic_configuration)
-            instance = self.create_instance(name, configuration, instance_key)
-        self.current_stack.pop()
-        return instance
+            return instances[instance_key]
+        static_configuration = self.configuration.get_section(name, True)
+        configuration = dict(static_configuration, **dynamic_configuration)
+        return self.create_instance(name, configuration, instance_key)
 
     def get_instance_key(self, name, dynamic_configuration: dict):
         """Get the instance key for the given name and dynamic configuration"""
@@ -113,77 +150,51 @@ class DefaultFactory(Factory):
     def create_instance(self, name, configuration, instance_key):
         instance = None
         if configuration.get("__class") is not None:
-            class_name = configuration.get("__class")
-            class_name_parts = class_name.split(".")
-            if len(class_name_parts) == 2:
-                instance_class = getattr(
-                    self.import_module(class_name_parts[0]),
-                    class_name_parts[1],
-                )
-            else:
-                instance_class = getattr(
-                    self.import_module(".".join(class_name_parts[:-1])),
-                    class_name_parts[-1],
-                )
-
-            if callable(getattr(instance_class, "__init__", None)):
-                c_params = {}
-                instance_class_func = getattr(instance_class, "__init__")
-                instance_class_params = inspect.signature(instance_class_func)
-                for (
-                    param_name,
-                    param_default,
-                ) in instance_class_params.parameters.items():
-                    if (
-                        param_name == "self"
-                        or param_name == "args"
-                        or param_name == "kwargs"
-                    ):
-                        continue
-                    param_instance_key = param_name.lower().replace("_", "")
-                    # first check the configuration section for the parameter
-                    if param_name in configuration:
-                        c_params[param_name] = self.resolve_value(
-                            configuration[param_name]
-                        )
-                    # then check if a parameter has already been initialized
-                    elif param_instance_key in self.instances:
-                        c_params[param_name] = self._access_instance(param_instance_key)
-                    # check if a section with the name of the parameter exists
-                    elif self.configuration.has_section(param_name):
-                        c_params[param_name] = self.get_instance(param_name)
-                    # check if a section with the name of the parameter in lowercase exists
-                    elif self.configuration.has_section(param_instance_key):
-                        c_params[param_name] = self.get_instance(param_instance_key)
-                    elif isinstance(param_default, inspect._empty):
-                        raise Exception(
-                            f"constructor parameter {param_name} in class {name} cannot be injected"
-                        )
-                instance = instance_class(**c_params)
-                interface = self.get_interface(name)
-                if interface != None and not isinstance(instance, interface):
+            plan = self.get_construction_plan(name, configuration.get("__class"))
+            c_params = {}
+            instances = self.instances
+            for param in plan.parameters:
+                # first check the configuration section for the parameter
+                if param.name in configuration:
+                    c_params[param.name] = self.resolve_value(
+                        configuration[param.name]
+                    )
+                # then check if a parameter has already been initialized
+                elif param.instance_key in instances:
+                    c_params[param.name] = instances[param.instance_key]
+                # check if a section with the name of the parameter or the name of the
+                # parameter in lowercase exists
+                elif param.section is not None:
+                    c_params[param.name] = self.get_instance(param.section)
+                elif param.required:
                     raise Exception(
-                        f"class {instance_class} is required to implement interface {interface}"
+                        f"constructor parameter {param.name} in class {name} cannot be injected"
                     )
+            instance = plan.instance_class(**c_params)
+            if plan.interface is not None and not isinstance(instance, plan.interface):
+                raise Exception(
+                    f"class {plan.instance_class} is required to implement interface {plan.interface}"
+                )
 
-                if (
-                    "__shared" not in configuration
-                    or configuration["__shared"] == "true"
-                ):
-                    self.register_instance(instance_key, instance)
-
-                for key, value in configuration.items():
-                    if not key.startswith("__") and c_params.get(key, None) != None:
-                        value = self.resolve_value(value)
-                        setter_name = self.get_setter_name(key)
-                        if getattr(instance, setter_name, None) != None:
-                            getattr(instance, setter_name)(value)
-                        else:
-                            try:
-                                setattr(instance, key, value)
-                            except AttributeError:
-                                # attribute might be a read-only property
-                                pass
+            if (
+                "__shared" not in configuration
+                or configuration["__shared"] == "true"
+            ):
+                self.register_instance(instance_key, instance)
+
+            for param in plan.parameters:
+                value = c_params.get(param.name, None)
+                if value is None or param.name not in configuration:
+                    continue
+                setter = getattr(instance, param.setter_name, None)
+                if setter is not None:
+                    setter(value)
+                else:
+                    try:
+                        setattr(instance, param.name, value)
+                    except AttributeError:
+                        # attribute might be a read-only property
+                        pass
         else:
             # TODO: figure out the cases for a mapping being called and how to implement
             interface = self.get_interface(name)
@@ -199,6 +210,69 @@ class DefaultFactory(Factory):
             instance = configuration
         return instance
 
+    def get_construction_plan(self, name: str, class_name: str) -> "ConstructionPlan":
+        """Get the plan to construct instances of a class configured under the given name,
+        the plan is compiled on first use and recompiled after the configuration changed.
+
+        Args:
+            name (str): the name under which the class is configured
+            class_name (str): the fully qualified name of the class
+
+        Returns:
+            ConstructionPlan: the construction plan of the class
+        """
+        if self._construction_plans_revision != self.configuration.revision:
+            self._construction_plans = {}
+            self._construction_plans_revision = self.configuration.revision
+        plan = self._construction_plans.get((name, class_name))
+        if plan is None:
+            plan = self._compile_construction_plan(name, class_name)
+            self._construction_plans[(name, class_name)] = plan
+        return plan
+
+    def _compile_construction_plan(self, name: str, class_name: str) -> "ConstructionPlan":
+        """Resolve the class, interface and constructor parameters of a construction plan"""
+        class_name_parts = class_name.split(".")
+        if len(class_name_parts) == 2:
+            instance_class = getattr(
+                self.import_module(class_name_parts[0]),
+                class_name_parts[1],
+            )
+        else:
+            instance_class = getattr(
+                self.import_module(".".join(class_name_parts[:-1])),
+                class_name_parts[-1],
+            )
+
+        parameters = []
+        instance_class_params = inspect.signature(instance_class.__init__)
+        for param_name, param in instance_class_params.parameters.items():
+            if param_name == "self" or param_name == "args" or param_name == "kwargs":
+                continue
+            param_instance_key = param_name.lower().replace("_", "")
+            if self.configuration.has_section(param_name):
+                section = param_name
+            elif self.configuration.has_section(param_instance_key):
+                section = param_instance_key
+            else:
+                section = None
+            parameters.append(
+                ConstructionParameter(
+                    name=param_name,
+                    instance_key=param_instance_key,
+                    section=section,
+                    setter_name=self.get_setter_name(param_name),
+                    required=param.default is inspect.Parameter.empty
+                    and param.kind
+                    not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD),
+                )
+            )
+        return ConstructionPlan(
+            instance_class=instance_class,
+            interface=self.get_interface(name),
+            parameters=tuple(parameters),
+        )
+
     def get_setter_name(self, property):
         return "set" + property
 
@@ -259,9 +333,9 @@ class DefaultFactory(Factory):
             instance (object): the instance to be registered
         """
         with self._instances_lock:
-            instance_key = name.lower()
-            self.instances[instance_key] = instance
-            self._instances_condition.notify_all()
+            instances = dict(self.instances)
+            instances[name.lower()] = instance
+            self.instances = instances
 
     def _access_instance(self, key: str) -> Any:
         """Access an instance by name
@@ -272,13 +346,7 @@ class DefaultFactory(Factory):
         Returns:
             Any: the instance if it exists, otherwise None
         """
-        if self._instances_lock.locked():
-            self._instances_condition.wait()
-
-        instance_key = key.lower()
-        if instance_key in self.instances:
-            return self.instances[instance_key]
-        return None
+        return self.instances.get(key.lower(), None)
 
     def get_instance_of(self, class_name, dynamic_configuration={}):
         configuration = {
@@ -302,8 +370,9 @@ class DefaultFactory(Factory):
         with self._instances_lock:
             instance_key = name.lower()
             if instance_key in self.instances:
-                del self.instances[instance_key]
-            self._instances_condition.notify_all()
+                instances = dict(self.instances)
+                del instances[instance_key]
+                self.instances = instances
 
     def import_module(self, module_name):
         with self._module_lock:
@@ -317,6 +386,8 @@ class DefaultFactory(Factory):
         tmp_dict = self.__dict__.copy()
         if "modules" in tmp_dict:
             del tmp_dict["modules"]
+        if "_construction_plans" in tmp_dict:
+            del tmp_dict["_construction_plans"]
         # store the necessary instances in the instance dictionary but delete all others
         # this is to prevent serialization issues as some instances may reference an unserializable object
         if "instances" in tmp_dict:
@@ -325,9 +396,11 @@ class DefaultFactory(Factory):
             # the action mapper, trying to initialize the component will result in an infinite loop
             # with the component trying to initialize the action mapper and the action mapper trying to
             # initialize the component.
-            for key in list(tmp_dict["instances"].keys()):
-                if not key.endswith("actionmapper"):
-                    del tmp_dict["instances"][key]
+            tmp_dict["instances"] = {
+                key: instance
+                for key, instance in tmp_dict["instances"].items()
+                if key.endswith("actionmapper")
+            }
             tmp_dict["instances"]["configuration"] = self.configuration
             tmp_dict["instances"]["factory"] = self
         # delete the locks
@@ -335,8 +408,6 @@ class DefaultFactory(Factory):
             del tmp_dict["stack_lock"]
         if "_instances_lock" in tmp_dict:
             del tmp_dict["_instances_lock"]
-        if "_instances_condition" in tmp_dict:
-            del tmp_dict["_instances_condition"]
         if "_module_lock" in tmp_dict:
             del tmp_dict["_module_lock"]
         return tmp_dict
@@ -345,9 +416,9 @@ class DefaultFactory(Factory):
         self.__dict__.update(state)
         self.stack_lock = threading.Lock()
         self._instances_lock = threading.Lock()
-        self._instances_condition = threading.Condition(self._instances_lock)
         self._module_lock = threading.Lock()
         self.modules = {}
+        self._construction_plans = {}
 
     def __str__(self) -> str:
         return f"""DefaultFactory(
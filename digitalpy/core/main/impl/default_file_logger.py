@@ -1,5 +1,9 @@
+import atexit
 import logging
 import logging.config
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import threading
 from digitalpy.core.main.logger import Logger
 import pathlib
 import os
@@ -15,6 +19,19 @@ class DefaultFileLogger(Logger):
         "%(asctime)s | %(levelname)s | %(message)s", "%m-%d-%Y %H:%M:%S"
     )
 
+    # write the records of the configured loggers from a background thread so that
+    # logging doesn't block the caller on file io
+    async_logging = True
+
+    # the loggers configured in this process by name, configuration file and log file,
+    # the logging configuration is applied once as it replaces the handlers of all loggers
+    configured_loggers: dict[tuple[str, str, str], logging.Logger] = {}
+
+    # the configured loggers, their queue handlers and the listeners writing their records
+    queue_listeners: list[tuple[logging.Logger, QueueHandler, QueueListener]] = []
+
+    _configuration_lock = threading.Lock()
+
     def __init__(self, name, config_file=""):
 
         self.config_file = config_file
@@ -34,6 +51,10 @@ class DefaultFileLogger(Logger):
     def set_base_logging_path(path):
         DefaultFileLogger.base_logging_path = path
 
+    @staticmethod
+    def set_async_logging(async_logging: bool):
+        DefaultFileLogger.async_logging = async_logging
+
     def debug(self, message):
         self.logger.debug(message)
 
@@ -52,16 +73,108 @@ class DefaultFileLogger(Logger):
     def create_logger_instance(
         self, name, config_file, formatter, log_level, logging_path
     ):
-        logging.config.fileConfig(
-            config_file,
-            disable_existing_loggers=False,
-            defaults={"logfilename": logging_path.as_posix()},
-        )
-
-        logger = logging.getLogger(name)
+        key = (name, str(config_file), logging_path.as_posix())
+        logger = DefaultFileLogger.configured_loggers.get(key)
+        if logger is not None:
+            return logger
+
+        with DefaultFileLogger._configuration_lock:
+            logger = DefaultFileLogger.configured_loggers.get(key)
+            if logger is not None:
+                return logger
+
+            logging.config.fileConfig(
+                config_file,
+                disable_existing_loggers=False,
+                defaults={"logfilename": logging_path.as_posix()},
+            )
+
+            logger = logging.getLogger(name)
+            DefaultFileLogger._stop_detached_listeners()
+            if DefaultFileLogger.async_logging:
+                # the configuration replaced the handlers of the root logger too
+                DefaultFileLogger._enqueue_handlers(logging.getLogger())
+                DefaultFileLogger._enqueue_handlers(logger)
+
+            DefaultFileLogger.configured_loggers = {
+                **DefaultFileLogger.configured_loggers,
+                key: logger,
+            }
 
         return logger
 
+    @staticmethod
+    def _enqueue_handlers(logger: logging.Logger):
+        """replace the handlers of a logger with a queue handler and write the queued
+        records to the replaced handlers from a listener thread"""
+        handlers = [
+            handler for handler in logger.handlers if not isinstance(handler, QueueHandler)
+        ]
+        if not handlers:
+            return
+        record_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(record_queue)
+        listener = QueueListener(record_queue, *handlers, respect_handler_level=True)
+        for handler in handlers:
+            logger.removeHandler(handler)
+        logger.addHandler(queue_handler)
+        listener.start()
+        DefaultFileLogger.queue_listeners.append((logger, queue_handler, listener))
+
+    @staticmethod
+    def _stop_detached_listeners():
+        """stop the listeners of the queue handlers removed by a logging configuration"""
+        queue_listeners = []
+        for logger, queue_handler, listener in DefaultFileLogger.queue_listeners:
+            if queue_handler in logger.handlers:
+                queue_listeners.append((logger, queue_handler, listener))
+            else:
+                listener.stop()
+        DefaultFileLogger.queue_listeners = queue_listeners
+
+    @staticmethod
+    def stop_listeners():
+        """write all queued records and stop the listeners, loggers are configured
+        again when they are next requested"""
+        with DefaultFileLogger._configuration_lock:
+            for _, _, listener in DefaultFileLogger.queue_listeners:
+                listener.stop()
+            DefaultFileLogger.queue_listeners = []
+            DefaultFileLogger.configured_loggers = {}
+
+    @staticmethod
+    def _restart_listeners():
+        """start new listeners in a forked process as threads are not inherited,
+        the queues are replaced as they may have been in use while forking"""
+        DefaultFileLogger._configuration_lock = threading.Lock()
+        queue_listeners = []
+        for logger, queue_handler, listener in DefaultFileLogger.queue_listeners:
+            queue_handler.queue = queue.SimpleQueue()
+            listener = QueueListener(
+                queue_handler.queue, *listener.handlers, respect_handler_level=True
+            )
+            listener.start()
+            queue_listeners.append((logger, queue_handler, listener))
+        DefaultFileLogger.queue_listeners = queue_listeners
+
+    def get_log_files(self) -> list[str]:
+        """get the paths of the files written by the logger"""
+        return DefaultFileLogger.get_files_of(self.logger)
+
+    @staticmethod
+    def get_files_of(logger: logging.Logger) -> list[str]:
+        """get the paths of the files written by the handlers of a logger, including the
+        handlers replaced by a queue handler"""
+        handlers = list(logger.handlers)
+        for _, queue_handler, listener in DefaultFileLogger.queue_listeners:
+            if queue_handler in handlers:
+                handlers.extend(listener.handlers)
+        return [
+            handler.baseFilename
+            for handler in handlers
+            if isinstance(handler, logging.FileHandler)
+        ]
+
     def get_new_logger(self, name, config_file=None):
 
         return self.create_logger_instance(
@@ -78,3 +191,7 @@ class DefaultFileLogger(Logger):
 
     def get_logger(self):
         return self.logger
+
+
+atexit.register(DefaultFileLogger.stop_listeners)
+os.register_at_fork(after_in_child=DefaultFileLogger._restart_listeners)
@@ -10,7 +10,7 @@ class LogManager:
 
     def get_logs(self):
         """Get the logs from the manager."""
-        with open(self.logger.handlers[0].baseFilename, "r") as f:
+        with open(self.logger.get_log_files()[0], "r") as f:
             return f.read()
                 
     def get_logger(self):
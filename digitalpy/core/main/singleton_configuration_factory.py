@@ -1,5 +1,6 @@
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 from digitalpy.core.digipy_configuration.domain.model.actionflow import ActionFlow
+from digitalpy.core.digipy_configuration.domain.model.actionkey import ActionKey
 from digitalpy.core.main.impl.configuration_factory import ConfigurationFactory
 from digitalpy.core.digipy_configuration.domain.model.configuration import Configuration
 
@@ -32,6 +33,24 @@ class SingletonConfigurationFactory:
         SingletonConfigurationFactory.__check_config()
         return SingletonConfigurationFactory.__factory.get_action_flow(config_id)
 
+    @staticmethod
+    def get_next_flow_action(action: ActionKey) -> Optional[ActionKey]:
+        """Get the action which follows the given action in it's flow."""
+        SingletonConfigurationFactory.__check_config()
+        return SingletonConfigurationFactory.__factory.get_next_flow_action(action)  # type: ignore
+
+    @staticmethod
+    def get_all_flow_actions(action: ActionKey) -> tuple[ActionKey, ...]:
+        """Get every step of any flow which matches the given action."""
+        SingletonConfigurationFactory.__check_config()
+        return SingletonConfigurationFactory.__factory.get_all_flow_actions(action)  # type: ignore
+
+    @staticmethod
+    def get_flow_actions_matching(actions: Iterable[ActionKey]) -> tuple[ActionKey, ...]:
+        """Get every step of any flow which matches one of the given actions."""
+        SingletonConfigurationFactory.__check_config()
+        return SingletonConfigurationFactory.__factory.get_flow_actions_matching(actions)  # type: ignore
+
     @staticmethod
     def get_action_flows() -> list[ActionFlow]:
         """Get all action flows from the factory."""
@@ -52,6 +71,16 @@ class SingletonConfigurationFactory:
         SingletonConfigurationFactory.__check_config()
         return SingletonConfigurationFactory.__factory.get_configuration_object(name)  # type: ignore
 
+    @staticmethod
+    def resolve_action_key(
+        source: str, context: str, action: str
+    ) -> Optional[ActionKey]:
+        """Resolve the action mapping entry matching the given source, context and action."""
+        SingletonConfigurationFactory.__check_config()
+        return SingletonConfigurationFactory.__factory.resolve_action_key(  # type: ignore
+            source, context, action
+        )
+
     @staticmethod
     def __check_config():
         if SingletonConfigurationFactory.__factory is None:
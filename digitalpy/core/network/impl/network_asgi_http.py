@@ -0,0 +1,632 @@
+"""
+This module defines the `ASGIHTTPNetwork` class, an asyncio implementation of the
+`NetworkSyncInterface` served by an ASGI server, and the `ResponseDispatcher` and
+`ASGICommunicator` classes used by its request handlers.
+
+Unlike the flask networks, which block a server thread per request and subscribe and
+unsubscribe a topic for every request, all requests of the process are handled by a
+single event loop. The requests are forwarded to the service over one PUSH socket and the
+responses of the service are received on one SUB socket, each response resolves the future
+awaiting the message id of its request.
+
+The application is served by uvicorn which must be installed to start the server.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import pickle
+import secrets
+import threading
+import uuid
+from collections import OrderedDict
+from http.cookies import SimpleCookie
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl
+
+import zmq
+import zmq.asyncio
+
+from digitalpy.core.domain.domain.network_client import NetworkClient
+from digitalpy.core.domain.object_id import ObjectId
+from digitalpy.core.main.object_factory import ObjectFactory
+from digitalpy.core.main.singleton_configuration_factory import (
+    SingletonConfigurationFactory,
+)
+from digitalpy.core.network.domain.client_status import ClientStatus
+from digitalpy.core.network.network_sync_interface import NetworkSyncInterface
+from digitalpy.core.service_management.domain.model.service_description import (
+    ServiceDescription,
+)
+from digitalpy.core.zmanager.request import Request
+from digitalpy.core.zmanager.response import Response
+
+# the cookie identifying the network client of a http request
+NETWORK_ID_COOKIE = "digitalpy_network_id"
+
+# the default number of seconds a request waits for the response of the service
+DEFAULT_RESPONSE_TIMEOUT = 30
+
+# the default number of clients remembered by the network, the least recently active
+# clients are disconnected once it is exceeded
+DEFAULT_MAX_CLIENTS = 10000
+
+
+def _get_message_topic(message: Union[Request, Response]) -> bytes:
+    """get the topic on which the response to a message is published"""
+    return str(message.get_id()).encode("utf-8")
+
+
+class ResponseDispatcher:
+    """ResponseDispatcher forwards the requests of an event loop to the service and resolves
+    the future awaiting each request with the response of the service.
+
+    The requests are sent over a single PUSH socket and the responses are received on a
+    single SUB socket subscribed to all responses of the service, a response to a request
+    which is no longer awaited is discarded. All methods must be called from the event loop
+    which started the dispatcher.
+    """
+
+    def __init__(self, sink_addr: Union[str, bytes], publisher_addr: Union[str, bytes]):
+        self.sink_addr = sink_addr
+        self.publisher_addr = publisher_addr
+        self.context: zmq.asyncio.Context = None  # type: ignore
+        self.push_socket: zmq.asyncio.Socket = None  # type: ignore
+        self.sub_socket: zmq.asyncio.Socket = None  # type: ignore
+        self.loop: asyncio.AbstractEventLoop = None  # type: ignore
+        self.receiver: asyncio.Task = None  # type: ignore
+        # the futures awaiting a response by the topic of their request
+        self.pending: Dict[bytes, asyncio.Future] = {}
+
+    async def start(self):
+        """connect the sockets and start receiving the responses of the service"""
+        self.loop = asyncio.get_running_loop()
+        self.context = zmq.asyncio.Context()
+        self.push_socket = self.context.socket(zmq.PUSH)
+        self.push_socket.setsockopt(zmq.LINGER, 0)
+        self.push_socket.connect(self.sink_addr)
+        self.sub_socket = self.context.socket(zmq.SUB)
+        self.sub_socket.setsockopt(zmq.LINGER, 0)
+        self.sub_socket.connect(self.publisher_addr)
+        self.sub_socket.subscribe(b"")
+        self.receiver = self.loop.create_task(self._receive_responses())
+
+    async def stop(self):
+        """stop receiving responses, fail the awaiting requests and close the sockets"""
+        if self.receiver is not None:
+            self.receiver.cancel()
+            try:
+                await self.receiver
+            except asyncio.CancelledError:
+                pass
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("the network was stopped"))
+        self.pending = {}
+        if self.context is not None:
+            self.context.destroy(linger=0)
+
+    def is_running(self) -> bool:
+        """whether the dispatcher was started by the running event loop and not yet stopped"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return self.loop is loop and self.receiver is not None and not self.receiver.done()
+
+    async def send(self, request: Request):
+        """send a request to the service without waiting for its response
+
+        Args:
+            request (Request): the request to be sent
+        """
+        await self.push_socket.send_pyobj(request)
+
+    async def request(self, request: Request, timeout: float = DEFAULT_RESPONSE_TIMEOUT) -> Response:
+        """send a request to the service and wait for its response
+
+        Args:
+            request (Request): the request to be sent
+            timeout (float, optional): the number of seconds to wait for the response.
+                Defaults to DEFAULT_RESPONSE_TIMEOUT.
+
+        Raises:
+            asyncio.TimeoutError: if the service didn't respond in time
+
+        Returns:
+            Response: the response of the service
+        """
+        topic = _get_message_topic(request)
+        # the future is registered before sending so that an early response isn't missed
+        future = self.loop.create_future()
+        self.pending[topic] = future
+        try:
+            await self.push_socket.send_pyobj(request)
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self.pending.pop(topic, None)
+
+    async def _receive_responses(self):
+        while True:
+            topic, body = await self.sub_socket.recv_multipart()
+            future = self.pending.get(topic)
+            if future is None or future.done():
+                continue
+            try:
+                future.set_result(pickle.loads(body))
+            except Exception as ex:  # pylint: disable=broad-except
+                future.set_exception(ex)
+
+
+class ASGICommunicator:
+    """The ASGICommunicator class is the asynchronous counterpart of the BlueprintCommunicator,
+    it sends the messages of a single http request to the service.
+    """
+
+    def __init__(
+        self,
+        dispatcher: ResponseDispatcher,
+        network_id: bytes,
+        timeout: float = DEFAULT_RESPONSE_TIMEOUT,
+    ):
+        self.dispatcher = dispatcher
+        self.network_id = network_id
+        self.timeout = timeout
+
+    def _create_request(self, data: dict) -> Request:
+        req: Request = ObjectFactory.get_new_instance("Request")
+        req.set_values(data)
+        req.set_value("digitalpy_connection_id", self.network_id)
+        return req
+
+    async def request(self, request: Request) -> Response:
+        """send a composed request to the network and wait for a response
+
+        Args:
+            request (Request): the request to be sent
+
+        Returns:
+            Response: the response from the network
+        """
+        return await self.dispatcher.request(request, self.timeout)
+
+    async def send_message_async(self, action: str, context: str, data: dict):
+        """send a message to the network without returning a response
+
+        Args:
+            action (str): the action key for the request
+            context (str): the context key for the request
+            data (dict): the data to be sent as the values of the request
+        """
+        req = self._create_request(data)
+        req.set_action(action)
+        req.set_context(context)
+        await self.dispatcher.send(req)
+
+    async def send_message_sync(self, action: str, context: str, data: dict) -> Response:
+        """send a message to the network and wait for a response
+
+        Args:
+            action (str): the action key for the request
+            context (str): the context key for the request
+            data (dict): the data to be sent as the values of the request
+
+        Returns:
+            Response: the response from the network
+        """
+        req = self._create_request(data)
+        req.set_action(action)
+        req.set_context(context)
+        return await self.request(req)
+
+    async def send_flow_sync(self, flow_name: str, data: dict) -> Response:
+        """send a message to the first action of a flow and wait for a response
+
+        Args:
+            flow_name (str): the name of the action flow
+            data (dict): the data to be sent as the values of the request
+
+        Returns:
+            Response: the response from the network
+        """
+        flow = SingletonConfigurationFactory.get_action_flow(flow_name)
+        if flow is None:
+            raise ValueError(f"Action flow {flow_name} not found.")
+        req = self._create_request(data)
+        req.action_key = flow.actions[0]
+        return await self.request(req)
+
+
+# a route handler is called with the request composed from the http request and the
+# communicator of the http request, it returns the body of the http response or a tuple
+# of the body and the status code
+RouteHandler = Callable[[Request, ASGICommunicator], Awaitable[Any]]
+
+
+class ASGIHTTPNetwork(NetworkSyncInterface):
+    """this class implements the NetworkSyncInterface as an ASGI application, the http
+    requests are handled by a single event loop running the ASGI server in a thread of the
+    service
+    """
+
+    def __init__(
+        self,
+        response_timeout: float = DEFAULT_RESPONSE_TIMEOUT,
+        max_clients: int = DEFAULT_MAX_CLIENTS,
+    ):
+        """
+        Args:
+            response_timeout (float, optional): the number of seconds a request waits for
+                the response of the service. Defaults to DEFAULT_RESPONSE_TIMEOUT.
+            max_clients (int, optional): the number of clients remembered by the network.
+                Defaults to DEFAULT_MAX_CLIENTS.
+        """
+        self.host: str = None  # type: ignore
+        self.port: int = None  # type: ignore
+        self.response_timeout = float(response_timeout)
+        # stored apart from the argument, as the factory assigns the configured value
+        # to the attribute named like the argument
+        self.client_limit = int(max_clients)
+        # the clients by network id, ordered from the least to the most recently active
+        self.clients: "OrderedDict[bytes, NetworkClient]" = OrderedDict()
+        # the clients dropped from the clients, their disconnection is returned with
+        # the next serviced requests
+        self.evicted_clients: List[NetworkClient] = []
+        # the key signing the network id cookies, the cookies of another process are
+        # not accepted
+        self.cookie_key = secrets.token_bytes(32)
+        self.local_context: zmq.Context
+        self.sink: zmq.Socket
+        self.publisher: zmq.Socket
+        self.sink_addr: bytes
+        self.publisher_addr: bytes
+        self.service_desc: ServiceDescription = None  # type: ignore
+        self.routes: Dict[str, RouteHandler] = {}
+        self.dispatcher: Optional[ResponseDispatcher] = None
+        self.server = None
+        self.app_thread: threading.Thread = None  # type: ignore
+
+    def initialize_network(
+        self,
+        host: str,
+        port: int,
+        available_endpoints: Optional[List[str]] = None,
+        service_desc: Optional[ServiceDescription] = None,
+        routes: Optional[Dict[str, RouteHandler]] = None,
+        start_server: bool = True,
+        **kwargs,
+    ):
+        """this method initializes the network
+
+        Args:
+            host (str): the host address
+            port (int): the port number
+            available_endpoints (List[str], optional): the endpoints whose requests are
+                forwarded to the service and answered with the message of its response.
+            service_desc (ServiceDescription, optional): the service description
+            routes (Dict[str, RouteHandler], optional): the handlers by path of the
+                endpoints which compose their own requests.
+            start_server (bool, optional): whether to serve the application, the
+                application can be served by another ASGI server otherwise. Defaults to True.
+        """
+        self.service_desc = service_desc
+        self.host = host
+        self.port = port
+        self.local_context = zmq.Context()
+        self.sink = self.local_context.socket(zmq.PULL)
+        self.publisher = self.local_context.socket(zmq.PUB)
+        self.sink.bind_to_random_port("tcp://127.0.0.1")
+        self.sink_addr = self.sink.getsockopt(zmq.LAST_ENDPOINT)
+        self.publisher.bind_to_random_port("tcp://127.0.0.1")
+        self.publisher_addr = self.publisher.getsockopt(zmq.LAST_ENDPOINT)
+
+        for endpoint in available_endpoints or []:
+            self.routes["/" + endpoint] = self._forward_request
+        self.routes.update(routes or {})
+
+        if start_server:
+            self.app_thread = threading.Thread(target=self._start_app, daemon=True)
+            self.app_thread.start()
+
+    def _start_app(self):
+        """this method serves the application with uvicorn"""
+        import uvicorn  # pylint: disable=import-outside-toplevel
+
+        config = uvicorn.Config(
+            self.asgi_app, host=self.host, port=int(self.port), lifespan="on", log_level="warning"
+        )
+        self.server = uvicorn.Server(config)
+        self.server.run()
+
+    async def asgi_app(self, scope: dict, receive: Callable, send: Callable):
+        """the ASGI application of the network
+
+        Args:
+            scope (dict): the connection scope
+            receive (Callable): the awaitable receiving the events of the connection
+            send (Callable): the awaitable sending the events of the connection
+        """
+        if scope["type"] == "lifespan":
+            await self._handle_lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        handler = self.routes.get(scope["path"])
+        if handler is None:
+            await self._send_http_response(send, 404, b"Not Found", "text/plain")
+            return
+
+        body = await self._read_body(receive)
+        network_id, new_client = self._get_id(scope)
+        req = self._create_request(scope, body, network_id)
+        communicator = ASGICommunicator(
+            await self._get_dispatcher(), network_id, self.response_timeout
+        )
+        try:
+            result = await handler(req, communicator)
+            status, body, content_type = self._encode_result(result)
+        except asyncio.TimeoutError:
+            status, body, content_type = 504, b"Gateway Timeout", "text/plain"
+        except Exception as ex:  # pylint: disable=broad-except
+            status, body, content_type = 500, str(ex).encode("utf-8"), "text/plain"
+
+        headers = []
+        if new_client:
+            headers.append(
+                (
+                    b"set-cookie",
+                    f"{NETWORK_ID_COOKIE}={self._sign_id(network_id)}; Path=/; HttpOnly".encode(),
+                )
+            )
+        await self._send_http_response(send, status, body, content_type, headers)
+
+    async def _handle_lifespan(self, receive: Callable, send: Callable):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await self._get_dispatcher()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                if self.dispatcher is not None:
+                    await self.dispatcher.stop()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _get_dispatcher(self) -> ResponseDispatcher:
+        """get the dispatcher of the running event loop"""
+        if self.dispatcher is None or not self.dispatcher.is_running():
+            self.dispatcher = ResponseDispatcher(self.sink_addr, self.publisher_addr)
+            await self.dispatcher.start()
+        return self.dispatcher
+
+    async def _forward_request(self, request: Request, communicator: ASGICommunicator):
+        """forward the request of an endpoint to the service"""
+        resp: Response = await communicator.request(request)
+        return resp.get_value("message")
+
+    @staticmethod
+    async def _read_body(receive: Callable) -> bytes:
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    @staticmethod
+    async def _send_http_response(
+        send: Callable,
+        status: int,
+        body: bytes,
+        content_type: str,
+        headers: Optional[List[Tuple[bytes, bytes]]] = None,
+    ):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", content_type.encode("latin-1")),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                    *(headers or []),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    def _encode_result(result: Any) -> Tuple[int, bytes, str]:
+        """encode the result of a route handler as the status, body and content type of
+        the http response"""
+        status = 200
+        if isinstance(result, tuple):
+            result, status = result
+        if result is None:
+            return status, b"", "text/plain"
+        if isinstance(result, bytes):
+            return status, result, "text/html; charset=utf-8"
+        if isinstance(result, str):
+            return status, result.encode("utf-8"), "text/html; charset=utf-8"
+        return status, json.dumps(result).encode("utf-8"), "application/json"
+
+    def _create_request(self, scope: dict, body: bytes, network_id: bytes) -> Request:
+        req: Request = ObjectFactory.get_new_instance("Request")
+        req.set_value("data", body)
+        req.set_value("url", scope["path"].lstrip("/"))
+        req.set_value("method", scope["method"])
+        req.set_value(
+            "headers",
+            {key.decode("latin-1"): value.decode("latin-1") for key, value in scope["headers"]},
+        )
+        for key, value in parse_qsl(scope.get("query_string", b"").decode("latin-1")):
+            req.set_value(key, value)
+        req.set_value("digitalpy_connection_id", network_id)
+        return req
+
+    def _get_id(self, scope: dict) -> Tuple[bytes, bool]:
+        """get the network id of the client from its signed cookie or generate a new one,
+        a cookie without a valid signature is treated as a new client
+
+        Returns:
+            Tuple[bytes, bool]: the network id and whether it was generated
+        """
+        for key, value in scope["headers"]:
+            if key == b"cookie":
+                cookie = SimpleCookie(value.decode("latin-1"))
+                if NETWORK_ID_COOKIE in cookie:
+                    network_id = self._verify_id(cookie[NETWORK_ID_COOKIE].value)
+                    if network_id is not None:
+                        return network_id, False
+        return str(uuid.uuid4()).encode("utf-8"), True
+
+    def _get_signature(self, network_id: str) -> str:
+        return hmac.new(self.cookie_key, network_id.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    def _sign_id(self, network_id: bytes) -> str:
+        """get the value of the cookie of the network id"""
+        value = network_id.decode("utf-8")
+        return f"{value}.{self._get_signature(value)}"
+
+    def _verify_id(self, value: str) -> Optional[bytes]:
+        """get the network id of a cookie value, None if its signature is invalid"""
+        network_id, _, signature = value.rpartition(".")
+        if not network_id or not hmac.compare_digest(
+            signature, self._get_signature(network_id)
+        ):
+            return None
+        return network_id.encode("utf-8")
+
+    def service_connections(
+        self, max_requests=1000, blocking: bool = False, timeout: int = 0
+    ) -> List[Request]:
+        """this method returns the requests from the network
+
+        Args:
+            max_requests (int, optional): the maximum number of requests to be returned.
+            Defaults to 1000.
+            blocking (bool, optional): whether the receive should be blocking. Defaults to False.
+            timeout (int, optional): the timeout for the receive. Defaults to 0.
+
+        Returns:
+            List[Request]: the list of requests
+        """
+        requests = []
+        try:
+            requests.append(self.service_connection(blocking=blocking, timeout=timeout))
+        except zmq.Again:
+            return self._add_disconnections(requests)
+        for _ in range(max_requests - 1):
+            try:
+                # get further requests but do not block
+                requests.append(self.service_connection(blocking=False))
+            except zmq.Again:
+                break
+        return self._add_disconnections(requests)
+
+    def _add_disconnections(self, requests: List[Request]) -> List[Request]:
+        """add the disconnections of the evicted clients to the serviced requests"""
+        while self.evicted_clients:
+            client = self.evicted_clients.pop(0)
+            client.status = ClientStatus.DISCONNECTED
+            request: Request = ObjectFactory.get_new_instance("Request")
+            request.set_value("action", "disconnection")
+            request.set_value("client", client)
+            requests.append(request)
+        return requests
+
+    def service_connection(self, blocking: bool = False, timeout: int = 0) -> Request:
+        """this method services a connection request from the network and returns the request
+
+        Args:
+            blocking (bool, optional): whether the receive should be blocking. Defaults to False.
+            timeout (int, optional): the timeout for the receive. Defaults to 0.
+
+        Returns:
+            Request: the request
+        """
+        msg = self.receive_message(blocking=blocking, timeout=timeout)
+        dp_conn_id = msg.get_value("digitalpy_connection_id")
+        msg.set_value("client", self._get_client(dp_conn_id, msg))
+        return msg
+
+    def receive_message(self, blocking: bool = False, timeout=0) -> Request:
+        """this method receives a message from the network
+
+        Args:
+            blocking (bool, optional): whether the receive should be blocking. Defaults to False.
+
+        Returns:
+            Request: the message received
+        """
+        if blocking:
+            self.sink.setsockopt(zmq.RCVTIMEO, timeout)
+            return self.sink.recv_pyobj()
+        else:
+            return self.sink.recv_pyobj(zmq.NOBLOCK)
+
+    def handle_connection(self, request: Request, network_id: bytes) -> NetworkClient:
+        """this method handles a connection request from the network
+
+        Args:
+            request (Request): the request
+            network_id (bytes): the network id
+
+        Returns:
+            NetworkClient: the network client
+        """
+        request.set_value("action", "connection")
+        oid = ObjectId("network_client", id=str(network_id))
+        client: NetworkClient = ObjectFactory.get_new_instance(
+            "DefaultClient", dynamic_configuration={"oid": oid}
+        )
+        client.id = bytes(network_id)
+        client.status = ClientStatus.CONNECTED
+        if self.service_desc is not None:
+            client.service_id = self.service_desc.name
+            client.protocol = self.service_desc.protocol
+        self.clients[network_id] = client
+        return client
+
+    def _get_client(self, network_id: bytes, request: Request) -> NetworkClient:
+        if network_id in self.clients:
+            self.clients.move_to_end(network_id)
+            return self.clients[network_id]
+        client = self.handle_connection(request, network_id)
+        # forget the least recently active clients
+        while len(self.clients) > self.client_limit:
+            _, evicted = self.clients.popitem(last=False)
+            self.evicted_clients.append(evicted)
+        return client
+
+    def send_response(self, response: Response):
+        """this method publishes a response to the awaiting http request
+
+        Args:
+            response (Response): the response
+        """
+        self.publisher.send_multipart(
+            [_get_message_topic(response), pickle.dumps(response)]
+        )
+
+    def receive_message_from_client(
+        self, client: NetworkClient, blocking: bool = False
+    ) -> Request:
+        """this method has not yet been implemented"""
+        return super().receive_message_from_client(client, blocking)
+
+    def get_poll_sockets(self) -> List[zmq.Socket]:
+        return [self.sink]
+
+    def teardown_network(self):
+        """this method stops the server and tears down the network"""
+        if self.server is not None:
+            self.server.should_exit = True
+            self.app_thread.join(timeout=5)
+        self.sink.close(linger=0)
+        self.publisher.close(linger=0)
+        self.local_context.term()
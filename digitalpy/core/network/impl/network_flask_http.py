@@ -67,7 +67,7 @@ class FlaskHTTPNetwork(NetworkSyncInterface):
     def _start_app(self):
         self.app.run()
 
-    def service_connections(self, max_requests=1000):
+    def service_connections(self, max_requests=1000, blocking: bool = False, timeout: int = 0):
         requests = []
         for _ in range(max_requests):
             try:
@@ -77,6 +77,9 @@ class FlaskHTTPNetwork(NetworkSyncInterface):
                 return requests
         return requests
 
+    def get_poll_sockets(self) -> List[zmq.Socket]:
+        return [self.sink]
+
     def teardown_network(self):
         return super().teardown_network()
 
@@ -416,6 +416,9 @@ class FlaskHTTPNetworkBlueprints(NetworkSyncInterface):
         """this method has not yet been implemented"""
         return super().receive_message_from_client(client, blocking)
 
+    def get_poll_sockets(self) -> List[zmq.Socket]:
+        return [self.sink]
+
     def teardown_network(self):
         """this method tears down the network"""
         self.sink.close()
@@ -134,6 +134,9 @@ class TCPNetwork(NetworkAsyncInterface):
 
         return req
 
+    def get_poll_sockets(self) -> List[zmq.Socket]:
+        return [self.socket]
+
     def teardown_network(self):
         if self.socket:
             self.socket.close()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Union
+from typing import Any, List, Union
 from digitalpy.core.main.object_factory import ObjectFactory
 from digitalpy.core.domain.domain.network_client import NetworkClient
 from digitalpy.core.zmanager.request import Request
@@ -49,3 +49,13 @@ class NetworkInterface(ABC):
         Raises:
             IOError: if the response cannot be sent
         """
+
+    def get_poll_sockets(self) -> List[Any]:
+        """get the sockets which become readable when a request was received by the network,
+        so that a service can wait for requests together with it's other sockets. A network
+        without such sockets is serviced periodically.
+
+        Returns:
+            List[Any]: the zmq sockets or file descriptors of the network
+        """
+        return []
@@ -0,0 +1,254 @@
+import importlib
+import io
+from operator import itemgetter
+import pickle
+import threading
+from typing import Any, Dict, NamedTuple, Optional
+
+from digitalpy.core.domain.node import Node
+from digitalpy.core.domain.object_id import ObjectId
+from digitalpy.core.parsing.abstract_format import AbstractFormat
+from digitalpy.core.parsing.load_configuration import ModelConfiguration
+from digitalpy.core.zmanager.request import Request
+from digitalpy.core.zmanager.response import Response
+
+# attributes set by the base classes of a node, they are either sent explicitly, rebuilt
+# from the children of the node or re-attached by the receiver and so are never written
+# to the wire as part of the declared attributes of the node
+NODE_ATTRIBUTES = frozenset(
+    [
+        "_DefaultPersistentObject__type",
+        "_oid",
+        "state",
+        "persistence_facade",
+        "mapper",
+        "attribute_descriptions",
+        "original_data",
+        "_model_configuration",
+        "_children",
+        "_children_by_type",
+        "_children_by_role",
+        "_child_roles",
+        "_parents",
+        "_depth",
+        "_path",
+        "_model",
+        "_include_oid",
+        "_extended",
+        "_relationship_definition",
+    ]
+)
+
+
+class NodeType(NamedTuple):
+    """an entry of the type table, the node class with the model re-attached to the nodes
+    of the class by the receiver"""
+
+    node_class: type
+    model_configuration: ModelConfiguration
+    model: Optional[dict]
+
+
+# the type table of the process by type key
+_types: Dict[str, NodeType] = {}
+_types_lock = threading.Lock()
+
+
+def get_type_key(node_class: type) -> str:
+    """get the key of a node class in the type table"""
+    return f"{node_class.__module__}:{node_class.__qualname__}"
+
+
+def register_type(
+    node_class: type,
+    model_configuration: Optional[ModelConfiguration] = None,
+    model: Optional[dict] = None,
+):
+    """register the model configuration and the model re-attached to the received nodes of
+    a class, the registered type takes precedence over the type entry of a message so a
+    receiving process can register the model of the types it expects
+
+    Args:
+        node_class (type): the node class
+        model_configuration (ModelConfiguration, optional): the model configuration of
+            the nodes. Defaults to None.
+        model (dict, optional): the domain classes of the nodes by name. Defaults to None.
+    """
+    if model_configuration is None:
+        model_configuration = ModelConfiguration()
+    with _types_lock:
+        _types[get_type_key(node_class)] = NodeType(node_class, model_configuration, model)
+
+
+class _TypeEntry(NamedTuple):
+    """the entry of a node class in the type table of a message, it is written once per
+    message and referenced by the following nodes of the class"""
+
+    key: str
+    model_configuration: ModelConfiguration
+    model: Optional[dict]
+
+
+def _get_type(
+    key: str, model_configuration: ModelConfiguration, model: Optional[dict]
+) -> NodeType:
+    """get the type of a received node class, the type is registered with the model sent
+    in the message if the receiving process has not registered it"""
+    node_type = _types.get(key)
+    if node_type is None:
+        module_name, _, qualname = key.partition(":")
+        node_class: Any = importlib.import_module(module_name)
+        for name in qualname.split("."):
+            node_class = getattr(node_class, name)
+        if not (isinstance(node_class, type) and issubclass(node_class, Node)):
+            raise pickle.UnpicklingError(f"{key} is not a node class")
+        register_type(node_class, model_configuration, model)
+        node_type = _types[key]
+    return node_type
+
+
+def _restore_node(
+    node_type: NodeType,
+    oid: ObjectId,
+    state: int,
+    include_oid: bool,
+    extended: dict,
+    layout: tuple,
+    values: tuple,
+    children: tuple,
+    roles: dict,
+) -> Node:
+    """restore a node encoded by the CompactFormat, the model configuration of the node is
+    re-attached from the type table and the children are linked to their parent"""
+    node: Node = node_type.node_class.__new__(node_type.node_class)
+    model_configuration = node_type.model_configuration
+    # the attributes are set in the order of the constructors of the node
+    node.__dict__ = {
+        "_DefaultPersistentObject__type": oid.get_type(),
+        "_oid": oid,
+        "state": state,
+        "attribute_descriptions": [],
+        "original_data": {},
+        "_model_configuration": model_configuration,
+        "_children": {},
+        "_children_by_type": {},
+        "_children_by_role": {},
+        "_child_roles": {},
+        "_parents": {},
+        "_depth": -1,
+        "_path": "",
+        "_model": node_type.model,
+        "_include_oid": include_oid,
+        "_extended": extended,
+        "_relationship_definition": model_configuration.elements.get(
+            node_type.node_class.__name__, None
+        ),
+    }
+    node.__dict__.update(zip(layout, values))
+    for child in children:
+        child_oid = child.oid
+        node._children[child_oid] = child
+        node._index_child(child_oid, child, roles.get(child_oid))
+        child.set_parent(node)
+    return node
+
+
+def _reduce_type_entry(entry: _TypeEntry, layouts: dict):
+    return _get_type, tuple(entry)
+
+
+def _reduce_object_id(oid: ObjectId, layouts: dict):
+    return ObjectId, (oid.get_type(), oid.id, oid.prefix)
+
+
+def _reduce_node(node: Node, layouts: dict):
+    attributes = node.__dict__
+    names = tuple(attributes)
+    cached = layouts.get(type(node))
+    if cached is None or cached[0] != names:
+        layout = tuple(name for name in names if name not in NODE_ATTRIBUTES)
+        key = get_type_key(type(node))
+        if cached is None:
+            if key not in _types:
+                # the types sent by the process are received by it with their model
+                register_type(type(node), node._model_configuration, node._model)
+            node_type = _types[key]
+            entry = _TypeEntry(key, node_type.model_configuration, node_type.model)
+        else:
+            entry = cached[1]
+        # the type entry and layout are shared by the nodes of a class so they are
+        # written once per message
+        getter = itemgetter(*layout) if layout else None
+        cached = (names, entry, layout, getter)
+        layouts[type(node)] = cached
+    _, entry, layout, getter = cached
+    if getter is None:
+        values = ()
+    elif len(layout) == 1:
+        values = (getter(attributes),)
+    else:
+        values = getter(attributes)
+    return (
+        _restore_node,
+        (
+            entry,
+            node._oid,
+            node.state,
+            node._include_oid,
+            node._extended,
+            layout,
+            values,
+            tuple(node._children.values()),
+            node._child_roles,
+        ),
+    )
+
+
+class _CompactPickler(pickle.Pickler):
+    """pickler encoding nodes as the entry of their type, their declared attributes and the
+    references to their children and object ids as their type, ids and prefix."""
+
+    def __init__(self, file, layouts: dict, reducers: dict):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.layouts = layouts
+        self.reducers = reducers
+
+    def reducer_override(self, obj):
+        reducer = self.reducers.get(type(obj))
+        if reducer is None:
+            if isinstance(obj, Node):
+                reducer = _reduce_node
+            elif type(obj) is _TypeEntry:
+                reducer = _reduce_type_entry
+            elif type(obj) is ObjectId:
+                reducer = _reduce_object_id
+            else:
+                reducer = False
+            self.reducers[type(obj)] = reducer
+        if reducer is False:
+            return NotImplemented
+        return reducer(obj, self.layouts)
+
+
+class CompactFormat(AbstractFormat):
+    """binary format which encodes nodes by the entry of their class in the type table,
+    the attributes declared by the class and the references to their children rather than
+    pickling the whole object graph. The model configuration of a class is written once per
+    message with the entry of the class, the receiver re-attaches the model configuration
+    registered for the type, registering the sent one if there is none, and the mapper and
+    persistence facade are re-initialized lazily.
+    """
+
+    def __init__(self):
+        # the type entry and attribute layout of every encoded node class
+        self.layouts: dict[type, tuple[tuple, _TypeEntry, tuple, Optional[itemgetter]]] = {}
+        # the reducer of every encoded type or False if the type is pickled as usual
+        self.reducers: dict[type, object] = {}
+
+    def serialize_values(self, response: Response):
+        buffer = io.BytesIO()
+        _CompactPickler(buffer, self.layouts, self.reducers).dump(response.get_values())
+        return buffer.getvalue()
+
+    def deserialize_values(self, request: Request):
+        return pickle.loads(request.get_values())
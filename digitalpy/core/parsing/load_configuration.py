@@ -1,29 +1,39 @@
 from argparse import ArgumentError
 from dataclasses import dataclass, field
 import os
+from pathlib import PurePath
 from string import Template
 import json
-from typing import Dict
+import threading
+from typing import Dict, Optional, Union
 
+# the model configurations are shared by all nodes and facades of a process and
+# must not be modified once they are loaded
 
-@dataclass
+
+@dataclass(frozen=True)
 class Relationship:
     min_occurs: int = 0
     max_occurs: int = 1
     target_class: str = ""
 
 
-@dataclass
+@dataclass(frozen=True)
 class ConfigurationEntry:
     relationships: Dict[str, Relationship] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True)
 class ModelConfiguration:
     elements: Dict[str, ConfigurationEntry] = field(default_factory=dict)
 
 
 class LoadConfiguration:
+    # the parsed configurations by path with the modification time of their file,
+    # shared by all loaders of the process
+    configurations: Dict[str, tuple[int, ModelConfiguration]] = {}
+    _configurations_lock = threading.Lock()
+
     def __init__(self, configuration_path_template: Template):
         self.configuration_path_template = configuration_path_template
 
@@ -31,16 +41,49 @@ class LoadConfiguration:
         message_type = message_type.lower()
         message_configuration_path = self.configuration_path_template.substitute(
             message_type=message_type)
-        if not os.path.exists(message_configuration_path):
+        try:
+            modified = os.stat(message_configuration_path).st_mtime_ns
+        except OSError:
             raise Exception("configuration for %s not found" %
                             message_configuration_path)
 
+        cached = LoadConfiguration.configurations.get(message_configuration_path)
+        if cached is not None and cached[0] == modified:
+            return cached[1]
+
         # TODO: extend with more configuration formats
         if message_configuration_path.endswith(".json"):
-            return self.parse_json_configuration(message_configuration_path)
+            configuration = self.parse_json_configuration(message_configuration_path)
         else:
             raise Exception("configuration type not supported")
 
+        with LoadConfiguration._configurations_lock:
+            LoadConfiguration.configurations = {
+                **LoadConfiguration.configurations,
+                message_configuration_path: (modified, configuration),
+            }
+        return configuration
+
+    @staticmethod
+    def invalidate(path: Optional[Union[str, PurePath]] = None):
+        """discard the cached configurations stored under the given path, e.g. when a
+        component is installed or removed
+
+        Args:
+            path (Union[str, PurePath], optional): the directory or file of the
+                configurations. Defaults to None which discards all configurations.
+        """
+        with LoadConfiguration._configurations_lock:
+            if path is None:
+                LoadConfiguration.configurations = {}
+                return
+            path = PurePath(os.path.abspath(path))
+            LoadConfiguration.configurations = {
+                configuration_path: cached
+                for configuration_path, cached in LoadConfiguration.configurations.items()
+                if not PurePath(os.path.abspath(configuration_path)).is_relative_to(path)
+            }
+
     def parse_json_configuration(self, message_configuration_path):
         with open(message_configuration_path, 'rb') as configuration_file:
             config = json.load(configuration_file)["definitions"]
@@ -7,7 +7,7 @@
 # Original author: ingo herwig <ingo@wemove.com>
 #
 #######################################################
-from typing import Any
+from typing import Any, Callable, List
 from digitalpy.core.main.event_manager import EventManager
 from digitalpy.core.domain.object_id import ObjectId
 from digitalpy.core.persistence.persistence_facade import PersistenceFacade
@@ -33,7 +33,9 @@ class DefaultPersistenceFacade(PersistenceFacade):
         @param $eventManager
         @param $logStrategy OutputStrategy used for logging persistence actions.
         """
-        pass
+        # the callables notified of saved objects and of the ids of deleted objects
+        self.save_hooks: List[Callable[[PersistentObject], Any]] = []
+        self.delete_hooks: List[Callable[[ObjectId], Any]] = []
 
     def __del__(self) -> Any:
         """Destructor"""
@@ -247,6 +249,39 @@ class DefaultPersistenceFacade(PersistenceFacade):
             # set logging strategy
             mapper.set_log_strategy(self.log_strategy)
 
+    def add_save_hook(self, hook: Callable[[PersistentObject], Any]):
+        """register a callable notified of every object saved through the facade
+        @param hook callable receiving the saved object
+        """
+        self.save_hooks.append(hook)
+
+    def add_delete_hook(self, hook: Callable[[ObjectId], Any]):
+        """register a callable notified of every object deleted through the facade
+        @param hook callable receiving the object id of the deleted object
+        """
+        self.delete_hooks.append(hook)
+
+    def remove_hook(self, hook: Callable):
+        """unregister a save or delete hook"""
+        self.save_hooks = [h for h in self.save_hooks if h != hook]
+        self.delete_hooks = [h for h in self.delete_hooks if h != hook]
+
+    def object_saved(self, obj: PersistentObject):
+        """notify the save hooks that an object was saved, called by the persistence
+        controllers once the object was committed to the store
+        @param obj the saved object
+        """
+        for hook in self.save_hooks:
+            hook(obj)
+
+    def object_deleted(self, oid: ObjectId):
+        """notify the delete hooks that an object was deleted, called by the persistence
+        controllers once the deletion was committed to the store
+        @param oid the object id of the deleted object
+        """
+        for hook in self.delete_hooks:
+            hook(oid)
+
     def state_changed(self, event: StateChangeEvent) -> Any:
         """_listen to _state_change_events
         @param $event _state_change_event instance
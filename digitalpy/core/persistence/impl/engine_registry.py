@@ -0,0 +1,116 @@
+"""This module contains the EngineRegistry which shares one pooled SQLAlchemy engine per
+database between all persistence controllers of a process.
+"""
+
+import os
+import threading
+from pathlib import PurePath
+from typing import Optional, Union
+
+from sqlalchemy import Engine, MetaData, create_engine, event
+
+# the number of statements cached by every sqlite3 connection
+SQLITE_CACHED_STATEMENTS = 256
+
+
+class EngineRegistry:
+    """EngineRegistry creates and shares a pooled engine per database url. The registry is
+    process-scoped, engines inherited from a parent process are discarded without closing
+    their connections as described in
+    https://docs.sqlalchemy.org/en/20/core/pooling.html#using-connection-pools-with-multiprocessing-or-os-fork
+    """
+
+    # the engines by database url and the process which created them
+    engines: dict[str, Engine] = {}
+    engine_pid: Optional[int] = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_engine(db_path: str, metadata: Optional[MetaData] = None) -> Engine:
+        """Get the engine of a database, creating it if it doesn't exist in this process.
+
+        Args:
+            db_path (str): the url of the database
+            metadata (MetaData, optional): the metadata of the tables to be created when
+                the engine is created. Defaults to None.
+
+        Returns:
+            Engine: the engine shared by all callers in this process
+        """
+        if EngineRegistry.engine_pid == os.getpid():
+            engine = EngineRegistry.engines.get(db_path)
+            if engine is not None:
+                return engine
+
+        with EngineRegistry._lock:
+            if EngineRegistry.engine_pid != os.getpid():
+                # the engines were created by the parent process, their connections
+                # belong to the parent and must not be closed by this process
+                for engine in EngineRegistry.engines.values():
+                    engine.dispose(close=False)
+                EngineRegistry.engines = {}
+                EngineRegistry.engine_pid = os.getpid()
+
+            engine = EngineRegistry.engines.get(db_path)
+            if engine is None:
+                engine = EngineRegistry._create_engine(db_path)
+                if metadata is not None:
+                    metadata.create_all(engine, checkfirst=True)
+                EngineRegistry.engines = {**EngineRegistry.engines, db_path: engine}
+            return engine
+
+    @staticmethod
+    def _create_engine(db_path: str) -> Engine:
+        """Create a pooled engine, sqlite databases use WAL mode and cache prepared statements"""
+        if not db_path.startswith("sqlite"):
+            return create_engine(db_path, max_overflow=-1)
+
+        # the pool never blocks, connections exceeding the pool size are closed when
+        # they are returned as sessions of controllers may hold a connection for their lifetime
+        engine = create_engine(
+            db_path,
+            max_overflow=-1,
+            connect_args={
+                "check_same_thread": False,
+                "cached_statements": SQLITE_CACHED_STATEMENTS,
+            },
+        )
+
+        @event.listens_for(engine, "connect")
+        def set_sqlite_pragma(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.close()
+
+        return engine
+
+    @staticmethod
+    def dispose_engine(db_path: str):
+        """Close all connections of the engine of a database and remove it from the registry.
+
+        Args:
+            db_path (str): the url of the database
+        """
+        with EngineRegistry._lock:
+            engines = dict(EngineRegistry.engines)
+            engine = engines.pop(db_path, None)
+            EngineRegistry.engines = engines
+        if engine is not None:
+            engine.dispose()
+
+    @staticmethod
+    def dispose_engines(path: Union[str, PurePath]):
+        """Dispose the engines of all sqlite databases stored under the given path, this must be
+        called before the databases are deleted (e.g. when a component is removed).
+
+        Args:
+            path (Union[str, PurePath]): the directory containing the databases
+        """
+        path = PurePath(os.path.abspath(path))
+        for db_path, engine in list(EngineRegistry.engines.items()):
+            database = engine.url.database
+            if not database or engine.url.get_backend_name() != "sqlite":
+                continue
+            if PurePath(os.path.abspath(database)).is_relative_to(path):
+                EngineRegistry.dispose_engine(db_path)
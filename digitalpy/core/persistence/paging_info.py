@@ -37,6 +37,9 @@ class PagingInfo:
             self.page_size = sys.maxsize
         
         self.ignore_total_count = ignore_total_count
+        self.offset = 0
+        self.page = 1
+        self.total_count = 0
 
     def get_offset(self) -> Any:
         """_get the current offset.
@@ -1,36 +1,30 @@
-from abc import ABC, abstractmethod
-from digitalpy.core.persistence.ObjectId import ObjectId
+from abc import abstractmethod
+
+from digitalpy.core.domain.object_id import ObjectId
+from digitalpy.core.persistence.persistent_object import PersistentObject
+from digitalpy.core.query.search import Search
+
+
+class IndexedSearch(Search):
+    """IndexedSearch defines the interface for searches which maintain an index of the
+    searchable objects"""
 
-class IndexedSearch(ABC):
-    @abstractmethod
-    def check(self, word: str) -> bool:
-        pass
-    
-    @abstractmethod
-    def find(self, searchTerm: str, pagingInfo: 'PagingInfo'=None, createSummary: bool=True) -> dict:
-        pass
-    
-    @abstractmethod
-    def isSearchable(self, obj: 'PersistentObject') -> bool:
-        pass
-    
-    @abstractmethod
-    def resetIndex(self):
-        pass
-    
     @abstractmethod
-    def addToIndex(self, obj: 'PersistentObject'):
-        pass
-    
+    def reset_index(self):
+        """remove all objects from the index"""
+
     @abstractmethod
-    def deleteFromIndex(self, oid: ObjectId):
-        pass
-    
+    def add_to_index(self, obj: PersistentObject):
+        """add an object to the index or update its entry"""
+
     @abstractmethod
-    def commitIndex(self, optimize: bool=True):
-        pass
-    
+    def delete_from_index(self, oid: ObjectId):
+        """remove an object from the index"""
+
     @abstractmethod
-    def optimizeIndex(self):
-        pass
+    def commit_index(self, optimize: bool = True):
+        """persist the changes to the index"""
 
+    @abstractmethod
+    def optimize_index(self):
+        """optimize the index for searching"""
@@ -0,0 +1 @@
+"""This core package includes the abstract classes necessary to search persistent objects and the base implementation."""
@@ -0,0 +1,373 @@
+"""This module contains the InvertedIndexSearch, an in process implementation of the
+IndexedSearch keeping an inverted index over configured attributes of persistent objects."""
+
+import bisect
+import os
+import pickle
+import re
+import threading
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+from sqlalchemy import inspect
+
+from digitalpy.core.domain.object_id import ObjectId
+from digitalpy.core.persistence.paging_info import PagingInfo
+from digitalpy.core.persistence.persistent_object import PersistentObject
+from digitalpy.core.query.IndexedSearch import IndexedSearch
+
+# a clause of a search term, either attribute:value, attribute:prefix* or
+# attribute:[low TO high] where the attribute and either bound may be omitted
+CLAUSE_PATTERN = re.compile(
+    r'(?:(?P<attribute>[\w.]+):)?(?:\[(?P<low>\S*) TO (?P<high>\S*)\]|(?P<term>"[^"]*"|\S+))'
+)
+
+# the unbounded end of a range in a search term
+UNBOUNDED = "*"
+
+
+def _get_type(obj: Any) -> str:
+    """the type of an indexed object, the records of the sqlalchemy persistence are typed
+    by their class"""
+    if isinstance(obj, PersistentObject):
+        return obj.get_type()
+    return type(obj).__name__
+
+
+def _get_oid(obj: Any) -> str:
+    """the id of an indexed object, the records of the sqlalchemy persistence are
+    identified by their primary key"""
+    if isinstance(obj, PersistentObject):
+        return str(obj.get_oid())
+    return ",".join(str(key) for key in inspect(obj).identity)
+
+
+def _get_attributes(attributes: Union[Iterable[str], str]) -> List[str]:
+    """the list of attributes, either given as an iterable or comma separated"""
+    if isinstance(attributes, str):
+        return [attribute.strip() for attribute in attributes.split(",") if attribute.strip()]
+    return list(attributes)
+
+
+def _sort_key(value: Any) -> Tuple[int, Any]:
+    """the key ordering the terms of an attribute, numbers are ordered before strings
+    which are ordered before any other value"""
+    if isinstance(value, (int, float)):
+        return (0, value)
+    if isinstance(value, str):
+        return (1, value)
+    return (2, str(value))
+
+
+class InvertedIndexSearch(IndexedSearch):
+    """InvertedIndexSearch keeps an inverted index from the values of the indexed attributes
+    of persistent objects to their object ids. The index supports term, prefix and range
+    queries on single attributes, the results are paged by a PagingInfo.
+
+    The index is kept up to date by registering it with the save and delete hooks of the
+    persistence facade, it is written to the index path when committed and read from it
+    when created.
+    """
+
+    def __init__(
+        self,
+        indexed_attributes: Optional[Dict[str, List[str]]] = None,
+        index_path: Optional[str] = None,
+    ):
+        """
+        Args:
+            indexed_attributes (Dict[str, List[str]], optional): the indexed attributes by
+                object type. Defaults to None.
+            index_path (str, optional): the file the index is written to by commit_index,
+                the index is only kept in memory if None. Defaults to None.
+        """
+        self.indexed_attributes: Dict[str, List[str]] = {
+            object_type: _get_attributes(attributes)
+            for object_type, attributes in (indexed_attributes or {}).items()
+        }
+        self.index_path = index_path or None
+        # the object ids by value by attribute
+        self.terms: Dict[str, Dict[Any, Dict[str, None]]] = {}
+        # the indexed values and type by object id
+        self.documents: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        # the ordered values of the attributes, rebuilt when the values of an attribute changed
+        self.sorted_terms: Dict[str, List[Tuple[Tuple[int, Any], Any]]] = {}
+        self._lock = threading.RLock()
+        if self.index_path is not None and os.path.exists(self.index_path):
+            self._load_snapshot()
+
+    def add_indexed_type(self, object_type: str, attributes: Union[Iterable[str], str]):
+        """index the given attributes of the objects of a type
+
+        Args:
+            object_type (str): the type of the objects
+            attributes (Union[Iterable[str], str]): the names of the indexed attributes,
+                either as an iterable or comma separated
+        """
+        with self._lock:
+            self.indexed_attributes[object_type] = _get_attributes(attributes)
+
+    def register(self, persistence_facade):
+        """keep the index up to date with the objects saved and deleted through the
+        persistence facade
+
+        Args:
+            persistence_facade (DefaultPersistenceFacade): the persistence facade
+        """
+        # the index is registered once by every component persisting indexed objects
+        if self.add_to_index not in persistence_facade.save_hooks:
+            persistence_facade.add_save_hook(self.add_to_index)
+        if self.delete_from_index not in persistence_facade.delete_hooks:
+            persistence_facade.add_delete_hook(self.delete_from_index)
+
+    def check(self, word: str) -> Union[bool, str]:
+        if not isinstance(word, str) or not word.strip():
+            return "the search term must not be empty"
+        return True
+
+    def is_searchable(self, obj: PersistentObject) -> bool:
+        return _get_type(obj) in self.indexed_attributes
+
+    def reset_index(self):
+        with self._lock:
+            self.terms = {}
+            self.documents = {}
+            self.sorted_terms = {}
+
+    def add_to_index(self, obj: PersistentObject):
+        if not self.is_searchable(obj):
+            return
+        object_type = _get_type(obj)
+        values = {}
+        for attribute in self.indexed_attributes[object_type]:
+            value = getattr(obj, attribute, None)
+            if value is None:
+                continue
+            if not isinstance(value, Hashable):
+                value = str(value)
+            values[attribute] = value
+        oid = _get_oid(obj)
+        with self._lock:
+            self._remove_document(oid)
+            self.documents[oid] = (object_type, values)
+            for attribute, value in values.items():
+                attribute_terms = self.terms.setdefault(attribute, {})
+                if value not in attribute_terms:
+                    attribute_terms[value] = {}
+                    self.sorted_terms.pop(attribute, None)
+                attribute_terms[value][oid] = None
+
+    def delete_from_index(self, oid: ObjectId):
+        with self._lock:
+            self._remove_document(str(oid))
+
+    def _remove_document(self, oid: str):
+        document = self.documents.pop(oid, None)
+        if document is None:
+            return
+        for attribute, value in document[1].items():
+            attribute_terms = self.terms[attribute]
+            oids = attribute_terms[value]
+            oids.pop(oid, None)
+            if not oids:
+                del attribute_terms[value]
+                self.sorted_terms.pop(attribute, None)
+
+    def commit_index(self, optimize: bool = True):
+        if optimize:
+            self.optimize_index()
+        if self.index_path is None:
+            return
+        with self._lock:
+            snapshot = pickle.dumps(
+                (self.indexed_attributes, self.documents), protocol=pickle.HIGHEST_PROTOCOL
+            )
+        # replace the snapshot atomically so that a failed write never loses the index
+        temporary_path = f"{self.index_path}.tmp"
+        with open(temporary_path, "wb") as snapshot_file:
+            snapshot_file.write(snapshot)
+        os.replace(temporary_path, self.index_path)
+
+    def optimize_index(self):
+        with self._lock:
+            for attribute in self.terms:
+                self._get_sorted_terms(attribute)
+
+    def _load_snapshot(self):
+        with open(self.index_path, "rb") as snapshot_file:
+            indexed_attributes, documents = pickle.load(snapshot_file)
+        for object_type, attributes in indexed_attributes.items():
+            self.indexed_attributes.setdefault(object_type, attributes)
+        for oid, (object_type, values) in documents.items():
+            self.documents[oid] = (object_type, values)
+            for attribute, value in values.items():
+                self.terms.setdefault(attribute, {}).setdefault(value, {})[oid] = None
+
+    def _get_sorted_terms(self, attribute: str) -> List[Tuple[Tuple[int, Any], Any]]:
+        sorted_terms = self.sorted_terms.get(attribute)
+        if sorted_terms is None:
+            sorted_terms = sorted(
+                ((_sort_key(value), value) for value in self.terms.get(attribute, {})),
+                key=lambda term: term[0],
+            )
+            self.sorted_terms[attribute] = sorted_terms
+        return sorted_terms
+
+    def find_term(self, attribute: str, value: Any) -> List[str]:
+        """get the ids of the objects whose attribute equals the value
+
+        Args:
+            attribute (str): the name of the attribute
+            value (Any): the value of the attribute
+
+        Returns:
+            List[str]: the object ids in the order they were indexed
+        """
+        with self._lock:
+            return list(self.terms.get(attribute, {}).get(value, ()))
+
+    def find_prefix(self, attribute: str, prefix: str) -> List[str]:
+        """get the ids of the objects whose string attribute starts with the prefix
+
+        Args:
+            attribute (str): the name of the attribute
+            prefix (str): the prefix of the attribute
+
+        Returns:
+            List[str]: the object ids ordered by the value of the attribute
+        """
+        with self._lock:
+            sorted_terms = self._get_sorted_terms(attribute)
+            start = bisect.bisect_left(sorted_terms, (1, prefix), key=lambda term: term[0])
+            oids = []
+            for _, value in sorted_terms[start:]:
+                if not isinstance(value, str) or not value.startswith(prefix):
+                    break
+                oids.extend(self.terms[attribute][value])
+            return oids
+
+    def find_range(
+        self,
+        attribute: str,
+        low: Any = None,
+        high: Any = None,
+        include_low: bool = True,
+        include_high: bool = True,
+    ) -> List[str]:
+        """get the ids of the objects whose attribute is within the range
+
+        Args:
+            attribute (str): the name of the attribute
+            low (Any, optional): the lower bound, unbounded if None. Defaults to None.
+            high (Any, optional): the upper bound, unbounded if None. Defaults to None.
+            include_low (bool, optional): whether the lower bound is included. Defaults to True.
+            include_high (bool, optional): whether the upper bound is included. Defaults to True.
+
+        Returns:
+            List[str]: the object ids ordered by the value of the attribute
+        """
+        with self._lock:
+            sorted_terms = self._get_sorted_terms(attribute)
+            start, end = 0, len(sorted_terms)
+            if low is not None:
+                search = bisect.bisect_left if include_low else bisect.bisect_right
+                start = search(sorted_terms, _sort_key(low), key=lambda term: term[0])
+            if high is not None:
+                search = bisect.bisect_right if include_high else bisect.bisect_left
+                end = search(sorted_terms, _sort_key(high), key=lambda term: term[0])
+            oids = []
+            for _, value in sorted_terms[start:end]:
+                oids.extend(self.terms[attribute][value])
+            return oids
+
+    def find(
+        self,
+        search_term: str,
+        paging_info: Optional[PagingInfo] = None,
+        create_summary: bool = True,
+    ) -> Dict[str, Dict[str, Any]]:
+        """find the objects matching all clauses of the search term, a clause is either
+        attribute:value, attribute:prefix* or attribute:[low TO high] where * is an unbounded
+        end of the range. Clauses without an attribute match any indexed attribute.
+
+        Args:
+            search_term (str): the search term
+            paging_info (PagingInfo, optional): the page of the hits to be returned, the
+                total count of the hits is set on it. Defaults to None.
+            create_summary (bool, optional): whether to add the indexed values of the
+                objects to the hits. Defaults to True.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: the hits by object id, a hit holds the oid and the
+                type of the object and the summary if requested
+        """
+        valid = self.check(search_term)
+        if valid is not True:
+            raise ValueError(valid)
+
+        hits: Optional[Dict[str, None]] = None
+        for clause in CLAUSE_PATTERN.finditer(search_term):
+            attribute = clause.group("attribute")
+            attributes = [attribute] if attribute else list(self.terms)
+            matches: Dict[str, None] = {}
+            for attribute in attributes:
+                matches.update(dict.fromkeys(self._find_clause(attribute, clause)))
+            hits = matches if hits is None else {oid: None for oid in hits if oid in matches}
+
+        oids = list(hits or {})
+        if paging_info is not None:
+            paging_info.set_total_count(len(oids))
+            offset = paging_info.get_offset()
+            oids = oids[offset : offset + paging_info.get_page_size()]
+
+        result = {}
+        with self._lock:
+            for oid in oids:
+                document = self.documents.get(oid)
+                if document is None:
+                    continue
+                hit = {"oid": oid, "type": document[0]}
+                if create_summary:
+                    hit["summary"] = dict(document[1])
+                result[oid] = hit
+        return result
+
+    def _find_clause(self, attribute: str, clause: re.Match) -> List[str]:
+        term = clause.group("term")
+        if term is None:
+            low = self._parse_value(clause.group("low"))
+            high = self._parse_value(clause.group("high"))
+            return self.find_range(attribute, low, high)
+        if term.startswith('"') and term.endswith('"') and len(term) > 1:
+            return self.find_term(attribute, term[1:-1])
+        if term.endswith(UNBOUNDED) and len(term) > 1:
+            return self.find_prefix(attribute, term[:-1])
+        value = self._parse_value(term)
+        oids = self.find_term(attribute, value)
+        if value != term:
+            # the term may also be the string value of the attribute
+            oids = oids + [oid for oid in self.find_term(attribute, term) if oid not in oids]
+        return oids
+
+    @staticmethod
+    def _parse_value(value: str) -> Any:
+        """parse a value of a search term, numbers are compared as numbers"""
+        if value == UNBOUNDED:
+            return None
+        for parse in (int, float):
+            try:
+                return parse(value)
+            except ValueError:
+                pass
+        return value
+
+    def __getstate__(self):
+        """the index is pickled with the persistence facade it is registered with, the lock
+        belongs to the process"""
+        with self._lock:
+            state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
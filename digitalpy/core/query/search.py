@@ -1,11 +1,34 @@
-import typing
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Union
 
-class Search:
+from digitalpy.core.persistence.paging_info import PagingInfo
+from digitalpy.core.persistence.persistent_object import PersistentObject
+
+
+class Search(ABC):
+    """Search defines the interface for classes that search for persistent objects"""
+
+    @abstractmethod
     def check(self, word: str) -> Union[bool, str]:
-        pass
+        """check if the given word is a valid search term
+
+        Returns:
+            Union[bool, str]: True if the word is valid, an error message otherwise
+        """
+
+    @abstractmethod
+    def find(
+        self,
+        search_term: str,
+        paging_info: Optional[PagingInfo] = None,
+        create_summary: bool = True,
+    ) -> Dict[str, Dict[str, Any]]:
+        """search for objects matching the search term
 
-    def find(self, searchTerm: str, pagingInfo: Optional[PagingInfo]=None, createSummary: bool=True) -> Dict[int, Dict[str, Union[int, str]]]:
-        pass
+        Returns:
+            Dict[str, Dict[str, Any]]: the hits by object id
+        """
 
-    def isSearchable(self, obj: PersistentObject) -> bool:
-        pass
+    @abstractmethod
+    def is_searchable(self, obj: PersistentObject) -> bool:
+        """check if the given object is searchable"""
@@ -3,10 +3,10 @@ from typing import Any, Dict, Union
 from digitalpy.core.main.controller import (
     Controller,
 )
-from digitalpy.core.domain.relationship import Relationship
 from digitalpy.core.domain.node import Node
 from digitalpy.core.parsing.load_configuration import ModelConfiguration as LoadConf
 from digitalpy.core.domain.domain_facade import Domain
+from digitalpy.core.serialization.controllers.serialization_plan import SerializationPlan
 from copy import deepcopy
 import json
 
@@ -14,11 +14,9 @@ import json
 class JSONSerializationController(Controller):
     """The JSONSerializationController class is responsible for serializing and deserializing nodes to and from JSON strings"""
 
-    # this is a class variable that is used to keep track of the nodes that are being serialized to prevent infinite recursion
-    serializing = []
-
     def __init__(self, request, response, sync_action_mapper, configuration) -> None:
-        JSONSerializationController.serializing = []
+        # the identities of the nodes being serialized by the current call to prevent infinite recursion
+        self.serializing: set[int] = set()
         super().__init__(sync_action_mapper, request, response, configuration)
         self.domain_controller = Domain(
             sync_action_mapper, request, response, configuration
@@ -61,12 +59,11 @@ class JSONSerializationController(Controller):
     def add_value_to_node(self, key, value, node: Node):
         """add a value to a node object"""
 
+        current_value = getattr(node, key, None)
+
         # handles the case in which the value is a dictionary and the node attribute is a node
-        if isinstance(value, dict) and (
-            isinstance(getattr(node, key, None), Node)
-            or isinstance(getattr(node, key, None), list)
-        ):
-            self._deserialize(value, getattr(node, key))
+        if isinstance(value, dict) and isinstance(current_value, (Node, list)):
+            self._deserialize(value, current_value)
 
         # handles the case in which the value is a dictionary and the node attribute is not yet initialized such as in the case of an optional
         # attribute
@@ -84,15 +81,15 @@ class JSONSerializationController(Controller):
         # handles the case in which the value is a list and the node attribute is a list
         elif (
             isinstance(value, list)
-            and isinstance(getattr(node, key, None), list)
-            and isinstance(type(node).__dict__[key], Relationship)
+            and isinstance(current_value, list)
+            and SerializationPlan.get_plan(type(node)).is_relationship(key)
         ):
             # add all mandatory nodes
-            for i in range(len(getattr(node, key))):
-                self._deserialize(value[i], getattr(node, key)[i])
+            for i in range(len(current_value)):
+                self._deserialize(value[i], current_value[i])
 
             # add all optional nodes
-            for i in range(len(getattr(node, key)), len(value)):
+            for i in range(len(current_value), len(value)):
                 new_node = self.domain_controller.create_node(
                     node._model_configuration,
                     node._model_configuration.elements[node.__class__.__name__]
@@ -114,6 +111,7 @@ class JSONSerializationController(Controller):
             node (Node): the node to be serialized to xml
         """
         messages = []
+        self.serializing = set()
         if isinstance(message, list):
             messages = [
                 self._serialize_node(node, node.__class__.__name__.lower())
@@ -138,17 +136,17 @@ class JSONSerializationController(Controller):
             Union[str, Dict]: the original call to this method returns a string representing the xml
                 the Element is only returned in the case of recursive calls
         """
-        if node.oid in JSONSerializationController.serializing:
+        if id(node) in self.serializing:
             return None
-        JSONSerializationController.serializing.append(node.oid)
+        self.serializing.add(id(node))
         json_data = {}
 
-        for attrib_name in node.get_properties():
-            # below line is required because get_all_properties function returns only cot property names
-            value = getattr(node, attrib_name)
+        for accessor in SerializationPlan.get_plan(type(node)).get_properties(node):
+            attrib_name = accessor.name
+            value = accessor.get(node)
 
             # if the value is a nonetype, skip it
-            if value == None:
+            if value is None:
                 continue
 
             # if the value is an enum, convert it to its basic value
@@ -182,12 +180,8 @@ class JSONSerializationController(Controller):
 
         for child in list(node.get_children().values()):
             self.handle_child(json_data, child, level)
-        if level == 0:
-            JSONSerializationController.serializing.remove(node.oid)
-            return json_data
-        else:
-            JSONSerializationController.serializing.remove(node.oid)
-            return json_data
+        self.serializing.discard(id(node))
+        return json_data
 
     def handle_child(self, json_data, child, level):
         """
@@ -0,0 +1,125 @@
+"""This module contains the SerializationPlan which describes how the nodes of a class are
+serialized and deserialized, plans are generated once per node class and shared by all
+serialization controllers of the process."""
+
+from dataclasses import dataclass
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from digitalpy.core.domain.node import Node
+from digitalpy.core.domain.relationship import Relationship
+
+
+@dataclass(frozen=True)
+class PropertyAccessor:
+    """the accessors of a single property of a node class"""
+
+    name: str
+    getter: Callable[[Node], Any]
+    setter: Optional[Callable[[Node, Any], None]] = None
+
+    def get(self, node: Node) -> Any:
+        return self.getter(node)
+
+    def set(self, node: Node, value: Any):
+        if self.setter is None:
+            raise AttributeError(f"can't set attribute {self.name}")
+        self.setter(node, value)
+
+
+def _dynamic_accessor(name: str) -> PropertyAccessor:
+    return PropertyAccessor(
+        name,
+        lambda node: getattr(node, name),
+        lambda node, value: setattr(node, name, value),
+    )
+
+
+OID_ACCESSOR = PropertyAccessor("oid", Node.oid.fget, Node.oid.fset)
+
+
+class SerializationPlan:
+    """SerializationPlan holds the ordered properties of a node class with their getters and
+    setters and the relationships to the child nodes of the class, it replaces the reflection
+    over the class done by Node.get_properties for every serialized node.
+
+    The properties are those returned by Node.get_properties, classes overriding
+    get_properties are asked for their properties on every call.
+    """
+
+    # the plans by node class, shared by all controllers of the process
+    plans: Dict[type, "SerializationPlan"] = {}
+    _plans_lock = threading.Lock()
+
+    def __init__(self, node_class: type):
+        self.node_class = node_class
+        self.properties: tuple[PropertyAccessor, ...] = tuple(
+            PropertyAccessor(name, attribute.fget, attribute.fset)
+            for name, attribute in node_class.__dict__.items()
+            if isinstance(attribute, property)
+        )
+        self.properties_with_oid = self.properties + (OID_ACCESSOR,)
+        self.relationships: Dict[str, Relationship] = {
+            name: attribute
+            for name, attribute in node_class.__dict__.items()
+            if isinstance(attribute, Relationship)
+        }
+        self.accessors: Dict[str, PropertyAccessor] = {
+            accessor.name: accessor for accessor in self.properties_with_oid
+        }
+        self.dynamic_properties = node_class.get_properties is not Node.get_properties
+
+    @staticmethod
+    def get_plan(node_class: type) -> "SerializationPlan":
+        """get the plan of a node class, the plan is generated on first use
+
+        Args:
+            node_class (type): a subclass of Node
+
+        Returns:
+            SerializationPlan: the plan of the node class
+        """
+        plan = SerializationPlan.plans.get(node_class)
+        if plan is not None:
+            return plan
+        with SerializationPlan._plans_lock:
+            plan = SerializationPlan.plans.get(node_class)
+            if plan is None:
+                plan = SerializationPlan(node_class)
+                # replace the dictionary so that readers never see a partial update
+                SerializationPlan.plans = {**SerializationPlan.plans, node_class: plan}
+        return plan
+
+    def get_properties(self, node: Node) -> tuple[PropertyAccessor, ...]:
+        """get the accessors of the properties of a node in the order of Node.get_properties
+
+        Args:
+            node (Node): an instance of the node class of the plan
+        """
+        if self.dynamic_properties:
+            return tuple(
+                self.accessors.get(name) or _dynamic_accessor(name)
+                for name in node.get_properties()
+            )
+        if node._include_oid is True:
+            return self.properties_with_oid
+        return self.properties
+
+    def get_accessor(self, node: Node, name: str) -> Optional[PropertyAccessor]:
+        """get the accessor of a property of a node, None if the node has no such property
+
+        Args:
+            node (Node): an instance of the node class of the plan
+            name (str): the name of the property
+        """
+        if self.dynamic_properties:
+            if name in node.get_properties():
+                return self.accessors.get(name) or _dynamic_accessor(name)
+            return None
+        if name == "oid" and node._include_oid is not True:
+            return None
+        return self.accessors.get(name)
+
+    def is_relationship(self, name: str) -> bool:
+        """whether the attribute is a relationship to child nodes of the class"""
+        return name in self.relationships
@@ -1,5 +1,7 @@
 """Serialize Container Controller Module."""
 
+from typing import Any, Sequence
+
 from digitalpy.core.zmanager.response import Response
 from digitalpy.core.serialization.controllers.serializer_action_key import (
     SerializerActionKey,
@@ -11,6 +13,8 @@ from digitalpy.core.zmanager.configuration.zmanager_constants import (
     RESPONSE,
     ZMANAGER_MESSAGE_DELIMITER,
     ZMANAGER_MESSAGE_FORMAT,
+    ZMANAGER_MESSAGE_FRAME_COUNT,
+    ZMANAGER_WIRE_FORMAT_VERSION,
 )
 from digitalpy.core.zmanager.controller_message import ControllerMessage
 
@@ -70,3 +74,72 @@ class SerializerContainer:
         self.formatter.deserialize(response)
         response.action_key = action_key
         return response
+
+    def to_zmanager_frames(self, container: ControllerMessage) -> list[bytes]:
+        """Serialize the container to the frames of a multipart ZManager message in the form
+        [topic, message id, header, body]. Unlike to_zmanager_message the body is not
+        copied into a single buffer and the message id and body are never split on the
+        message delimiter. The body is serialized in the format of the container if it is
+        registered with the formatter and otherwise in the ZMANAGER_MESSAGE_FORMAT, so a
+        service or flow can select the format of its messages.
+        """
+        if not container.format or self.formatter.get_format(container.format) is None:
+            container.format = ZMANAGER_MESSAGE_FORMAT
+        message_topic: bytes = self.serializer_action_key.to_topic(container.action_key)
+        self.formatter.serialize(container)
+        header = ZMANAGER_WIRE_FORMAT_VERSION + b" " + container.format.encode()
+        return [message_topic, container.get_id().encode(), header, container.values]
+
+    def split_zmanager_frames(self, frames: Sequence[Any]) -> list[Sequence[Any]]:
+        """Split the frames of a received multipart message into the frames of each
+        contained message. A single frame is a message in the delimited format of
+        to_zmanager_message, otherwise every ZMANAGER_MESSAGE_FRAME_COUNT frames
+        form a message as several messages may be batched together.
+        """
+        if len(frames) == 1:
+            return [frames]
+        if len(frames) % ZMANAGER_MESSAGE_FRAME_COUNT != 0:
+            raise ValueError(
+                f"Invalid number of frames {len(frames)} for a ZManager message"
+            )
+        return [
+            frames[i : i + ZMANAGER_MESSAGE_FRAME_COUNT]
+            for i in range(0, len(frames), ZMANAGER_MESSAGE_FRAME_COUNT)
+        ]
+
+    def from_zmanager_frames(self, frames: Sequence[Any]) -> ControllerMessage:
+        """Deserialize the container from the frames of a ZManager message. The frames can
+        be bytes or zmq frames received with copy=False in which case the body is
+        deserialized from a memoryview of the received frame without copying it.
+        """
+        if len(frames) == 1:
+            return self.from_zmanager_message(bytes(memoryview(frames[0])))
+        request: Request = ObjectFactory.get_new_instance("Request")
+        self._deserialize_frames(request, frames)
+        return request
+
+    def from_zmanager_response_frames(self, frames: Sequence[Any]) -> Response:
+        """Deserialize the container from the frames of a ZManager response."""
+        if len(frames) == 1:
+            return self.from_zmanager_response(bytes(memoryview(frames[0])))
+        response: Response = ObjectFactory.get_new_instance("Response")
+        self._deserialize_frames(response, frames)
+        if response.action_key.config != RESPONSE:
+            raise ValueError("The action key is not a response")
+        return response
+
+    def _deserialize_frames(self, container: ControllerMessage, frames: Sequence[Any]):
+        """Deserialize the frames of a ZManager message into the given container."""
+        topic, message_id, header, body = frames
+        version, message_format = bytes(memoryview(header)).split(b" ", 1)
+        if version != ZMANAGER_WIRE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported ZManager wire format version {version!r}")
+        # the topic has no content appended, so the remainder is discarded
+        action_key, _ = self.serializer_action_key.deserialize_from_topic(
+            bytes(memoryview(topic))
+        )
+        container.format = message_format.decode()
+        container.set_id(bytes(memoryview(message_id)).decode())
+        container.set_values(memoryview(body))
+        self.formatter.deserialize(container)
+        container.action_key = action_key
@@ -12,6 +12,7 @@ from digitalpy.core.domain.node import Node
 from digitalpy.core.parsing.load_configuration import ModelConfiguration as LoadConf
 from digitalpy.core.main.object_factory import ObjectFactory
 from digitalpy.core.domain.domain_facade import Domain
+from digitalpy.core.serialization.controllers.serialization_plan import SerializationPlan
 
 class XMLDeserializer:
     """this class exposes the basic lxml target interface for parsing xml to Node objects"""
@@ -114,9 +115,11 @@ class XMLDeserializer:
             self.curr_object = new_inst
 
         # set the attributes of the current node
+        plan = SerializationPlan.get_plan(type(self.curr_object))
         for key, value in attrib.items():
-            if key in self.curr_object.get_properties():
-                setattr(self.curr_object, key, value)
+            accessor = plan.get_accessor(self.curr_object, key)
+            if accessor is not None:
+                accessor.set(self.curr_object, value)
             else:
                 # if the attribute is not a property of the current node, add it to the xml object
                 pass
@@ -224,9 +227,9 @@ class XMLSerializationController(Controller):
         if hasattr(node, "text"):
             xml.text = str(node.text)
 
-        for attribName in node.get_properties():
-            # below line is required because get_all_properties function returns only cot property names
-            value = getattr(node, attribName)
+        for accessor in SerializationPlan.get_plan(type(node)).get_properties(node):
+            attribName = accessor.name
+            value = accessor.get(node)
             if hasattr(value, "__dict__"):
                 tagElement = self._serialize_node(
                     value, attribName, level=level + 1)
@@ -29,6 +29,9 @@ class Serialization(DefaultFacade):
       </ul>
     """
 
+    # the facade and its controllers keep no state between actions
+    pooled = True
+
     def __init__(
         self,
         serialization_action_mapper,
@@ -9,6 +9,8 @@ process, while the stop_process method is used to stop a running service process
 
 The ServiceManagementProcessController class uses the multiprocessing module to manage service 
 processes,  and handles any exceptions that may occur during the start or stop operations. 
+If a ServiceLauncher is configured the service processes are forked from its template process
+instead.
 It also uses the ObjectFactory class to get instances of required objects, and the 
 ServiceDescription class to describe the services to be managed.
 
@@ -18,12 +20,17 @@ DigitalPyService, and SERVICE_WAIT_TIME.
 """
 
 from multiprocessing import Process
+from typing import Optional
+
 from digitalpy.core.service_management.domain.model.service_status_enum import (
     ServiceStatusEnum,
 )
 from digitalpy.core.digipy_configuration.domain.model.configuration import Configuration
 from digitalpy.core.main.controller import Controller
 from digitalpy.core.service_management.digitalpy_service import DigitalPyService
+from digitalpy.core.service_management.impl.fork_server_launcher import (
+    ForkServerLauncher,
+)
 from digitalpy.core.zmanager.action_mapper import ActionMapper
 from digitalpy.core.zmanager.request import Request
 from digitalpy.core.zmanager.response import Response
@@ -49,6 +56,18 @@ class ServiceManagementProcessController(Controller):
     ):
         super().__init__(request, response, sync_action_mapper, configuration)
 
+    def get_service_launcher(self) -> Optional[ForkServerLauncher]:
+        """get the configured launcher of the service processes
+
+        Returns:
+            Optional[ForkServerLauncher]: the launcher, None if the services are started
+                as new processes
+        """
+        configuration: Configuration = ObjectFactory.get_instance("Configuration")
+        if not configuration.has_section("ServiceLauncher"):
+            return None
+        return ObjectFactory.get_instance("ServiceLauncher")
+
     def start_process(self, service: DigitalPyService):
         """
         Starts a new process for the given service using the provided process class.
@@ -59,7 +78,10 @@ class ServiceManagementProcessController(Controller):
         Raises:
             ChildProcessError: If the service fails to start or if post-processing fails.
         """
-        if service.process is None:
+        launcher = self.get_service_launcher()
+        if service.process is None and launcher is not None:
+            service.process = launcher.create_process(service)
+        elif service.process is None:
             service.process = Process(
                 target=service.start,
                 args=(
@@ -32,11 +32,13 @@ respectively.
 from abc import abstractmethod
 from datetime import datetime
 from multiprocessing import Process
+import os
 import threading
-import time
 import traceback
 from typing import Optional
 
+import zmq
+
 from digitalpy.core.service_management.configuration.message_keys import COMMAND
 from digitalpy.core.digipy_configuration.domain.model.actionkey import ActionKey
 from digitalpy.core.service_management.domain.model.service_status_enum import (
@@ -80,6 +82,14 @@ COMMAND_PROTOCOL = "command"
 COMMAND_ACTION = "ServiceCommand"
 COMPLETED_COMMAND = "completed_command"
 
+# the events sent over the control pipe to wake up the event loop of the service
+CONTROL_STOP = b"stop"
+CONTROL_STATUS = b"status"
+
+# the milliseconds after which the event loop checks the status of the service even if no
+# event was received
+IDLE_TIMEOUT = 1000
+
 
 class DigitalPyService:
     """
@@ -94,6 +104,8 @@ class DigitalPyService:
             values to and from messages.
         service_conf (Service): The configuration of the service.
         error_threshold (float, optional): The error threshold for the service. Defaults to 0.1.
+        poll_interval (int, optional): The milliseconds between two checks of a network which
+            has no sockets to wait for. Defaults to 100.
     """
 
     # TODO: there must be a better solution than passing the service description as a parameter but for now
@@ -108,6 +120,7 @@ class DigitalPyService:
         subject_pusher: SubjectPusher,
         integration_manager_pusher: IntegrationManagerPusher,
         error_threshold: float = 0.1,
+        poll_interval: int = 100,
     ):
         """the constructor for the digitalpy service class
 
@@ -140,6 +153,9 @@ class DigitalPyService:
         self.total_errors = 0
         self.total_request_processing_time = 0
         self.error_threshold = error_threshold
+        # stored apart from the argument, as the factory assigns the configured value
+        # to the attribute named like the argument
+        self._poll_interval = int(poll_interval)
 
         self._process: Optional[Process] = None
 
@@ -147,6 +163,15 @@ class DigitalPyService:
 
         self.stop_event: threading.Event
 
+        # the poller and control pipe of the event loop, created by the process running
+        # the event loop
+        self._poller: Optional[zmq.Poller] = None
+        self._control_context: Optional[zmq.Context] = None
+        self._control_receiver: Optional[zmq.Socket] = None
+        self._control_sender: Optional[zmq.Socket] = None
+        self._control_pid: Optional[int] = None
+        self._control_lock = threading.Lock()
+
     def handle_connection(self, message: Request):
         """register a client with the server. This method should be called when a client connects to the server
         so that it can be registered with the IAM component.
@@ -223,6 +248,11 @@ class DigitalPyService:
     @status.setter
     def status(self, status: str):
         self._service_conf.status = status
+        self.notify_event_loop(
+            CONTROL_STOP
+            if status != ServiceStatusEnum.RUNNING.value
+            else CONTROL_STATUS
+        )
 
     @property
     def tracer(self) -> Tracer:
@@ -301,45 +331,106 @@ class DigitalPyService:
             self.protocol.send_response(response)
 
     def event_loop(self):
-        """Runs the service using threading with graceful shutdown."""
-        # Create threads for handle_network and fetch_integration_manager_response
-        thread_handle_network = threading.Thread(target=self.run_handle_network)
-        thread_fetch_integration_manager_response = threading.Thread(
-            target=self.run_fetch_integration_manager_responses
-        )
-
-        # Start the threads
-        thread_handle_network.start()
-        thread_fetch_integration_manager_response.start()
+        """Runs the service in a single reactor which waits for the sockets of the network,
+        the integration manager subscriber and the control pipe of the service at once,
+        so that responses, commands and status changes are handled as soon as they arrive.
+        """
+        self._open_event_loop()
+        subscriber_socket = self._integration_manager_subscriber.subscriber_socket
+        network_sockets = self.protocol.get_poll_sockets() if self.protocol else []
+        self._poller.register(subscriber_socket, zmq.POLLIN)
+        for network_socket in network_sockets:
+            self._poller.register(network_socket, zmq.POLLIN)
+        # a network without sockets can only be checked periodically
+        timeout = IDLE_TIMEOUT if network_sockets else self._poll_interval
 
-        # Keep main thread alive, wait for service to stop
         try:
             while self.status == ServiceStatusEnum.RUNNING.value:
-                time.sleep(10)
-        except Exception as e:
-            print("Shutting down..." + str(e))
+                events = dict(self._poller.poll(timeout))
+                if self._control_receiver in events:
+                    self._receive_control_events()
+                if subscriber_socket in events:
+                    self.fetch_integration_manager_responses()
+                if not network_sockets or any(
+                    network_socket in events for network_socket in network_sockets
+                ):
+                    self.handle_network()
         finally:
             self.stop_event.set()
-            thread_handle_network.join()
-            thread_fetch_integration_manager_response.join()
+            self._close_event_loop()
 
         if self.status == ServiceStatusEnum.STOPPED.value:
             self.stop()
             exit(0)
 
-    def run_handle_network(self):
-        """Continuously handles network requests."""
-        while not self.stop_event.is_set():
-            self.handle_network(blocking=True, timeout=-1)
+    def notify_event_loop(self, event: bytes = CONTROL_STATUS):
+        """wake up the event loop of the service, safe to call from any thread of the
+        process running the event loop.
 
-    def run_fetch_integration_manager_responses(self):
-        """Continuously fetches and processes integration manager responses."""
-        while not self.stop_event.is_set():
+        Args:
+            event (bytes, optional): the control event. Defaults to CONTROL_STATUS.
+        """
+        with self._control_lock:
+            # the control pipe doesn't exist in a forked process
+            if self._control_sender is None or self._control_pid != os.getpid():
+                return
+            try:
+                self._control_sender.send(event, zmq.NOBLOCK)
+            except zmq.Again:
+                # the event loop already has pending events to wake it up
+                pass
+
+    def _open_event_loop(self):
+        """create the poller and the control pipe of the event loop"""
+        with self._control_lock:
+            self._control_context = zmq.Context()
+            address = f"inproc://digitalpy-service-control-{self.service_id}"
+            self._control_receiver = self._control_context.socket(zmq.PAIR)
+            self._control_receiver.setsockopt(zmq.LINGER, 0)
+            self._control_receiver.bind(address)
+            self._control_sender = self._control_context.socket(zmq.PAIR)
+            self._control_sender.setsockopt(zmq.LINGER, 0)
+            self._control_sender.connect(address)
+            self._control_pid = os.getpid()
+            self._poller = zmq.Poller()
+            self._poller.register(self._control_receiver, zmq.POLLIN)
+
+    def _close_event_loop(self):
+        """close the control pipe of the event loop"""
+        with self._control_lock:
+            if self._control_context is not None and self._control_pid == os.getpid():
+                self._control_context.destroy(linger=0)
+            self._poller = None
+            self._control_context = None
+            self._control_receiver = None
+            self._control_sender = None
+            self._control_pid = None
+
+    def _receive_control_events(self) -> list[bytes]:
+        """receive the pending control events, the event loop checks the status of the
+        service after every wake up"""
+        control_events = []
+        while True:
+            try:
+                control_events.append(self._control_receiver.recv(zmq.NOBLOCK))
+            except zmq.Again:
+                return control_events
+
+    def fetch_integration_manager_responses(self, max_responses: int = 1000):
+        """handle the responses already received from the integration manager
+
+        Args:
+            max_responses (int, optional): the maximum number of responses handled at once,
+                so that the network is not starved. Defaults to 1000.
+        """
+        subscriber_socket = self._integration_manager_subscriber.subscriber_socket
+        for _ in range(max_responses):
+            if not subscriber_socket.get(zmq.EVENTS) & zmq.POLLIN:
+                return
             result = (
                 self._integration_manager_subscriber.fetch_integration_manager_response()
             )
             if result:
-                print("Response received")
                 self.response_handler(result)
 
     def handle_network(self, blocking: bool = False, timeout: int = 0):
@@ -536,3 +627,28 @@ class DigitalPyService:
                 self.event_loop()
             except Exception as ex:
                 self.handle_exception(ex)
+
+    def __getstate__(self):
+        """the process handle, the poller and control pipe of the event loop are not shared
+        with other processes, they are created by the process running the event loop"""
+        state = self.__dict__.copy()
+        state["_process"] = None
+        for key in (
+            "_poller",
+            "_control_context",
+            "_control_receiver",
+            "_control_sender",
+            "_control_pid",
+            "_control_lock",
+        ):
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._poller = None
+        self._control_context = None
+        self._control_receiver = None
+        self._control_sender = None
+        self._control_pid = None
+        self._control_lock = threading.Lock()
@@ -0,0 +1,329 @@
+"""This module contains the ForkServerLauncher which starts the processes of the services
+by forking them from a template process, together with the ForkedServiceProcess handle
+of such a process.
+
+The template process is forked from the service manager once the components are
+registered, it holds a snapshot of the object factory, the tracing provider and the
+configuration factory as a service process started by multiprocessing would receive them.
+Starting a service only sends the pickled service over a pipe to the template, which
+forks the service process from its warm state instead of importing and initializing the
+components again.
+"""
+
+import importlib
+import multiprocessing
+import os
+import pickle
+import signal
+import sys
+import threading
+import time
+import traceback
+from multiprocessing.connection import Connection
+from typing import Dict, List, Optional, Union
+
+from digitalpy.core.main.object_factory import ObjectFactory
+from digitalpy.core.main.singleton_configuration_factory import (
+    SingletonConfigurationFactory,
+)
+from digitalpy.core.service_management.digitalpy_service import DigitalPyService
+
+# the commands sent to the template process
+START = "start"
+EXITCODE = "exitcode"
+
+# the seconds between two checks of the exit code of a service process being joined
+JOIN_INTERVAL = 0.05
+
+
+class ForkedServiceProcess:
+    """the handle of a service process forked by the template process of a
+    ForkServerLauncher, it provides the methods of a multiprocessing.Process used to
+    manage the process of a service"""
+
+    def __init__(self, launcher: "ForkServerLauncher", service: DigitalPyService):
+        self.launcher = launcher
+        self.service = service
+        self.name = f"ForkedServiceProcess-{service.service_id}"
+        self.pid: Optional[int] = None
+        self._exitcode: Optional[int] = None
+
+    def start(self):
+        """fork the service process from the template process"""
+        if self.pid is not None:
+            raise AssertionError("cannot start a process twice")
+        self.pid = self.launcher.fork_service(self.service)
+
+    @property
+    def exitcode(self) -> Optional[int]:
+        """the exit code of the process, None while the process is running"""
+        if self.pid is not None and self._exitcode is None:
+            self._exitcode = self.launcher.get_exitcode(self.pid)
+        return self._exitcode
+
+    def is_alive(self) -> bool:
+        return self.pid is not None and self.exitcode is None
+
+    def join(self, timeout: Optional[float] = None):
+        """wait until the process exited or the timeout passed"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.is_alive():
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            time.sleep(JOIN_INTERVAL)
+
+    def terminate(self):
+        self._signal(signal.SIGTERM)
+
+    def kill(self):
+        self._signal(signal.SIGKILL)
+
+    def _signal(self, signum: int):
+        if self.is_alive():
+            try:
+                os.kill(self.pid, signum)
+            except ProcessLookupError:
+                pass
+
+
+class ForkServerLauncher:
+    """ForkServerLauncher starts the processes of the services by forking them from a
+    template process with the preloaded components and configuration. The template
+    process is started with the first service and restarted when a service is started
+    after the configuration changed, it is only supported on platforms which can fork.
+    """
+
+    def __init__(self, preload: Union[List[str], str, None] = None):
+        """
+        Args:
+            preload (Union[List[str], str], optional): the modules imported by the template
+                process in addition to the modules of the service manager, either as a list
+                or comma separated. Defaults to None.
+        """
+        if isinstance(preload, str):
+            preload = [module.strip() for module in preload.split(",") if module.strip()]
+        # stored apart from the argument, as the factory assigns the configured value
+        # to the attribute named like the argument
+        self.preload_modules: List[str] = list(preload or [])
+        self.template: Optional[multiprocessing.Process] = None
+        self._template_parent_pid: Optional[int] = None
+        # the revision of the configuration the template process was started with
+        self._template_revision: Optional[int] = None
+        self._connection: Optional[Connection] = None
+        self._lock = threading.Lock()
+
+    def create_process(self, service: DigitalPyService) -> ForkedServiceProcess:
+        """create the handle of a process of the service, the process is forked once the
+        handle is started
+
+        Args:
+            service (DigitalPyService): the service run by the process
+
+        Returns:
+            ForkedServiceProcess: the handle of the process
+        """
+        return ForkedServiceProcess(self, service)
+
+    def fork_service(self, service: DigitalPyService) -> int:
+        """fork a process running the service from the template process
+
+        Args:
+            service (DigitalPyService): the service run by the process
+
+        Raises:
+            ChildProcessError: if the template process failed
+
+        Returns:
+            int: the pid of the service process
+        """
+        # only the state of the service is sent to the template process
+        service_state = pickle.dumps(service)
+        return self._request(START, service_state)
+
+    def get_exitcode(self, pid: int) -> Optional[int]:
+        """get the exit code of a service process forked by the template process
+
+        Args:
+            pid (int): the pid of the service process
+
+        Returns:
+            Optional[int]: the exit code, None while the process is running
+        """
+        if not self.is_running():
+            # the processes are reaped by the template, without it only the existence of
+            # the process is known
+            return None if _pid_exists(pid) else 1
+        return self._request(EXITCODE, pid)
+
+    def is_running(self) -> bool:
+        # the template process of a forked process belongs to it's parent
+        return (
+            self.template is not None
+            and self._template_parent_pid == os.getpid()
+            and self.template.is_alive()
+        )
+
+    def start(self):
+        """start the template process with a snapshot of the current object factory,
+        tracing provider and configuration factory"""
+        with self._lock:
+            if not self.is_running():
+                self._start_template()
+
+    def shutdown(self):
+        """stop the template process, the running service processes are not stopped"""
+        with self._lock:
+            self._stop_template()
+
+    def _request(self, command: str, argument):
+        with self._lock:
+            if command == START and self.is_running() and self._is_outdated():
+                # the snapshot of the template doesn't reflect the changed configuration
+                self._stop_template()
+            if not self.is_running():
+                self._start_template()
+            try:
+                self._connection.send((command, argument))
+                succeeded, result = self._connection.recv()
+            except (EOFError, OSError) as e:
+                raise ChildProcessError("the template process of the services failed") from e
+        if not succeeded:
+            raise ChildProcessError(result)
+        return result
+
+    def _start_template(self):
+        # the template must be forked to preserve the state of the service manager
+        context = multiprocessing.get_context("fork")
+        self._connection, template_connection = context.Pipe()
+        self.template = context.Process(
+            target=serve_template,
+            args=(
+                template_connection,
+                ObjectFactory.get_instance("factory"),
+                ObjectFactory.get_instance("TracingProvider"),
+                SingletonConfigurationFactory.get_instance(),
+                self.preload_modules,
+            ),
+            name="ForkServerLauncher",
+            daemon=True,
+        )
+        self.template.start()
+        self._template_parent_pid = os.getpid()
+        self._template_revision = self._get_configuration_revision()
+        template_connection.close()
+
+    def _stop_template(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        if self.is_running():
+            self.template.join(1)
+            if self.template.is_alive():
+                self.template.terminate()
+                self.template.join()
+        self.template = None
+
+    def _is_outdated(self) -> bool:
+        return self._template_revision != self._get_configuration_revision()
+
+    @staticmethod
+    def _get_configuration_revision() -> int:
+        return ObjectFactory.get_instance("Configuration").revision
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["template"] = None
+        state["_connection"] = None
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+def serve_template(connection: Connection, factory, tracing_provider, conf_factory, preload: list):
+    """the main function of the template process, it forks a service process for every
+    service received from the launcher and reaps the exited service processes"""
+    # the snapshot has the state a spawned service process would receive, so that the
+    # services don't share the sockets and instances of the service manager
+    snapshot = pickle.loads(pickle.dumps((factory, tracing_provider, conf_factory)))
+    for module in preload:
+        importlib.import_module(module)
+
+    exitcodes: Dict[int, int] = {}
+    children = set()
+    while True:
+        try:
+            command, argument = connection.recv()
+        except (EOFError, OSError):
+            # the launcher was shut down
+            return
+        _reap(children, exitcodes)
+        try:
+            if command == START:
+                pid = os.fork()
+                if pid == 0:
+                    connection.close()
+                    _run_service(argument, snapshot)
+                children.add(pid)
+                connection.send((True, pid))
+            elif command == EXITCODE:
+                if argument in exitcodes:
+                    connection.send((True, exitcodes.pop(argument)))
+                elif argument in children:
+                    connection.send((True, None))
+                else:
+                    # the process was forked by a previous template
+                    connection.send((True, None if _pid_exists(argument) else 1))
+            else:
+                connection.send((False, f"unknown command {command}"))
+        except Exception as e:  # pylint: disable=broad-except
+            connection.send((False, str(e)))
+
+
+def _reap(children: set, exitcodes: Dict[int, int]):
+    for pid in list(children):
+        try:
+            reaped, status = os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            children.discard(pid)
+            continue
+        if reaped:
+            children.discard(pid)
+            exitcodes[pid] = os.waitstatus_to_exitcode(status)
+
+
+def _run_service(service_state: bytes, snapshot: tuple):
+    """run the service in the forked process, the process exits with the service"""
+    exitcode = 1
+    try:
+        # the service process is not a daemon like the template, so it can start processes
+        process = multiprocessing.current_process()
+        process.daemon = False
+        process.name = f"ForkedServiceProcess-{os.getpid()}"
+        service: DigitalPyService = pickle.loads(service_state)
+        service.start(*snapshot)
+        exitcode = 0
+    except SystemExit as e:
+        if e.code is None:
+            exitcode = 0
+        elif isinstance(e.code, int):
+            exitcode = e.code
+    except BaseException:  # pylint: disable=broad-except
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        # the process must not return to the loop of the template
+        os._exit(exitcode)  # pylint: disable=protected-access
+
+
+def _pid_exists(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
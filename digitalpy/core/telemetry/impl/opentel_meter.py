@@ -1,6 +1,7 @@
 # used for type hinting to prevent circular import
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Iterable
+from opentelemetry.metrics import CallbackOptions, Observation
 from digitalpy.core.telemetry.impl.opentel_counter import OpenTelCounter
 
 if TYPE_CHECKING:
@@ -16,3 +17,36 @@ class OpenTelMeter(Meter):
     def create_counter(self, name, description, unit) -> OpenTelCounter:
         """create a new open telemetry counter instance and return it"""
         return OpenTelCounter(self.meter.create_counter(name, description, unit))
+
+    def create_observable_gauge(
+        self,
+        name: str,
+        callback: Callable[[], Iterable[tuple[float, dict]]],
+        description: str,
+        unit: str,
+    ):
+        """register an open telemetry observable gauge observing the values returned by the callback"""
+        return self.meter.create_observable_gauge(
+            name, [self._wrap_callback(callback)], unit, description
+        )
+
+    def create_observable_counter(
+        self,
+        name: str,
+        callback: Callable[[], Iterable[tuple[int, dict]]],
+        description: str,
+        unit: str,
+    ):
+        """register an open telemetry observable counter observing the values returned by the callback"""
+        return self.meter.create_observable_counter(
+            name, [self._wrap_callback(callback)], unit, description
+        )
+
+    @staticmethod
+    def _wrap_callback(callback: Callable[[], Iterable[tuple[float, dict]]]):
+        """convert the values returned by the callback to open telemetry observations"""
+
+        def observe(options: CallbackOptions) -> Iterable[Observation]:
+            return [Observation(value, labels) for value, labels in callback()]
+
+        return observe
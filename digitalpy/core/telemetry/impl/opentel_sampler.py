@@ -0,0 +1,105 @@
+from typing import Dict, Optional, Sequence, Union
+
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace.sampling import (
+    Decision,
+    Sampler,
+    SamplingResult,
+    TraceIdRatioBased,
+)
+from opentelemetry.trace import Link, SpanKind, get_current_span
+from opentelemetry.trace.span import TraceState
+from opentelemetry.util.types import Attributes
+
+
+class ActionKeySampler(Sampler):
+    """head sampler deciding by the trace id whether the span of an action is sampled. The
+    ratio of an action can be overridden by its span name or a prefix of it, e.g. the
+    context of the action. Spans of a sampled parent are always sampled.
+
+    With tail sampling the spans which are not sampled are still recorded, so that the
+    span processor can export them if they turn out to be slow or failed.
+    """
+
+    def __init__(
+        self,
+        ratio: Union[float, str] = 1.0,
+        overrides: Union[Dict[str, float], str, None] = None,
+        tail_sampling: bool = False,
+    ):
+        """
+        Args:
+            ratio (Union[float, str], optional): the ratio of the sampled traces. Defaults to 1.0.
+            overrides (Union[Dict[str, float], str], optional): the ratios by span name or
+                span name prefix, either as a dictionary or in the form
+                "name=ratio, name=ratio". Defaults to None.
+            tail_sampling (bool, optional): whether the spans which are not sampled are
+                recorded. Defaults to False.
+        """
+        # the parsed arguments are stored apart from the arguments, as the factory
+        # assigns the configured values to the attributes named like the arguments
+        self.sampling_ratio = float(ratio)
+        self.ratio_overrides: Dict[str, float] = self._parse_overrides(overrides)
+        self.tail_sampling = bool(tail_sampling)
+        self.default_sampler = TraceIdRatioBased(self.sampling_ratio)
+        # the samplers of the configured ratios and the sampler by span name
+        self._ratio_samplers: Dict[float, TraceIdRatioBased] = {
+            self.sampling_ratio: self.default_sampler
+        }
+        self._name_samplers: Dict[str, TraceIdRatioBased] = {}
+
+    @staticmethod
+    def _parse_overrides(overrides: Union[Dict[str, float], str, None]) -> Dict[str, float]:
+        if not overrides:
+            return {}
+        if isinstance(overrides, str):
+            overrides = dict(
+                override.rsplit("=", 1) for override in overrides.split(",") if override.strip()
+            )
+        return {name.strip(): float(ratio) for name, ratio in overrides.items()}
+
+    def get_sampler(self, name: str) -> TraceIdRatioBased:
+        """get the sampler of the span name, the ratio of the longest matching
+        override is used
+
+        Args:
+            name (str): the name of the span
+
+        Returns:
+            TraceIdRatioBased: the sampler of the span
+        """
+        sampler = self._name_samplers.get(name)
+        if sampler is None:
+            ratio = self.sampling_ratio
+            matches = [prefix for prefix in self.ratio_overrides if name.startswith(prefix)]
+            if matches:
+                ratio = self.ratio_overrides[max(matches, key=len)]
+            sampler = self._ratio_samplers.get(ratio)
+            if sampler is None:
+                sampler = self._ratio_samplers.setdefault(ratio, TraceIdRatioBased(ratio))
+            # the span names are the limited set of actions of the process
+            self._name_samplers[name] = sampler
+        return sampler
+
+    def should_sample(
+        self,
+        parent_context: Optional[Context],
+        trace_id: int,
+        name: str,
+        kind: Optional[SpanKind] = None,
+        attributes: Attributes = None,
+        links: Optional[Sequence[Link]] = None,
+        trace_state: Optional[TraceState] = None,
+    ) -> SamplingResult:
+        parent_span_context = get_current_span(parent_context).get_span_context()
+        if parent_span_context.is_valid and parent_span_context.trace_flags.sampled:
+            return SamplingResult(Decision.RECORD_AND_SAMPLE, attributes, trace_state)
+        result = self.get_sampler(name).should_sample(
+            parent_context, trace_id, name, kind, attributes, links, trace_state
+        )
+        if result.decision is Decision.DROP and self.tail_sampling:
+            return SamplingResult(Decision.RECORD_ONLY, attributes, trace_state)
+        return result
+
+    def get_description(self) -> str:
+        return f"ActionKeySampler{{{self.sampling_ratio}, tail_sampling={bool(self.tail_sampling)}}}"
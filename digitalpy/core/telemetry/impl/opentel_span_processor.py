@@ -0,0 +1,153 @@
+import logging
+import os
+import threading
+from collections import deque
+from typing import Deque, List, Optional, Union
+
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.sdk.trace.export import SpanExporter
+from opentelemetry.trace import StatusCode
+
+logger = logging.getLogger(__name__)
+
+
+class SamplingBatchSpanProcessor(SpanProcessor):
+    """span processor exporting the ended spans in batches from a background thread.
+
+    The spans are queued in a bounded queue, once it is full further spans are dropped
+    and counted so that tracing never blocks the workers. Besides the sampled spans the
+    recorded spans which were not sampled are exported if they were slower than the
+    slow span threshold or failed, this tail sampling requires a sampler which records
+    the spans it does not sample.
+    """
+
+    def __init__(
+        self,
+        span_exporter: SpanExporter,
+        max_queue_size: int = 2048,
+        schedule_delay_millis: Union[float, str] = 5000,
+        max_export_batch_size: int = 512,
+        slow_span_millis: Union[float, str, None] = None,
+        export_errors: bool = True,
+    ):
+        """
+        Args:
+            span_exporter (SpanExporter): the exporter of the batches
+            max_queue_size (int, optional): the number of spans queued before spans are
+                dropped. Defaults to 2048.
+            schedule_delay_millis (float, optional): the time between two exports.
+                Defaults to 5000.
+            max_export_batch_size (int, optional): the maximum number of spans of a batch,
+                a full batch is exported immediately. Defaults to 512.
+            slow_span_millis (float, optional): the duration from which spans which were
+                not sampled are exported. Defaults to None.
+            export_errors (bool, optional): whether failed spans which were not sampled
+                are exported. Defaults to True.
+        """
+        self.span_exporter = span_exporter
+        self.queue_size = int(max_queue_size)
+        self.schedule_delay = float(schedule_delay_millis) / 1e3
+        self.batch_size = int(max_export_batch_size)
+        self.slow_span_nanos = (
+            None if slow_span_millis is None else int(float(slow_span_millis) * 1e6)
+        )
+        self.export_errors = export_errors
+        self.dropped_spans = 0
+        self.queue: Deque[ReadableSpan] = deque()
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_pid: Optional[int] = None
+        self._flush_requested = False
+        self._shutdown = False
+
+    def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:
+        pass
+
+    def on_end(self, span: ReadableSpan) -> None:
+        if self._shutdown or span.context is None:
+            return
+        if not span.context.trace_flags.sampled and not self._keep_unsampled(span):
+            return
+        if len(self.queue) >= self.queue_size:
+            self.dropped_spans += 1
+            return
+        self.queue.append(span)
+        if self._worker is None or self._worker_pid != os.getpid():
+            self._start_worker()
+        if len(self.queue) >= self.batch_size:
+            with self._condition:
+                self._condition.notify()
+
+    def _keep_unsampled(self, span: ReadableSpan) -> bool:
+        """whether a recorded span which was not sampled is exported by tail sampling"""
+        if self.export_errors and span.status.status_code is StatusCode.ERROR:
+            return True
+        return (
+            self.slow_span_nanos is not None
+            and span.end_time is not None
+            and span.end_time - span.start_time >= self.slow_span_nanos
+        )
+
+    def _start_worker(self):
+        with self._condition:
+            # the thread of the worker doesn't exist in a forked process
+            if self._worker is not None and self._worker_pid == os.getpid():
+                return
+            self._worker_pid = os.getpid()
+            self._worker = threading.Thread(
+                target=self._export_batches, name="SamplingBatchSpanProcessor", daemon=True
+            )
+            self._worker.start()
+
+    def _export_batches(self):
+        while True:
+            with self._condition:
+                if (
+                    not self._shutdown
+                    and not self._flush_requested
+                    and len(self.queue) < self.batch_size
+                ):
+                    self._condition.wait(self.schedule_delay)
+                flush = self._flush_requested
+                shutdown = self._shutdown
+            self._export(all_spans=flush or shutdown)
+            with self._condition:
+                if flush:
+                    self._flush_requested = False
+                    self._condition.notify_all()
+            if shutdown:
+                return
+
+    def _export(self, all_spans: bool = False):
+        while self.queue:
+            batch: List[ReadableSpan] = []
+            while self.queue and len(batch) < self.batch_size:
+                batch.append(self.queue.popleft())
+            try:
+                self.span_exporter.export(batch)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("exception while exporting spans")
+            if not all_spans and len(self.queue) < self.batch_size:
+                return
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        if self._worker is None or self._worker_pid != os.getpid():
+            self._export(all_spans=True)
+            return True
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            return self._condition.wait_for(
+                lambda: not self._flush_requested, timeout_millis / 1e3
+            )
+
+    def shutdown(self) -> None:
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+        if self._worker is not None and self._worker_pid == os.getpid():
+            self._worker.join()
+        else:
+            self._export(all_spans=True)
+        self.span_exporter.shutdown()
@@ -1,13 +1,14 @@
+from typing import List
+
 from digitalpy.core.telemetry.tracing_exporter import TracingExporter
+from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
-import json
 
 class OpenTelTracingExporter(TracingExporter):
     def __init__(self, exporter: InMemorySpanExporter):
         self.exporter = exporter
     
-    def get_spans(self):
-        output_spans = []
-        for span in self.exporter.get_finished_spans():
-            output_spans.append(json.loads(span.to_json()))
-        return output_spans
\ No newline at end of file
+    def get_spans(self) -> List[ReadableSpan]:
+        """get the finished spans of the exporter, the spans can be converted with
+        to_json where a serialized form is required"""
+        return list(self.exporter.get_finished_spans())
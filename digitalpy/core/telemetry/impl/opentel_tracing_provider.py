@@ -11,7 +11,8 @@ class OpenTelTracingProvider(TracingProvider):
     """tracing provider implementation for the open telemetry protocol."""
 
     def initialize_tracing(self):
-        self.provider = TracerProvider()
+        self.sampler = ObjectFactory.get_new_instance("TracerSampler")
+        self.provider = TracerProvider(sampler=self.sampler)
         exporter = ObjectFactory.get_new_instance("TracerExporter")
         self.exporter = OpenTelTracingExporter(exporter)
         self.processor = ObjectFactory.get_new_instance(
@@ -0,0 +1,85 @@
+"""This module contains a fixed precision latency histogram in the style of HdrHistogram."""
+
+# the number of bits of precision kept for every value, values are counted in buckets
+# of 2**SUB_BUCKET_BITS linear sub-buckets per power of two (~3% relative error)
+SUB_BUCKET_BITS = 5
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+# the largest recordable value is 2**MAX_VALUE_BITS - 1 nanoseconds (~18 minutes),
+# larger values are counted in the last bucket
+MAX_VALUE_BITS = 40
+
+
+class LatencyHistogram:
+    """a log-linear histogram of latencies in nanoseconds. Recording a value is O(1) and
+    doesn't allocate, making it cheap enough to record every hop of every message."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * ((MAX_VALUE_BITS - SUB_BUCKET_BITS + 1) * SUB_BUCKET_COUNT)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    @staticmethod
+    def bucket_index(value: int) -> int:
+        """get the index of the bucket counting the given value"""
+        if value < SUB_BUCKET_COUNT:
+            return max(value, 0)
+        exponent = value.bit_length() - SUB_BUCKET_BITS - 1
+        if exponent >= MAX_VALUE_BITS - SUB_BUCKET_BITS:
+            return (MAX_VALUE_BITS - SUB_BUCKET_BITS + 1) * SUB_BUCKET_COUNT - 1
+        return (exponent + 1) * SUB_BUCKET_COUNT + (value >> exponent) - SUB_BUCKET_COUNT
+
+    @staticmethod
+    def bucket_value(index: int) -> int:
+        """get the highest value counted by the bucket at the given index"""
+        if index < SUB_BUCKET_COUNT:
+            return index
+        exponent = index // SUB_BUCKET_COUNT - 1
+        sub_bucket = index % SUB_BUCKET_COUNT + SUB_BUCKET_COUNT
+        return ((sub_bucket + 1) << exponent) - 1
+
+    def record(self, value: int):
+        """record a latency
+
+        Args:
+            value (int): the latency in nanoseconds
+        """
+        self.counts[self.bucket_index(value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "LatencyHistogram"):
+        """add the recorded values of another histogram to this histogram"""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def mean(self) -> float:
+        """get the mean of the recorded latencies in nanoseconds"""
+        if self.count == 0:
+            return 0.0
+        return self.total / self.count
+
+    def value_at_percentile(self, percentile: float) -> int:
+        """get the latency below which the given percentage of the recorded latencies fall
+
+        Args:
+            percentile (float): the percentile between 0 and 100
+
+        Returns:
+            int: the latency in nanoseconds, within the precision of the histogram
+        """
+        if self.count == 0:
+            return 0
+        threshold = max(1, -(-self.count * percentile // 100))
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= threshold:
+                return min(self.bucket_value(index), self.max)
+        return self.max
@@ -7,6 +7,7 @@ if TYPE_CHECKING:
     from digitalpy.core.telemetry.metrics_provider import MetricsProvider
 
 from abc import ABC, abstractmethod
+from typing import Callable, Iterable
 
 
 class Meter(ABC):
@@ -25,4 +26,27 @@ class Meter(ABC):
     @abstractmethod
     def create_counter(self, name, description, unit) -> Counter:
         """this method should instantiate a new counter object with 
-        the passed values"""
\ No newline at end of file
+        the passed values"""
+
+    @abstractmethod
+    def create_observable_gauge(
+        self,
+        name: str,
+        callback: Callable[[], Iterable[tuple[float, dict]]],
+        description: str,
+        unit: str,
+    ):
+        """this method should register a gauge of which the values are observed by
+        calling the callback, the callback returns tuples of a value and its labels"""
+
+    @abstractmethod
+    def create_observable_counter(
+        self,
+        name: str,
+        callback: Callable[[], Iterable[tuple[int, dict]]],
+        description: str,
+        unit: str,
+    ):
+        """this method should register a monotonic counter of which the cumulative values
+        are observed by calling the callback, the callback returns tuples of a value and
+        its labels"""
@@ -13,6 +13,16 @@ class TopicCategory(Enum):
 
 ZMANAGER_MESSAGE_DELIMITER = b"~"
 ZMANAGER_MESSAGE_FORMAT = "pickled"
+# version of the multipart wire format, a message is sent as the frames
+# [topic, message id, header, body] where the header contains the version and the format
+ZMANAGER_WIRE_FORMAT_VERSION = b"1"
+ZMANAGER_MESSAGE_FRAME_COUNT = 4
+# control messages exchanged between the subject and the routing workers, a worker
+# announces how many messages it accepts at once with READY and acknowledges
+# processed messages with ACK, the subject retires a worker with RETIRE
+WORKER_READY = b"READY"
+WORKER_ACK = b"ACK"
+WORKER_RETIRE = b"RETIRE"
 TOPIC = "Topic"
 DEFAULT_ENCODING = "utf-8"
 
@@ -28,6 +28,20 @@ class ZManagerConfiguration(Node):
         self._worker_count: int = None
         self._worker_timeout: int = None
 
+        # the pool of routing workers is fixed to worker_count unless bounds are configured
+        self._min_worker_count: int = None
+        self._max_worker_count: int = None
+        self._worker_prefetch: int = 10
+        self._worker_scale_interval: int = 1000
+        self._worker_idle_timeout: int = 30000
+        # the subject stops receiving messages while the backlog exceeds the credit of
+        # the maximum number of workers times the backlog factor
+        self._backlog_factor: int = 4
+
+        # batching is disabled unless a batch size greater than one is configured
+        self._batch_size: int = 1
+        self._batch_linger: int = 0
+
 
     @property
     def integration_manager_pub_address(self) -> "str":
@@ -195,4 +209,106 @@ class ZManagerConfiguration(Node):
         worker_timeout = int(worker_timeout)
         if not isinstance(worker_timeout, int):
             raise TypeError("'worker_timeout' must be of type int")
-        self._worker_timeout = worker_timeout
\ No newline at end of file
+        self._worker_timeout = worker_timeout
+
+    @property
+    def batch_size(self) -> "int":
+        """The maximum number of messages sent in a single multipart message between the
+        subject, the routing workers and the integration manager, 1 disables batching."""
+        return self._batch_size
+
+    @batch_size.setter
+    def batch_size(self, batch_size: "int"):
+        batch_size = int(batch_size)
+        if not isinstance(batch_size, int):
+            raise TypeError("'batch_size' must be of type int")
+        self._batch_size = batch_size
+
+    @property
+    def batch_linger(self) -> "int":
+        """The maximum time in microseconds a message is held back waiting for a batch to fill."""
+        return self._batch_linger
+
+    @batch_linger.setter
+    def batch_linger(self, batch_linger: "int"):
+        batch_linger = int(batch_linger)
+        if not isinstance(batch_linger, int):
+            raise TypeError("'batch_linger' must be of type int")
+        self._batch_linger = batch_linger
+
+    @property
+    def min_worker_count(self) -> "int":
+        """The minimum number of routing workers, defaults to the worker count."""
+        if self._min_worker_count is None:
+            return self._worker_count
+        return self._min_worker_count
+
+    @min_worker_count.setter
+    def min_worker_count(self, min_worker_count: "int"):
+        min_worker_count = int(min_worker_count)
+        if not isinstance(min_worker_count, int):
+            raise TypeError("'min_worker_count' must be of type int")
+        self._min_worker_count = min_worker_count
+
+    @property
+    def max_worker_count(self) -> "int":
+        """The maximum number of routing workers, defaults to the worker count."""
+        if self._max_worker_count is None:
+            return self._worker_count
+        return self._max_worker_count
+
+    @max_worker_count.setter
+    def max_worker_count(self, max_worker_count: "int"):
+        max_worker_count = int(max_worker_count)
+        if not isinstance(max_worker_count, int):
+            raise TypeError("'max_worker_count' must be of type int")
+        self._max_worker_count = max_worker_count
+
+    @property
+    def worker_prefetch(self) -> "int":
+        """The maximum number of messages sent to a routing worker before it acknowledges them."""
+        return self._worker_prefetch
+
+    @worker_prefetch.setter
+    def worker_prefetch(self, worker_prefetch: "int"):
+        worker_prefetch = int(worker_prefetch)
+        if not isinstance(worker_prefetch, int):
+            raise TypeError("'worker_prefetch' must be of type int")
+        self._worker_prefetch = worker_prefetch
+
+    @property
+    def worker_scale_interval(self) -> "int":
+        """The interval in milliseconds in which the subject supervises the routing workers."""
+        return self._worker_scale_interval
+
+    @worker_scale_interval.setter
+    def worker_scale_interval(self, worker_scale_interval: "int"):
+        worker_scale_interval = int(worker_scale_interval)
+        if not isinstance(worker_scale_interval, int):
+            raise TypeError("'worker_scale_interval' must be of type int")
+        self._worker_scale_interval = worker_scale_interval
+
+    @property
+    def worker_idle_timeout(self) -> "int":
+        """The time in milliseconds a routing worker must be idle before it is retired."""
+        return self._worker_idle_timeout
+
+    @worker_idle_timeout.setter
+    def worker_idle_timeout(self, worker_idle_timeout: "int"):
+        worker_idle_timeout = int(worker_idle_timeout)
+        if not isinstance(worker_idle_timeout, int):
+            raise TypeError("'worker_idle_timeout' must be of type int")
+        self._worker_idle_timeout = worker_idle_timeout
+
+    @property
+    def backlog_factor(self) -> "int":
+        """The number of times the credit of the maximum number of routing workers the
+        subject holds in its backlog before it stops receiving messages."""
+        return self._backlog_factor
+
+    @backlog_factor.setter
+    def backlog_factor(self, backlog_factor: "int"):
+        backlog_factor = int(backlog_factor)
+        if not isinstance(backlog_factor, int):
+            raise TypeError("'backlog_factor' must be of type int")
+        self._backlog_factor = backlog_factor
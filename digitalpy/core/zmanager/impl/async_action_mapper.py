@@ -1,3 +1,4 @@
+from functools import partial
 import time
 from digitalpy.core.zmanager.domain.model.zmanager_configuration import ZManagerConfiguration
 from digitalpy.core.main.singleton_configuration_factory import SingletonConfigurationFactory
@@ -150,7 +151,7 @@ class AsyncActionMapper(ActionMapper):
         """
         self.eventManager.dispatch(
             ApplicationEvent.NAME,
-            ApplicationEvent(ApplicationEvent.BEFORE_ROUTE_ACTION, request),
+            partial(ApplicationEvent, ApplicationEvent.BEFORE_ROUTE_ACTION, request),
         )
 
         referrer = request.get_sender()
@@ -0,0 +1,98 @@
+"""This module contains the ControllerPool which keeps idle controllers for reuse by the
+action mapper."""
+
+import os
+import threading
+from typing import TYPE_CHECKING
+
+from digitalpy.core.main.object_factory import ObjectFactory
+
+if TYPE_CHECKING:
+    from digitalpy.core.main.controller import Controller
+    from digitalpy.core.zmanager.request import Request
+    from digitalpy.core.zmanager.response import Response
+
+
+class ControllerPool:
+    """ControllerPool keeps idle controller instances by controller class. A controller is
+    checked out for the duration of an action and checked in once the action completed,
+    as a checked out controller is never handed out twice an action may call a sub-action
+    of the same controller class which is then executed by another instance.
+
+    Controllers are bound to the process which created them, the pool is emptied when
+    it is used by a forked process.
+    """
+
+    def __init__(self, max_idle: int = 8):
+        """
+        Args:
+            max_idle (int, optional): the maximum number of idle instances kept per
+                controller class, 0 disables pooling. Defaults to 8.
+        """
+        self.max_idle = max_idle
+        self.idle: dict[str, list["Controller"]] = {}
+        self.pid = os.getpid()
+        # the pool is shared by the threads executing actions with the action mapper
+        self._lock = threading.Lock()
+
+    def checkout(
+        self, controller_class: str, request: "Request", response: "Response"
+    ) -> "Controller":
+        """get an idle controller bound to the request and response or create a new one
+
+        Args:
+            controller_class (str): the fully qualified name of the controller class
+            request (Request): the request of the action
+            response (Response): the response of the action
+
+        Returns:
+            Controller: a controller which isn't used by any other action
+        """
+        controller = None
+        with self._lock:
+            if self.pid != os.getpid():
+                self.idle = {}
+                self.pid = os.getpid()
+            idle = self.idle.get(controller_class)
+            if idle:
+                controller = idle.pop()
+        if controller is not None:
+            controller.request = request
+            controller.response = response
+            return controller
+        return ObjectFactory.get_instance_of(
+            controller_class,
+            dynamic_configuration={"request": request, "response": response},
+        )
+
+    def checkin(self, controller_class: str, controller: "Controller"):
+        """return a controller which completed its action to the pool, controllers which
+        opted out of pooling are discarded
+
+        Args:
+            controller_class (str): the fully qualified name of the controller class
+            controller (Controller): the controller returned by checkout
+        """
+        if not getattr(controller, "pooled", False) or self.pid != os.getpid():
+            return
+        controller.reset()
+        with self._lock:
+            idle = self.idle.setdefault(controller_class, [])
+            if len(idle) < self.max_idle:
+                idle.append(controller)
+
+    def clear(self):
+        """discard all idle controllers, e.g. after the configuration of a component changed"""
+        with self._lock:
+            self.idle = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # controllers are not shared with other processes
+        state["idle"] = {}
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -1,5 +1,7 @@
+from functools import partial
 import logging
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Optional
 from digitalpy.core.main.controller import Controller
 from digitalpy.core.digipy_configuration.configuration.digipy_configuration_constants import (
     ACTION_MAPPING_SECTION,
@@ -19,12 +21,19 @@ from digitalpy.core.digipy_configuration.action_key_controller import (
 )
 
 from digitalpy.core.main.object_factory import ObjectFactory
+from digitalpy.core.zmanager.impl.controller_pool import ControllerPool
+from digitalpy.core.zmanager.impl.hop_metrics import EXECUTE, IAM_FILTER, RESOLVE
 
 if TYPE_CHECKING:
     from digitalpy.core.IAM.IAM_facade import IAM
+    from digitalpy.core.zmanager.impl.hop_metrics import HopMetrics
 
 
 class DefaultActionMapper(ActionMapper):
+    # the metrics in which the latencies of the processed actions are recorded, set by
+    # the routing worker owning the action mapper
+    hop_metrics: Optional["HopMetrics"] = None
+
     #
     # Constructor
     # @param session
@@ -38,6 +47,7 @@ class DefaultActionMapper(ActionMapper):
         event_manager: EventManager,
         configuration: Configuration,
         iam: "IAM" = None,
+        controller_pool_size: int = 8,
     ):
         self.eventManager = event_manager
         self.configuration = configuration
@@ -49,6 +59,9 @@ class DefaultActionMapper(ActionMapper):
         self.action_key_controller: ActionKeyController = ObjectFactory.get_instance(
             "ActionKeyController"
         )
+        # the controllers are reused between actions as constructing a facade often
+        # costs more than the action it executes
+        self.controller_pool = ControllerPool(int(controller_pool_size))
 
     #
     # @see ActionMapper.processAction()
@@ -85,7 +98,7 @@ class DefaultActionMapper(ActionMapper):
 
         self.eventManager.dispatch(
             ApplicationEvent.NAME,
-            ApplicationEvent(ApplicationEvent.BEFORE_ROUTE_ACTION, request),
+            partial(ApplicationEvent, ApplicationEvent.BEFORE_ROUTE_ACTION, request),
         )
         actionKeyProvider = ConfigActionKeyProvider(
             self.configuration, ACTION_MAPPING_SECTION
@@ -100,13 +113,25 @@ class DefaultActionMapper(ActionMapper):
         response.set_action(action)
         # response.set_format(request.get_response_format())
 
+        hop_metrics = self.hop_metrics
+        if hop_metrics is not None:
+            started = time.perf_counter_ns()
+
         # get best matching action key from inifile
         actionKey = self.action_key_controller.resolve_action_key(request.action_key)
 
+        if hop_metrics is not None:
+            resolved = time.perf_counter_ns()
+            hop_metrics.record(RESOLVE, request.action_key, resolved - started)
+
         # authenticate user
         if not self.authorize_operation(request, action_key=actionKey):
             raise PermissionError("User not authorized to perform this operation")
 
+        if hop_metrics is not None:
+            authorized = time.perf_counter_ns()
+            hop_metrics.record(IAM_FILTER, request.action_key, authorized - resolved)
+
         # get next controller
         controllerClass, controllerMethod, controller_obj = self._get_controller(
             request, response, actionKey.target
@@ -118,6 +143,12 @@ class DefaultActionMapper(ActionMapper):
 
         # initialize controller
         self._execute_operation(request, response, controllerMethod, controller_obj)
+        self.controller_pool.checkin(controllerClass, controller_obj)
+
+        if hop_metrics is not None:
+            hop_metrics.record(
+                EXECUTE, request.action_key, time.perf_counter_ns() - authorized
+            )
 
         # return if we are finished
         if self.is_finished:
@@ -162,7 +193,8 @@ class DefaultActionMapper(ActionMapper):
     def _execute_operation(self, request, response, controllerMethod, controller_obj):
         self.eventManager.dispatch(
             ApplicationEvent.NAME,
-            ApplicationEvent(
+            partial(
+                ApplicationEvent,
                 ApplicationEvent.BEFORE_INITIALIZE_CONTROLLER,
                 request,
                 response,
@@ -174,7 +206,8 @@ class DefaultActionMapper(ActionMapper):
         # execute controller
         self.eventManager.dispatch(
             ApplicationEvent.NAME,
-            ApplicationEvent(
+            partial(
+                ApplicationEvent,
                 ApplicationEvent.BEFORE_EXECUTE_CONTROLLER,
                 request,
                 response,
@@ -192,7 +225,8 @@ class DefaultActionMapper(ActionMapper):
             raise e
         self.eventManager.dispatch(
             ApplicationEvent.NAME,
-            ApplicationEvent(
+            partial(
+                ApplicationEvent,
                 ApplicationEvent.AFTER_EXECUTE_CONTROLLER,
                 request,
                 response,
@@ -222,10 +256,9 @@ class DefaultActionMapper(ActionMapper):
         else:
             controllerClass = controllerDef
 
-        # instantiate controller
-        controller_obj: Controller = ObjectFactory.get_instance_of(
-            controllerClass,
-            dynamic_configuration={"request": request, "response": response},
+        # get an idle controller or instantiate one
+        controller_obj: Controller = self.controller_pool.checkout(
+            controllerClass, request, response
         )
         return controllerClass, controllerMethod, controller_obj
 
@@ -1,6 +1,8 @@
 import logging
 import multiprocessing
 import threading
+import time
+from typing import Optional
 import uuid
 
 import zmq
@@ -32,7 +34,16 @@ from digitalpy.core.main.object_factory import ObjectFactory
 from digitalpy.core.parsing.formatter import Formatter
 from digitalpy.core.service_management.digitalpy_service import COMMAND_PROTOCOL
 from digitalpy.core.zmanager.action_mapper import ActionMapper
+from digitalpy.core.zmanager.impl.hop_metrics import (
+    DESERIALIZE,
+    PUSH,
+    SERIALIZE,
+    HopMetrics,
+)
 from digitalpy.core.zmanager.configuration.zmanager_constants import (
+    WORKER_ACK,
+    WORKER_READY,
+    WORKER_RETIRE,
     ZMANAGER_MESSAGE_DELIMITER,
 )
 from digitalpy.core.digipy_configuration.configuration.digipy_configuration_constants import (
@@ -77,6 +88,10 @@ class DefaultRoutingWorker:
         self.logger = logging.getLogger("DP-Default_Routing_Worker_DEBUG")
         self.logger.setLevel(logging.DEBUG)
         self.integration_manager_pusher = integration_manager_pusher
+        # latencies of the stages of the processing of every message, the action mapper
+        # records the latencies of the stages of the actions it executes
+        self.hop_metrics = HopMetrics()
+        self.action_mapper.hop_metrics = self.hop_metrics
 
         self.zmanager_configuration: ZManagerConfiguration = (
             SingletonConfigurationFactory.get_configuration_object(
@@ -113,6 +128,11 @@ class DefaultRoutingWorker:
         # unlimited as trunkating can result in unsent data and broken messages
         # TODO: determine a sane default
         self.integration_manager_pusher.setup()
+        if self.zmanager_configuration.batch_size > 1:
+            self.integration_manager_pusher.enable_batching(
+                self.zmanager_configuration.batch_size,
+                self.zmanager_configuration.batch_linger,
+            )
 
         # TODO: determine the correct topic to subscribe to
         self._create_integration_manager_sub_sock()
@@ -139,13 +159,19 @@ class DefaultRoutingWorker:
         self.sub_sock.setsockopt(zmq.LINGER, 0)
 
     def _create_subject_listener_sock(self):
-        self.subject_sock = self.context.socket(zmq.PULL)
-        self.subject_sock.connect(self.subject_address)
+        self.subject_sock = self.context.socket(zmq.DEALER)
+        # the subject addresses the worker by its id
+        self.subject_sock.setsockopt(zmq.IDENTITY, self.worker_id.encode())
         self.subject_sock.setsockopt(zmq.RCVHWM, 0)
         self.subject_sock.setsockopt(
             zmq.RCVTIMEO, self.zmanager_configuration.worker_timeout
         )
         self.subject_sock.setsockopt(zmq.LINGER, 0)
+        self.subject_sock.connect(self.subject_address)
+        # grant the subject credit for the messages the worker accepts at once
+        self.subject_sock.send_multipart(
+            [WORKER_READY, str(self.zmanager_configuration.worker_prefetch).encode()]
+        )
 
     def teardown(self):
         """teardown the environment"""
@@ -166,8 +192,10 @@ class DefaultRoutingWorker:
             self.factory.register_instance(
                 "metrics_provider_instance", self.metrics_provider
             )
-        except Exception as e:
-            pass
+            self.hop_metrics.register(self.metrics_provider, self.worker_id)
+        except Exception as ex:
+            # the worker can run without exporting metrics
+            self.logger.warning("failed to initialize metrics: %s", ex)
 
     def initialize_tracing(self):
         """initialize tracing system
@@ -193,8 +221,23 @@ class DefaultRoutingWorker:
             b"new error," + str(exception).encode("utf-8")
         )
 
-    def start(self, factory: Factory, configuration_factory: ConfigurationFactory):
-        """start the routing worker"""
+    def start(
+        self,
+        factory: Factory,
+        configuration_factory: ConfigurationFactory,
+        worker_id: Optional[str] = None,
+    ):
+        """start the routing worker
+
+        Args:
+            factory (Factory): the factory used by the ObjectFactory singleton
+            configuration_factory (ConfigurationFactory): the configuration factory used by
+                the SingletonConfigurationFactory singleton
+            worker_id (str, optional): the id by which the subject addresses the worker.
+                Defaults to the id generated when the worker was created.
+        """
+        if worker_id is not None:
+            self.worker_id = worker_id
         ObjectFactory.configure(factory)
         SingletonConfigurationFactory.configure(configuration_factory)
         self.initiate_sockets()
@@ -222,23 +265,54 @@ class DefaultRoutingWorker:
         back to the integration_manager"""
         while self.running.is_set():
             try:
-                request = self.receive_request()
-                response = self.process_request(request)
-                self.integration_manager_pusher.push_container(response)
+                frames = self.receive_messages()
             except zmq.error.Again:
-                pass
-            except Exception as ex:
+                frames = []
+            if len(frames) == 1 and frames[0].bytes == WORKER_RETIRE:
+                # the subject retired the worker after all messages sent to it
+                self.running.clear()
+                break
+            messages = self.serializer_container.split_zmanager_frames(frames)
+            # handle the requests of a batch individually so that a failing request
+            # does not drop the remainder of the batch
+            for message in messages:
+                action_key = None
                 try:
-                    self.send_error(ex)
+                    started = time.perf_counter_ns()
+                    request = self.serializer_container.from_zmanager_frames(message)
+                    action_key = request.action_key
+                    deserialized = time.perf_counter_ns()
+                    self.hop_metrics.record(DESERIALIZE, action_key, deserialized - started)
+
+                    response = self.process_request(request)
+
+                    processed = time.perf_counter_ns()
+                    frames = self.serializer_container.to_zmanager_frames(response)
+                    serialized = time.perf_counter_ns()
+                    self.hop_metrics.record(SERIALIZE, action_key, serialized - processed)
+                    self.integration_manager_pusher.push_frames(frames)
+                    self.hop_metrics.record(
+                        PUSH, action_key, time.perf_counter_ns() - serialized
+                    )
                 except Exception as ex:
-                    self.send_error(ex)
-                    logging.error(ex)
+                    self.hop_metrics.record_error(action_key)
+                    try:
+                        self.send_error(ex)
+                    except Exception as ex:
+                        # the message must still be acknowledged to the subject
+                        logging.error(ex)
+            if messages:
+                # return the credit of the processed messages to the subject
+                self.subject_sock.send_multipart(
+                    [WORKER_ACK, str(len(messages)).encode()]
+                )
+            self.integration_manager_pusher.flush_if_due()
 
     def _integration_manager_listener(self):
         """listen for messages from the integration_manager and process them"""
         while self.running.is_set():
             try:
-                message = self.sub_sock.recv_multipart().pop()
+                message = self.sub_sock.recv_multipart()
                 self.logger.debug("received message %s", str(message))
                 self.process_integration_manager_message(message)
             except zmq.error.Again:
@@ -269,6 +343,8 @@ class DefaultRoutingWorker:
         response: Response = ObjectFactory.get_new_instance("response")
         response.action_key = request.action_key
         response.set_id(request.get_id())
+        # the response is sent in the format selected for the request
+        response.set_format(request.get_format())
 
         # alternative to while loop
         for _ in range(MAX_FLOW_LENGTH):
@@ -302,5 +378,30 @@ class DefaultRoutingWorker:
             Request: the request object to be processed
         """
         # Receive message from client
-        message = self.subject_sock.recv_multipart().pop(0)
-        return self.serializer_container.from_zmanager_message(message)
+        message = self.subject_sock.recv_multipart(copy=False)
+        return self.serializer_container.from_zmanager_frames(message)
+
+    def receive_messages(self) -> list[zmq.Frame]:
+        """Receive a multipart message from the ZMQ socket without copying it's frames,
+        the message may contain several requests as the subject may batch them into one.
+        If a batch of responses is pending only wait until it must be flushed.
+
+        Returns:
+            list[zmq.Frame]: the frames of the received message
+        """
+        timeout = self.integration_manager_pusher.flush_timeout()
+        if timeout is not None and not self.subject_sock.poll(timeout):
+            return []
+        return self.subject_sock.recv_multipart(copy=False)
+
+    def __getstate__(self):
+        """the running event of a worker started by a spawning process belongs to it's
+        process, an event of the subject can't be shared with it"""
+        state = self.__dict__.copy()
+        state.pop("running", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.running = multiprocessing.Event()
+        self.running.set()
@@ -0,0 +1,139 @@
+"""This module contains the HopMetrics which records the latency of every stage of the
+processing of a message by a routing worker."""
+
+import threading
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from digitalpy.core.telemetry.latency_histogram import LatencyHistogram
+
+if TYPE_CHECKING:
+    from digitalpy.core.digipy_configuration.domain.model.actionkey import ActionKey
+    from digitalpy.core.telemetry.metrics_provider import MetricsProvider
+
+# the stages of the processing of a message
+DESERIALIZE = "deserialize"
+RESOLVE = "resolve"
+IAM_FILTER = "iam_filter"
+EXECUTE = "execute"
+SERIALIZE = "serialize"
+PUSH = "push"
+
+# the percentiles exported for every histogram
+EXPORTED_PERCENTILES = (50, 90, 99)
+
+
+class HopMetrics:
+    """HopMetrics keeps a latency histogram per stage and action key in the worker and
+    exposes them through the metrics provider. The latency gauges report the latencies
+    recorded since their last export while the counters are cumulative, this makes the
+    throughput of an action key the rate of its counter.
+    """
+
+    def __init__(self):
+        # the histograms recorded since the last export by stage, context and action
+        self.histograms: dict[tuple[str, str, str], LatencyHistogram] = {}
+        # the cumulative number of recorded latencies by stage, context and action
+        self.counts: dict[tuple[str, str, str], int] = {}
+        self.errors: dict[tuple[str, str], int] = {}
+        # the metrics are recorded by the worker while they are collected by the thread of
+        # the metrics exporter
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, action_key: Optional["ActionKey"], latency: int):
+        """record the latency of a stage of the processing of a message
+
+        Args:
+            stage (str): the stage of the processing
+            action_key (ActionKey): the action key of the processed message
+            latency (int): the latency in nanoseconds
+        """
+        if action_key is None:
+            key = (stage, "", "")
+        else:
+            key = (stage, action_key.context, action_key.action)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = LatencyHistogram()
+                self.histograms[key] = histogram
+            histogram.record(latency)
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+    def record_error(self, action_key: Optional["ActionKey"]):
+        """count a message of which the processing failed"""
+        if action_key is None:
+            key = ("", "")
+        else:
+            key = (action_key.context, action_key.action)
+        with self._lock:
+            self.errors[key] = self.errors.get(key, 0) + 1
+
+    def collect(self) -> dict[tuple[str, str, str], LatencyHistogram]:
+        """get the histograms recorded since the last call and start new histograms"""
+        with self._lock:
+            histograms = self.histograms
+            self.histograms = {}
+        return histograms
+
+    def observe_latencies(self) -> Iterable[tuple[float, dict]]:
+        """get the percentiles, mean and max of the latencies in milliseconds recorded since
+        the last observation labeled with the stage, context, action and statistic"""
+        for (stage, context, action), histogram in self.collect().items():
+            labels = {"stage": stage, "context": context, "action": action}
+            for percentile in EXPORTED_PERCENTILES:
+                yield (
+                    histogram.value_at_percentile(percentile) / 1_000_000,
+                    {**labels, "statistic": f"p{percentile}"},
+                )
+            yield histogram.mean() / 1_000_000, {**labels, "statistic": "mean"}
+            yield histogram.max / 1_000_000, {**labels, "statistic": "max"}
+
+    def observe_counts(self) -> Iterable[tuple[int, dict]]:
+        """get the cumulative number of processed stages labeled with the stage, context and action"""
+        with self._lock:
+            counts = list(self.counts.items())
+        for (stage, context, action), count in counts:
+            yield count, {"stage": stage, "context": context, "action": action}
+
+    def observe_errors(self) -> Iterable[tuple[int, dict]]:
+        """get the cumulative number of failed messages labeled with the context and action"""
+        with self._lock:
+            errors = list(self.errors.items())
+        for (context, action), count in errors:
+            yield count, {"context": context, "action": action}
+
+    def register(self, metrics_provider: "MetricsProvider", meter_name: str):
+        """expose the metrics through the given metrics provider
+
+        Args:
+            metrics_provider (MetricsProvider): the provider of the meter
+            meter_name (str): the name of the meter, e.g. the id of the worker
+        """
+        meter = metrics_provider.create_meter(meter_name)
+        meter.create_observable_gauge(
+            "digitalpy.worker.hop.latency",
+            self.observe_latencies,
+            "latency of the stages of the processing of messages by action",
+            "ms",
+        )
+        meter.create_observable_counter(
+            "digitalpy.worker.hop.count",
+            self.observe_counts,
+            "number of processed stages of messages by action",
+            "1",
+        )
+        meter.create_observable_counter(
+            "digitalpy.worker.errors",
+            self.observe_errors,
+            "number of messages of which the processing failed by action",
+            "1",
+        )
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
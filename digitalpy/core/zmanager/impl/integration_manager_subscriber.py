@@ -1,5 +1,5 @@
 import logging
-from typing import Optional
+from typing import Iterable, Optional
 
 import zmq
 
@@ -31,6 +31,25 @@ from digitalpy.core.zmanager.response import Response
 RECIPIENT_DELIMITER = ";"
 
 
+def get_covering_prefixes(topics: Iterable[bytes]) -> list[bytes]:
+    """get the minimal set of subscription prefixes matching all given topics. As zmq
+    subscriptions match by prefix, a topic is covered by any other topic which is a
+    prefix of it. Walking the topics in sorted order visits them like a depth first walk
+    of a prefix trie, so a topic is covered exactly if the last kept prefix is a prefix of it.
+
+    Args:
+        topics (Iterable[bytes]): the topics to be received
+
+    Returns:
+        list[bytes]: the sorted prefixes
+    """
+    prefixes: list[bytes] = []
+    for topic in sorted(set(topics)):
+        if not prefixes or not topic.startswith(prefixes[-1]):
+            prefixes.append(topic)
+    return prefixes
+
+
 class IntegrationManagerSubscriber:
     """This class is responsible for managing subscription connections to the integration manager."""
 
@@ -63,6 +82,9 @@ class IntegrationManagerSubscriber:
 
         self.timeout = timeout
 
+        # the prefixes subscribed through set_subscriptions
+        self.subscribed_prefixes: set[bytes] = set()
+
         self.action_key_controller: ActionKeyController = ObjectFactory.get_instance(
             "ActionKeyController"
         )
@@ -88,6 +110,8 @@ class IntegrationManagerSubscriber:
         )
 
         self._subscribe_to_topics()
+        for prefix in self.subscribed_prefixes:
+            self.subscribe_to_topic(prefix)
 
         # unlimited as trunkating can result in unsent data and broken messages
         # TODO: determine a sane default
@@ -121,6 +145,28 @@ class IntegrationManagerSubscriber:
         topic = self.serializer_action_key.to_generic_topic(action_key)
         self.unsubscribe_from_topic(topic)
 
+    def set_subscriptions(self, topics: Iterable[bytes]) -> tuple[set[bytes], set[bytes]]:
+        """Subscribe to the minimal set of prefixes covering the given topics, only the
+        prefixes which were added or removed since the last call are changed on the socket.
+        Subscriptions made through subscribe_to_topic are not affected.
+
+        Args:
+            topics (Iterable[bytes]): the topics to be received
+
+        Returns:
+            tuple[set[bytes], set[bytes]]: the added and the removed prefixes
+        """
+        prefixes = set(get_covering_prefixes(topics))
+        added = prefixes - self.subscribed_prefixes
+        removed = self.subscribed_prefixes - prefixes
+        # subscribe before unsubscribing so that no message matching both is missed
+        for prefix in sorted(added):
+            self.subscribe_to_topic(prefix)
+        for prefix in sorted(removed):
+            self.unsubscribe_from_topic(prefix)
+        self.subscribed_prefixes = prefixes
+        return added, removed
+
     def subscribe_to_topic(self, topic: bytes):
         """Subscribe to a topic"""
         self.subscriber_socket.setsockopt(zmq.SUBSCRIBE, topic)
@@ -155,19 +201,19 @@ class IntegrationManagerSubscriber:
         except zmq.error.Again:
             return None
 
-    def _receive_message(self) -> bytes:
-        message = self.subscriber_socket.recv_multipart()[0]
+    def _receive_message(self) -> list[zmq.Frame]:
+        message = self.subscriber_socket.recv_multipart(copy=False)
 
         return message
 
-    def _deserialize_response(self, message: bytes) -> Response:
+    def _deserialize_response(self, message: list[zmq.Frame]) -> Response:
         response: Response = ObjectFactory.get_new_instance("Response")
-        response = self.serializer_container.from_zmanager_message(message)
+        response = self.serializer_container.from_zmanager_frames(message)
         return response
 
-    def _deserialize_request(self, message: bytes) -> Request:
+    def _deserialize_request(self, message: list[zmq.Frame]) -> Request:
         request: Request = ObjectFactory.get_new_instance("Request")
-        request = self.serializer_container.from_zmanager_message(message)
+        request = self.serializer_container.from_zmanager_frames(message)
         return request
 
     def __getstate__(self):
@@ -190,3 +236,5 @@ class IntegrationManagerSubscriber:
             self.subscriber_socket.setsockopt_string(
                 zmq.SUBSCRIBE, f"/commands/{self.service_id}/"
             )
+        for prefix in self.subscribed_prefixes:
+            self.subscribe_to_topic(prefix)
@@ -1,10 +1,20 @@
-from typing import TYPE_CHECKING
+from collections import deque
+from dataclasses import dataclass
+import logging
+import time
+from typing import TYPE_CHECKING, Optional
 
+import zmq
 
 from digitalpy.core.main.singleton_configuration_factory import (
     SingletonConfigurationFactory,
 )
 from digitalpy.core.parsing.formatter import Formatter
+from digitalpy.core.zmanager.configuration.zmanager_constants import (
+    WORKER_ACK,
+    WORKER_READY,
+    WORKER_RETIRE,
+)
 from digitalpy.core.zmanager.domain.model.zmanager_configuration import (
     ZManagerConfiguration,
 )
@@ -14,8 +24,28 @@ if TYPE_CHECKING:
     from digitalpy.core.zmanager.controller_message import ControllerMessage
 
 
+@dataclass
+class RoutingWorkerState:
+    """the dispatch state of a routing worker connected to the subject"""
+
+    identity: bytes
+    # the number of messages the worker accepts before acknowledging them
+    prefetch: int
+    # the number of messages sent to the worker which it didn't acknowledge yet
+    in_flight: int = 0
+    # the time at which a message was last sent to or acknowledged by the worker
+    last_active: float = 0.0
+    retiring: bool = False
+
+
 class RoutingWorkerPusher(Pusher):
-    """This class is responsible for pushing messages to the integration manager."""
+    """This class is responsible for pushing messages to the routing workers. Instead of
+    distributing messages round-robin every worker grants the pusher credit for a number of
+    messages and acknowledges the messages it processed, messages are sent to the least
+    loaded worker with credit and are held in a backlog while all workers are busy.
+    """
+
+    socket_type = zmq.ROUTER
 
     def __init__(self, formatter: Formatter):
         zmanager_configuration: ZManagerConfiguration = (
@@ -26,3 +56,120 @@ class RoutingWorkerPusher(Pusher):
         super().__init__(
             formatter, zmanager_configuration.subject_push_address
         )
+        self.logger = logging.getLogger("DP-Routing_Worker_Pusher_DEBUG")
+        self.routing_workers: dict[bytes, RoutingWorkerState] = {}
+        # the messages waiting for a worker with credit
+        self.backlog: deque[list[bytes]] = deque()
+
+    def setup(self, bind: bool = False) -> None:
+        super().setup(bind)
+        # fail instead of silently dropping messages addressed to a disconnected worker
+        self.pusher_socket.setsockopt(zmq.ROUTER_MANDATORY, 1)
+        # the messages of workers which are gone are not waited for on teardown
+        self.pusher_socket.setsockopt(zmq.LINGER, 0)
+
+    @property
+    def in_flight(self) -> int:
+        """the number of messages sent to the workers which weren't acknowledged yet"""
+        return sum(worker.in_flight for worker in self.routing_workers.values())
+
+    def push_frames(self, frames: list[bytes]):
+        """queue the frames of a serialized container and send them to a worker if one has credit
+
+        Args:
+            frames (list[bytes]): the frames of the container as returned by
+                SerializerContainer.to_zmanager_frames
+        """
+        self.backlog.append(frames)
+        self.dispatch()
+
+    def dispatch(self):
+        """send the backlog to the workers with credit, the least loaded worker receives up to
+        batch_size messages as the frames of a single multipart message"""
+        while self.backlog:
+            worker = self._select_worker()
+            if worker is None:
+                return
+            count = min(
+                len(self.backlog), worker.prefetch - worker.in_flight, self.batch_size
+            )
+            messages = [self.backlog.popleft() for _ in range(count)]
+            frames = [worker.identity]
+            for message in messages:
+                frames.extend(message)
+            try:
+                self.pusher_socket.send_multipart(frames, copy=False)
+            except zmq.error.ZMQError as ex:
+                if ex.errno != zmq.EHOSTUNREACH:
+                    raise
+                # the worker disconnected, the messages are sent to another worker
+                self.backlog.extendleft(reversed(messages))
+                self.remove_worker(worker.identity)
+                continue
+            worker.in_flight += count
+            worker.last_active = time.monotonic()
+
+    def _select_worker(self) -> Optional[RoutingWorkerState]:
+        """get the worker with credit and the fewest messages in flight, the first
+        connected worker is preferred so that surplus workers become idle"""
+        selected = None
+        for worker in self.routing_workers.values():
+            if worker.retiring or worker.in_flight >= worker.prefetch:
+                continue
+            if selected is None or worker.in_flight < selected.in_flight:
+                selected = worker
+        return selected
+
+    def receive_acknowledgements(self):
+        """process all pending control messages of the workers and send the backlog to
+        the workers which received credit"""
+        while True:
+            try:
+                frames = self.pusher_socket.recv_multipart(zmq.NOBLOCK)
+            except zmq.error.Again:
+                break
+            if len(frames) != 3:
+                self.logger.warning("invalid control message from worker %s", frames[0])
+                continue
+            identity, kind, value = frames
+            if kind == WORKER_READY:
+                self.routing_workers[identity] = RoutingWorkerState(
+                    identity, max(int(value), 1), last_active=time.monotonic()
+                )
+            elif kind == WORKER_ACK and identity in self.routing_workers:
+                worker = self.routing_workers[identity]
+                worker.in_flight = max(worker.in_flight - int(value), 0)
+                worker.last_active = time.monotonic()
+        self.dispatch()
+
+    def retire_worker(self, identity: bytes):
+        """stop sending messages to a worker and request it to exit once it processed
+        the messages it already received
+
+        Args:
+            identity (bytes): the identity of the worker
+        """
+        worker = self.routing_workers.get(identity)
+        if worker is None or worker.retiring:
+            return
+        worker.retiring = True
+        try:
+            self.pusher_socket.send_multipart([identity, WORKER_RETIRE])
+        except zmq.error.ZMQError as ex:
+            if ex.errno != zmq.EHOSTUNREACH:
+                raise
+
+    def remove_worker(self, identity: bytes) -> int:
+        """remove a worker which exited
+
+        Args:
+            identity (bytes): the identity of the worker
+
+        Returns:
+            int: the number of messages lost by the worker as they were never acknowledged
+        """
+        worker = self.routing_workers.pop(identity, None)
+        if worker is None:
+            return 0
+        return worker.in_flight
+
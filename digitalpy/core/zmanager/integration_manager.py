@@ -123,19 +123,21 @@ class IntegrationManager:
 
         while self.running.is_set():
             try:
-                # receive a message from a client
-                message = self.pull_socket.recv_multipart().pop(0)
-                self._forward_message(message)
+                # receive a message from a client, each message of a batch is published
+                # separately so that subscribers can filter it by it's topic frame
+                frames = self.pull_socket.recv_multipart(copy=False)
+                for message in self.serializer_container.split_zmanager_frames(frames):
+                    self._forward_message(message)
             except zmq.error.Again:
                 pass
             except Exception as ex:
                 print("Error " + str(ex))
         self._teardown()
 
-    def _forward_message(self, message: bytes):
+    def _forward_message(self, message: list[zmq.Frame]):
         """publish the message to all listeners"""
         try:
             # publish the message
-            self.pub_socket.send(message, copy=False)
+            self.pub_socket.send_multipart(message, copy=False)
         except Exception as ex:
             print("Error sending response to client: {}".format(ex))
@@ -1,5 +1,6 @@
 from abc import ABC
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Optional
 import zmq
 
 from digitalpy.core.main.singleton_configuration_factory import (
@@ -19,6 +20,9 @@ if TYPE_CHECKING:
 
 
 class Pusher(ABC):
+    # the type of the socket used to send messages to the target
+    socket_type: int = zmq.PUSH
+
     def __init__(self, formatter: "Formatter", pull_address: str) -> None:
         # list of connection to which the socket should reconnect after
         # being unpickled
@@ -30,6 +34,25 @@ class Pusher(ABC):
         self.serializer_container: "SerializerContainer" = ObjectFactory.get_instance(
             "SerializerContainer"
         )
+        # batching is disabled until enable_batching is called by the owner of the pusher
+        # as the owner is responsible for flushing the batch once the linger time expires
+        self.batch_size: int = 1
+        self.batch_linger: int = 0
+        self._batch: list[bytes] = []
+        self._batch_count: int = 0
+        self._batch_started: float = 0.0
+
+    def enable_batching(self, batch_size: int, batch_linger: int):
+        """enable batching of messages, once enabled up to batch_size messages are sent
+        as the frames of a single multipart message. The owner of the pusher must call
+        flush_if_due periodically, at latest after the time returned by flush_timeout.
+
+        Args:
+            batch_size (int): the maximum number of messages in a batch
+            batch_linger (int): the maximum time in microseconds a message is held in a batch
+        """
+        self.batch_size = max(int(batch_size), 1)
+        self.batch_linger = max(int(batch_linger), 0)
 
     def setup(self, bind: bool = False) -> None:
         """initiate subject connection
@@ -42,7 +65,7 @@ class Pusher(ABC):
         if self.pusher_context is None:
             self.pusher_context = zmq.Context()
         if self.pusher_socket is None:
-            self.pusher_socket = self.pusher_context.socket(zmq.PUSH)
+            self.pusher_socket = self.pusher_context.socket(self.socket_type)
         if bind:
             self.pusher_socket.bind(self.pull_address)
         else:
@@ -51,6 +74,8 @@ class Pusher(ABC):
 
     def teardown(self):
         """teardown subject connection"""
+        if self._batch:
+            self.flush()
         for connection in self.__pusher_socket_connections:
             if connection[0]:
                 self.pusher_socket.unbind(connection[1])
@@ -69,11 +94,57 @@ class Pusher(ABC):
             container (ControllerMessage): the request to be sent to the target
         """
         # set the service_id so it can be used to create the publish topic by the default routing worker
-        message = self.serializer_container.to_zmanager_message(container)
-        if len(self.__pusher_socket_connections) > 0:
-            self.pusher_socket.send(message)
-        else:
+        self.push_frames(self.serializer_container.to_zmanager_frames(container))
+
+    def push_frames(self, frames: list[bytes]):
+        """send the frames of a serialized container to the target
+
+        Args:
+            frames (list[bytes]): the frames of the container as returned by
+                SerializerContainer.to_zmanager_frames
+        """
+        if len(self.__pusher_socket_connections) == 0:
             raise ConnectionError("No connection to pusher established")
+        if self.batch_size <= 1:
+            self.pusher_socket.send_multipart(frames, copy=False)
+            return
+        if not self._batch:
+            self._batch_started = time.monotonic()
+        self._batch.extend(frames)
+        self._batch_count += 1
+        if self._batch_count >= self.batch_size:
+            self.flush()
+        else:
+            self.flush_if_due()
+
+    def flush(self):
+        """send all batched messages as the frames of a single multipart message"""
+        if not self._batch:
+            return
+        batch = self._batch
+        self._batch = []
+        self._batch_count = 0
+        self.pusher_socket.send_multipart(batch, copy=False)
+
+    def flush_if_due(self):
+        """flush the batch if the linger time of the oldest batched message expired"""
+        if self._batch and self.flush_timeout() == 0:
+            self.flush()
+
+    def flush_timeout(self) -> Optional[int]:
+        """get the time in milliseconds until the current batch must be flushed
+
+        Returns:
+            Optional[int]: the remaining time or None if there is no pending batch
+        """
+        if not self._batch:
+            return None
+        elapsed = (time.monotonic() - self._batch_started) * 1_000_000
+        remaining = self.batch_linger - elapsed
+        if remaining <= 0:
+            return 0
+        # round up so that polling with the timeout does not return before the batch is due
+        return int(-(-remaining // 1000))
 
     def __getstate__(self):
         state = self.__dict__
@@ -88,7 +159,7 @@ class Pusher(ABC):
         if self.pusher_context is None:
             self.pusher_context = zmq.Context()
         if self.pusher_socket is None:
-            self.pusher_socket = self.pusher_context.socket(zmq.PUSH)
+            self.pusher_socket = self.pusher_context.socket(self.socket_type)
 
             for connection in self.__pusher_socket_connections:
                 if connection[0]:
@@ -1,7 +1,10 @@
 import logging
+import math
 import multiprocessing
 import sys
+import time
 from typing import TYPE_CHECKING
+import uuid
 import zmq
 
 from digitalpy.core.zmanager.impl.routing_worker_pusher import RoutingWorkerPusher
@@ -33,9 +36,13 @@ if TYPE_CHECKING:
 
 class Subject:
     """part of the Z-manager architecture Dispatches events to listeners and sends messages
-    with payloads from services, acting like a load balancer. Uses a ZMQ_PUSH socket to
-    send messages to workers or to the integration manager to ewnable communication with the
-    other core components.
+    with payloads from services, acting like a load balancer. Sends messages to the workers
+    which have credit or to the integration manager to ewnable communication with the
+    other core components. The subject supervises the routing workers, dead workers are
+    replaced and the pool grows while messages wait for a worker and shrinks when
+    workers are idle, within the configured minimum and maximum worker count. While the
+    backlog of messages waiting for a worker is full no further messages are received,
+    so that the senders are held back by the high water mark of the frontend.
     """
 
     frontend_pull: zmq.Socket
@@ -50,7 +57,16 @@ class Subject:
         integration_manager_pusher: IntegrationManagerPusher,
         routing_worker_pusher: RoutingWorkerPusher,
     ):
-        self.workers: list[multiprocessing.Process] = []
+        # the worker processes started by the subject by their worker id
+        self.workers: dict[str, multiprocessing.Process] = {}
+        # the time by which the retired workers must have exited by their worker id
+        self.retiring_workers: dict[str, float] = {}
+        self._next_supervision: float = 0.0
+        # the context starting the workers once the subject has a live zmq context,
+        # which must not be inherited by forked workers
+        self._worker_context = None
+        # whether the frontend is not polled as the backlog is full
+        self.receiving_paused = False
         self.worker: "DefaultRoutingWorker" = routing_worker
         self.logger = logging.getLogger("DP-Subject_DEBUG")
         self.running = multiprocessing.Event()
@@ -70,23 +86,157 @@ class Subject:
         self.routing_worker_pusher = routing_worker_pusher
 
     def _start_workers(self):
-        for _ in range(self.zmanager_configuration.worker_count):
-            worker_process = multiprocessing.Process(
-                target=self.worker.start,
-                daemon=True,
-                args=(
-                    ObjectFactory.get_instance("factory"),
-                    SingletonConfigurationFactory.get_instance(),
-                ),
+        worker_count = min(
+            max(
+                self.zmanager_configuration.worker_count,
+                self.zmanager_configuration.min_worker_count,
+            ),
+            self.zmanager_configuration.max_worker_count,
+        )
+        for _ in range(worker_count):
+            self._start_worker()
+
+    def _start_worker(self) -> str:
+        """start a routing worker process
+
+        Returns:
+            str: the id of the worker
+        """
+        worker_id = str(uuid.uuid4())
+        worker_process = (self._worker_context or multiprocessing).Process(
+            target=self.worker.start,
+            daemon=True,
+            args=(
+                ObjectFactory.get_instance("factory"),
+                SingletonConfigurationFactory.get_instance(),
+                worker_id,
+            ),
+        )
+        worker_process.start()
+        self.workers[worker_id] = worker_process
+        return worker_id
+
+    def _retire_worker(self, worker_id: str):
+        """request a routing worker to exit once it processed the messages sent to it"""
+        self.routing_worker_pusher.retire_worker(worker_id.encode())
+        self.retiring_workers[worker_id] = (
+            time.monotonic() + self.zmanager_configuration.worker_timeout / 1000 * 2
+        )
+
+    def _supervise_workers(self):
+        """replace dead workers and scale the workers to the load once per scale interval"""
+        now = time.monotonic()
+        if now < self._next_supervision:
+            return
+        self._next_supervision = (
+            now + self.zmanager_configuration.worker_scale_interval / 1000
+        )
+        self._reap_workers(now)
+        self._scale_workers(now)
+
+    def _reap_workers(self, now: float):
+        """remove the workers which exited and replace those which were not retired"""
+        for worker_id, worker_process in list(self.workers.items()):
+            if worker_process.is_alive():
+                if self.retiring_workers.get(worker_id, now) < now:
+                    # the retired worker did not exit in time
+                    worker_process.terminate()
+                continue
+            del self.workers[worker_id]
+            lost = self.routing_worker_pusher.remove_worker(worker_id.encode())
+            if self.retiring_workers.pop(worker_id, None) is not None:
+                self.logger.debug("routing worker %s retired", worker_id)
+                continue
+            self.logger.error(
+                "routing worker %s exited with code %s, %d messages were lost",
+                worker_id,
+                worker_process.exitcode,
+                lost,
             )
-            worker_process.start()
-            self.workers.append(worker_process)
+            self._start_worker()
+
+    def _scale_workers(self, now: float):
+        """start workers while messages wait for a worker with credit and retire a worker
+        which was idle for the idle timeout"""
+        active = [
+            worker_id
+            for worker_id in self.workers
+            if worker_id not in self.retiring_workers
+        ]
+        min_worker_count = self.zmanager_configuration.min_worker_count
+        max_worker_count = self.zmanager_configuration.max_worker_count
+        routing_workers = self.routing_worker_pusher.routing_workers
+        backlog = len(self.routing_worker_pusher.backlog)
+
+        if len(active) < min_worker_count:
+            for _ in range(min_worker_count - len(active)):
+                self._start_worker()
+        elif backlog and len(active) < max_worker_count:
+            # wait for started workers to take their share of the backlog
+            if all(worker_id.encode() in routing_workers for worker_id in active):
+                needed = math.ceil(backlog / self.zmanager_configuration.worker_prefetch)
+                for _ in range(min(needed, max_worker_count - len(active))):
+                    self._start_worker()
+        elif not backlog and len(active) > min_worker_count:
+            idle_since = now - self.zmanager_configuration.worker_idle_timeout / 1000
+            # retire the last idle worker as messages are preferably sent to the first
+            for worker_id in reversed(active):
+                worker = routing_workers.get(worker_id.encode())
+                if (
+                    worker is not None
+                    and worker.in_flight == 0
+                    and worker.last_active < idle_since
+                ):
+                    self._retire_worker(worker_id)
+                    break
+
+    @property
+    def max_backlog(self) -> int:
+        """the number of messages in the backlog from which no further messages are received"""
+        configuration = self.zmanager_configuration
+        return (
+            max(configuration.max_worker_count, 1)
+            * configuration.worker_prefetch
+            * configuration.backlog_factor
+        )
+
+    def _update_backpressure(self):
+        """stop polling the frontend while the backlog is full and resume once the
+        workers took their share of it"""
+        paused = len(self.routing_worker_pusher.backlog) >= self.max_backlog
+        if paused == self.receiving_paused:
+            return
+        self.poller.modify(self.frontend_pull, 0 if paused else zmq.POLLIN)
+        self.receiving_paused = paused
+        if paused:
+            self.logger.warning("the backlog is full, receiving messages is paused")
+        else:
+            self.logger.debug("receiving messages is resumed")
+
+    @staticmethod
+    def _get_worker_context():
+        """get the context starting the workers after the zmq context of the subject was
+        created, the workers are not forked from the subject so that they don't inherit
+        its context and sockets"""
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            return multiprocessing.get_context("forkserver")
+        return multiprocessing.get_context("spawn")
 
     def _initiate_sockets(self):
         self.context = zmq.Context()
+        self._worker_context = self._get_worker_context()
         self.routing_worker_pusher.setup(bind=True)
         self._initialize_frontend_puller()
+        self.poller = zmq.Poller()
+        self.poller.register(self.frontend_pull, zmq.POLLIN)
+        self.poller.register(self.routing_worker_pusher.pusher_socket, zmq.POLLIN)
         self.integration_manager_pusher.setup()
+        if self.zmanager_configuration.batch_size > 1:
+            for pusher in (self.routing_worker_pusher, self.integration_manager_pusher):
+                pusher.enable_batching(
+                    self.zmanager_configuration.batch_size,
+                    self.zmanager_configuration.batch_linger,
+                )
 
     def _initialize_frontend_puller(self):
         self.frontend_pull = self.context.socket(zmq.PULL)
@@ -99,7 +249,7 @@ class Subject:
         self.frontend_pull.setsockopt(zmq.LINGER, 0)
 
     def cleanup(self):
-        for worker in self.workers:
+        for worker in self.workers.values():
             worker.terminate()
         self.routing_worker_pusher.teardown()
         self.frontend_pull.close()
@@ -113,17 +263,43 @@ class Subject:
 
         while self.running.is_set():
             try:
-                message = self.frontend_pull.recv_multipart()
-                self._forward_message(message)
+                events = self._poll()
+                if self.routing_worker_pusher.pusher_socket in events:
+                    self.routing_worker_pusher.receive_acknowledgements()
+                if self.frontend_pull in events:
+                    # a multipart message may contain several messages
+                    # as the pushers may batch them into one
+                    for message in self.serializer_container.split_zmanager_frames(
+                        self.frontend_pull.recv_multipart(copy=False)
+                    ):
+                        self._forward_message(message)
             except zmq.error.Again:
                 pass
             except Exception as ex:
                 self.logger.fatal("exception thrown in subject %s", ex, exc_info=True)
+            self.integration_manager_pusher.flush_if_due()
+            self._update_backpressure()
+            try:
+                self._supervise_workers()
+            except Exception as ex:
+                self.logger.error("failed to supervise the workers %s", ex, exc_info=True)
         self.cleanup()
         # exit gracefully without terminating the whole interpreter
         return
 
-    def _forward_message(self, message: list[bytes]):
+    def _poll(self) -> dict[zmq.Socket, int]:
+        """Wait for messages from the frontend or the workers, if messages are batched
+        only wait until the pending batch must be flushed and the workers must be supervised."""
+        timeouts = [
+            self.zmanager_configuration.subject_pull_timeout,
+            max(math.ceil((self._next_supervision - time.monotonic()) * 1000), 0),
+        ]
+        flush_timeout = self.integration_manager_pusher.flush_timeout()
+        if flush_timeout is not None:
+            timeouts.append(flush_timeout)
+        return dict(self.poller.poll(min(timeouts)))
+
+    def _forward_message(self, message: list[zmq.Frame]):
         """Forward the message to the appropriate destination. This involves determining
         the action key and the flow of the message. Based on this, the next action is
         determined and the message is sent to either the integration manager or the worker.
@@ -134,8 +310,8 @@ class Subject:
         else:
             self.routing_worker_pusher.push_container(request)
 
-    def _determine_next_action(self, message: list[bytes]) -> Request:
-        request = self.serializer_container.from_zmanager_message(message[0])
+    def _determine_next_action(self, message: list[zmq.Frame]) -> Request:
+        request = self.serializer_container.from_zmanager_frames(message)
         if request.action == "Push":
             next_action = self.action_flow_controller.get_next_message_action(request)
             request.action_key = next_action
@@ -152,8 +328,15 @@ class Subject:
             del state["workers"]
         if "context" in state:
             del state["context"]
+        if "poller" in state:
+            del state["poller"]
+        if "retiring_workers" in state:
+            del state["retiring_workers"]
+        state["_worker_context"] = None
+        state["receiving_paused"] = False
         return state
 
     def __setstate__(self, state):
         self.__dict__.update(state)
-        self.workers = []
+        self.workers = {}
+        self.retiring_workers = {}
@@ -0,0 +1,83 @@
+"""Benchmark of the encode and decode time and the bytes on the wire of the formats
+available to ZManager messages for representative domain payloads.
+
+Run from the repository root with:
+    python -m tests.benchmarks.format_benchmark
+"""
+
+import argparse
+import timeit
+
+from digitalpy.core.main.object_factory import ObjectFactory
+from digitalpy.core.parsing.formatter import Formatter
+from digitalpy.core.zmanager.request import Request
+from digitalpy.testing.domain_utilities import (
+    initialize_list_object,
+    initialize_nested_object,
+    initialize_simple_object,
+)
+from digitalpy.testing.facade_utilities import (
+    cleanup_test_environment,
+    initialize_test_environment,
+)
+
+FORMATS = ["pickled", "compact"]
+
+
+def build_payloads(request, response) -> dict:
+    """build the payloads to be benchmarked, every payload is the values of a message"""
+    simple_obj = initialize_simple_object(request, response)
+    simple_obj.string = "some string data"
+    simple_obj.number = 1234
+
+    nested_obj = initialize_nested_object(request, response)
+    nested_obj.string = "parent"
+    nested_obj.nested = initialize_simple_object(request, response)
+
+    list_obj = initialize_list_object(request, response)
+    for i in range(50):
+        child = initialize_simple_object(request, response)
+        child.string = f"item {i}"
+        child.number = i
+        list_obj.list_data = child
+
+    return {
+        "simple": {"model_object": simple_obj},
+        "nested": {"model_object": nested_obj},
+        "list of 50": {"model_object": list_obj},
+        "batch of 50": {"model_objects": [initialize_simple_object(request, response) for _ in range(50)]},
+    }
+
+
+def run(iterations: int):
+    request, response, _ = initialize_test_environment()
+    formatter: Formatter = ObjectFactory.get_instance("Formatter")
+    payloads = build_payloads(request, response)
+
+    print(f"{'payload':<14}{'format':<10}{'bytes':>10}{'encode us':>12}{'decode us':>12}")
+    for payload_name, values in payloads.items():
+        for format_name in FORMATS:
+            message_format = formatter.get_format(format_name)
+            message: Request = ObjectFactory.get_new_instance("Request")
+            message.set_values(values)
+            body = message_format.serialize_values(message)
+            encoded: Request = ObjectFactory.get_new_instance("Request")
+            encoded.set_values(body)
+
+            encode_time = timeit.timeit(
+                lambda: message_format.serialize_values(message), number=iterations
+            )
+            decode_time = timeit.timeit(
+                lambda: message_format.deserialize_values(encoded), number=iterations
+            )
+            print(
+                f"{payload_name:<14}{format_name:<10}{len(body):>10}"
+                f"{encode_time / iterations * 1e6:>12.1f}{decode_time / iterations * 1e6:>12.1f}"
+            )
+    cleanup_test_environment()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=1000)
+    run(parser.parse_args().iterations)
@@ -0,0 +1,22 @@
+import argparse
+
+from tests.benchmarks.zmanager_benchmark import run_configuration
+
+
+def test_zmanager_benchmark_routes_messages():
+    """smoke test of the zmanager benchmark with a few messages over ipc"""
+    arguments = argparse.Namespace(
+        messages=50,
+        window=10,
+        prefetch=10,
+        transport="ipc",
+        context="benchmark",
+        action="Route",
+        timeout=60,
+    )
+
+    result = run_configuration(1, 64, arguments)
+
+    assert result["messages"] == 50
+    assert result["messages_per_second"] > 0
+    assert result["latency_us"]["p50"] > 0
@@ -0,0 +1,315 @@
+"""End to end benchmark of the throughput and latency of messages routed through the
+ZManager. Requests are pushed to the subject, routed to passthrough workers and received
+from the integration manager publisher, every combination of the worker counts and
+payload sizes is measured with a freshly started ZManager over local ipc or tcp.
+
+The results can be written to a baseline file and compared against a previous baseline,
+for example to compare two commits.
+
+Run from the repository root with:
+    python -m tests.benchmarks.zmanager_benchmark --workers 1 4 --payload-sizes 64 4096 \
+        --baseline zmanager_baseline.json
+    python -m tests.benchmarks.zmanager_benchmark --workers 1 4 --payload-sizes 64 4096 \
+        --compare zmanager_baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+import time
+from typing import Optional
+
+import zmq
+
+from digitalpy.core.main.object_factory import ObjectFactory
+from digitalpy.core.main.singleton_configuration_factory import (
+    SingletonConfigurationFactory,
+)
+from digitalpy.core.serialization.controllers.serializer_container import (
+    SerializerContainer,
+)
+from digitalpy.core.zmanager.domain.model.zmanager_configuration import (
+    ZManagerConfiguration,
+)
+from digitalpy.core.zmanager.request import Request
+from digitalpy.testing.facade_utilities import (
+    cleanup_test_environment,
+    initialize_test_environment,
+)
+from tests.test_zmanager.zmanager_setup import ZmanagerSingleThreadSetup
+
+WORKER_CLASS = "tests.test_zmanager.zmanager_test_worker.TestRoutingWorker"
+
+# the addresses of the zmanager sockets which are replaced for every run
+ADDRESSES = [
+    "integration_manager_pub_address",
+    "integration_manager_pull_address",
+    "subject_pull_address",
+    "subject_push_address",
+]
+
+PERCENTILES = {"p50": 0.5, "p99": 0.99, "p999": 0.999}
+
+
+def configure_addresses(configuration: ZManagerConfiguration, transport: str, ipc_dir: str):
+    """point the zmanager sockets to unused local addresses of the transport"""
+    context = zmq.Context.instance()
+    for name in ADDRESSES:
+        if transport == "ipc":
+            address = f"ipc://{os.path.join(ipc_dir, name)}"
+        else:
+            # reserve a free port for the zmanager to bind to
+            sock = context.socket(zmq.ROUTER)
+            port = sock.bind_to_random_port("tcp://127.0.0.1")
+            sock.close(linger=0)
+            address = f"tcp://127.0.0.1:{port}"
+        setattr(configuration, name, address)
+
+
+def new_request(context: str, action: str, payload: bytes) -> Request:
+    request: Request = ObjectFactory.get_new_instance("Request")
+    request.context = context
+    request.action = action
+    request.set_value("payload", payload)
+    return request
+
+
+def percentile(ordered: list, fraction: float) -> float:
+    """the nearest rank percentile of the ordered values"""
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+def wait_until_routing(
+    sender: zmq.Socket,
+    receiver: zmq.Socket,
+    serializer_container: SerializerContainer,
+    context: str,
+    action: str,
+    payload: bytes,
+    timeout: float = 30,
+):
+    """send requests until one is received from the integration manager, so that the
+    workers are started and the subscription is established before the measurement"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        # a request is serialized in place, so every attempt sends a new request
+        request = new_request(context, action, payload)
+        sender.send_multipart(serializer_container.to_zmanager_frames(request))
+        if receiver.poll(200):
+            # discard the remaining warm up messages
+            while receiver.poll(500):
+                receiver.recv_multipart()
+            return
+    raise TimeoutError("no message was routed through the zmanager")
+
+
+def measure(
+    setup: ZmanagerSingleThreadSetup,
+    messages: int,
+    payload_size: int,
+    window: int,
+    context: str,
+    action: str,
+    timeout: float,
+) -> dict:
+    """measure the routing of the messages with at most window messages in flight"""
+    serializer_container: SerializerContainer = ObjectFactory.get_instance(
+        "SerializerContainer"
+    )
+    configuration = setup.zmanager_configuration
+    sender = setup.context.socket(zmq.PUSH)
+    sender.setsockopt(zmq.LINGER, 0)
+    sender.setsockopt(zmq.SNDHWM, 0)
+    sender.connect(configuration.subject_pull_address)
+    receiver = setup.integration_manager_subscriber
+    receiver.setsockopt(zmq.RCVHWM, 0)
+
+    payload = os.urandom(payload_size)
+    try:
+        wait_until_routing(sender, receiver, serializer_container, context, action, payload)
+
+        # serialize the requests before the measurement so that only the routing is measured
+        requests = []
+        for _ in range(messages):
+            request = new_request(context, action, payload)
+            requests.append(
+                (request.get_id().encode(), serializer_container.to_zmanager_frames(request))
+            )
+
+        sent_at: dict[bytes, int] = {}
+        latencies = []
+        sent = 0
+        deadline = time.monotonic() + timeout
+        started = time.perf_counter_ns()
+        while len(latencies) < messages:
+            while sent < messages and sent - len(latencies) < window:
+                message_id, frames = requests[sent]
+                sent_at[message_id] = time.perf_counter_ns()
+                sender.send_multipart(frames, copy=False)
+                sent += 1
+            if not receiver.poll(100):
+                if time.monotonic() > deadline:
+                    raise TimeoutError(
+                        f"received {len(latencies)} of {messages} messages in time"
+                    )
+                continue
+            while receiver.poll(0):
+                frames = receiver.recv_multipart(copy=False)
+                received = time.perf_counter_ns()
+                for message in serializer_container.split_zmanager_frames(frames):
+                    sent_time = sent_at.pop(message[1].bytes, None)
+                    if sent_time is not None:
+                        latencies.append(received - sent_time)
+        elapsed = (time.perf_counter_ns() - started) / 1e9
+    finally:
+        sender.close()
+
+    latencies.sort()
+    return {
+        "messages": messages,
+        "seconds": elapsed,
+        "messages_per_second": messages / elapsed,
+        "latency_us": {
+            name: percentile(latencies, fraction) / 1e3
+            for name, fraction in PERCENTILES.items()
+        },
+    }
+
+
+def run_configuration(
+    workers: int, payload_size: int, arguments: argparse.Namespace
+) -> dict:
+    """start a zmanager with the workers and measure the routing of the payload size"""
+    initialize_test_environment()
+    ipc_dir = tempfile.mkdtemp(prefix="zmanager_benchmark")
+    setup: Optional[ZmanagerSingleThreadSetup] = None
+    try:
+        configuration: ZManagerConfiguration = (
+            SingletonConfigurationFactory.get_configuration_object("ZManagerConfiguration")
+        )
+        configure_addresses(configuration, arguments.transport, ipc_dir)
+        configuration.worker_prefetch = arguments.prefetch
+        setup = ZmanagerSingleThreadSetup(workers=workers, worker_class=WORKER_CLASS)
+        setup.start()
+        result = measure(
+            setup,
+            arguments.messages,
+            payload_size,
+            arguments.window,
+            arguments.context,
+            arguments.action,
+            arguments.timeout,
+        )
+    finally:
+        if setup is not None:
+            setup.stop()
+        cleanup_test_environment()
+        shutil.rmtree(ipc_dir, ignore_errors=True)
+    return {
+        "transport": arguments.transport,
+        "workers": workers,
+        "payload_size": payload_size,
+        "window": arguments.window,
+        **result,
+    }
+
+
+def get_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def result_key(result: dict) -> tuple:
+    return (result["transport"], result["workers"], result["payload_size"], result["window"])
+
+
+def print_results(results: list[dict], previous: Optional[dict]):
+    """print the results and their change relative to the previous baseline"""
+    previous_results = {
+        result_key(result): result for result in (previous or {}).get("results", [])
+    }
+    print(
+        f"{'transport':<10}{'workers':>8}{'payload':>10}{'msg/s':>12}"
+        f"{'p50 us':>10}{'p99 us':>10}{'p999 us':>10}"
+    )
+    for result in results:
+        latency = result["latency_us"]
+        print(
+            f"{result['transport']:<10}{result['workers']:>8}{result['payload_size']:>10}"
+            f"{result['messages_per_second']:>12.0f}{latency['p50']:>10.0f}"
+            f"{latency['p99']:>10.0f}{latency['p999']:>10.0f}"
+        )
+        baseline = previous_results.get(result_key(result))
+        if baseline is None:
+            continue
+        changes = [
+            result["messages_per_second"] / baseline["messages_per_second"] - 1,
+            *(
+                latency[name] / baseline["latency_us"][name] - 1
+                if baseline["latency_us"][name]
+                else 0.0
+                for name in PERCENTILES
+            ),
+        ]
+        print(
+            f"{'':<10}{'':>8}{'change':>10}"
+            + "".join(f"{change:>+11.1%}" if i == 0 else f"{change:>+10.1%}" for i, change in enumerate(changes))
+        )
+
+
+def run(arguments: argparse.Namespace):
+    previous = None
+    if arguments.compare:
+        with open(arguments.compare, encoding="utf-8") as baseline_file:
+            previous = json.load(baseline_file)
+        print(f"comparing against {previous.get('commit')} from {previous.get('created')}")
+
+    results = [
+        run_configuration(workers, payload_size, arguments)
+        for workers in arguments.workers
+        for payload_size in arguments.payload_sizes
+    ]
+    print_results(results, previous)
+
+    if arguments.baseline:
+        baseline = {
+            "commit": get_commit(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "results": results,
+        }
+        with open(arguments.baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump(baseline, baseline_file, indent=2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--payload-sizes", type=int, nargs="+", default=[64, 4096, 65536])
+    parser.add_argument("--messages", type=int, default=10000)
+    parser.add_argument(
+        "--window", type=int, default=100, help="the maximum number of messages in flight"
+    )
+    parser.add_argument("--prefetch", type=int, default=10, help="the credit of every worker")
+    parser.add_argument("--transport", choices=["ipc", "tcp"], default="ipc")
+    parser.add_argument("--context", default="benchmark")
+    parser.add_argument("--action", default="Route")
+    parser.add_argument(
+        "--timeout", type=float, default=120, help="the seconds to wait for a run"
+    )
+    parser.add_argument("--baseline", help="write the results to this json file")
+    parser.add_argument("--compare", help="compare the results with this json file")
+    run(parser.parse_args())
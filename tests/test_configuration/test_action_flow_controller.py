@@ -168,4 +168,55 @@ def test_get_all_flow_actions_one(file_facades: Files):
 
     actions = action_flow_controller.get_all_flow_actions(request.action_key)
     assert len(actions) == 1
-    assert actions[0].action == "TestDELETELoan"
\ No newline at end of file
+    assert actions[0].action == "TestDELETELoan"
+
+def test_get_next_action_matches_first_step(file_facades: Files):
+    """test that the get_next_action method resolves to the first step of the flow
+    matching the action, even when a later step matches it exactly."""
+    action_flow_controller = ActionFlowController()
+    action_flow_file = str(
+        PurePath(__file__).parent
+        / PurePath("test_actionflow_resources", "wildcard_actionflow.ini")
+    )
+    file = file_facades.get_or_create_file(path=action_flow_file)
+    action_flow_controller.create_action_flow(file)
+
+    request: Request = ObjectFactory.get_instance("Request")
+    request.sender = "ExampleService"
+    request.context = "context"
+    request.action = "Push"
+    request.set_flow_name("wildcardflow")
+    next_action = action_flow_controller.get_next_message_action(request)
+
+    assert next_action is not None
+    assert next_action.source == "ExampleService"
+    assert next_action.action == "Push"
+
+def test_get_flow_actions_matching(file_facades: Files):
+    """test that the actions matching any of several action keys are those returned by
+    get_all_flow_actions for each action key, ordered by flow and position"""
+    action_flow_controller = ActionFlowController()
+    action_flow_file = str(
+        PurePath(__file__).parent
+        / PurePath("test_actionflow_resources", "complex_actionflow.ini")
+    )
+    file = file_facades.get_or_create_file(path=action_flow_file)
+    action_flow_controller.create_action_flow(file)
+
+    action_keys = []
+    for action in ["TestDELETELoan", "Publish", "TestGETLoan"]:
+        request: Request = ObjectFactory.get_new_instance("Request")
+        request.action = action
+        action_keys.append(request.action_key)
+
+    actions = action_flow_controller.get_flow_actions_matching(action_keys)
+
+    assert sorted(map(id, actions)) == sorted(
+        id(action)
+        for action_key in action_keys
+        for action in action_flow_controller.get_all_flow_actions(action_key)
+    )
+    loan_actions = [action.action for action in actions if "Loan" in action.context]
+    assert loan_actions == [
+        "Publish", "TestDELETELoan", "Publish", "TestGETLoan", "Publish", "Publish"
+    ]
@@ -0,0 +1,54 @@
+import os
+from pathlib import PurePath
+
+from digitalpy.core.digipy_configuration.impl.inifile_configuration import InifileConfiguration
+from digitalpy.core.main.impl import configuration_factory
+from digitalpy.core.main.impl.configuration_factory import ConfigurationFactory
+from digitalpy.testing.facade_utilities import test_environment
+
+
+def _action_mapping_configuration():
+    configuration = InifileConfiguration(str(PurePath(__file__).parent / "test_configuration_resources"))
+    configuration.add_configuration(os.sep+"action_mapping_config.ini")
+    return configuration
+
+
+def test_resolve_action_key_most_specific(test_environment):
+    factory = ConfigurationFactory()
+    factory.add_configuration(_action_mapping_configuration())
+
+    assert factory.resolve_action_key("Sender", "Context", "Action").target == "module.Controller.specific"
+    assert factory.resolve_action_key("Sender", "Other", "Action").target == "module.Controller.sender_action"
+    assert factory.resolve_action_key("Other", "Other", "Action").target == "module.Controller.action"
+    assert factory.resolve_action_key("Other", "Context", "Other").target == "module.Controller.context"
+
+
+def test_resolve_action_key_does_not_memoize_misses(test_environment):
+    factory = ConfigurationFactory()
+    factory.add_configuration(_action_mapping_configuration())
+
+    assert factory.resolve_action_key("Other", "Other", "Other") is None
+    assert ("Other", "Other", "Other") not in factory.action_key_index
+
+
+def test_resolve_action_key_index_bounded(test_environment, monkeypatch):
+    monkeypatch.setattr(configuration_factory, "MAX_ACTION_KEY_INDEX_SIZE", 0)
+    factory = ConfigurationFactory()
+    factory.add_configuration(_action_mapping_configuration())
+    indexed = len(factory.action_key_index)
+
+    for i in range(10):
+        assert factory.resolve_action_key(f"Source{i}", "Other", "Action") is not None
+
+    assert len(factory.action_key_index) == indexed
+
+
+def test_resolve_action_key_invalidated_on_remove(test_environment):
+    factory = ConfigurationFactory()
+    configuration = _action_mapping_configuration()
+    factory.add_configuration(configuration)
+    assert factory.resolve_action_key("Sender", "Context", "Action") is not None
+
+    factory.remove_configuration(configuration)
+
+    assert factory.resolve_action_key("Sender", "Context", "Action") is None
@@ -0,0 +1,43 @@
+import json
+import os
+from string import Template
+
+from digitalpy.core.parsing.load_configuration import LoadConfiguration
+
+MODEL_DEFINITION = {
+    "definitions": {
+        "Parent": {
+            "properties": {
+                "child": {"$ref": "#/definitions/Child"},
+                "children": {"type": "array", "items": {"$ref": "#/definitions/Child"}},
+            }
+        },
+        "Child": {"properties": {}},
+    }
+}
+
+
+def test_configuration_cached_until_modified(tmp_path):
+    """Test that a model definition is parsed once and shared until its file is modified"""
+    definition_path = tmp_path / "parent.json"
+    definition_path.write_text(json.dumps(MODEL_DEFINITION))
+    first_loader = LoadConfiguration(Template(str(tmp_path / "$message_type.json")))
+    second_loader = LoadConfiguration(Template(str(tmp_path / "$message_type.json")))
+
+    configuration = first_loader.find_configuration("Parent")
+
+    assert second_loader.find_configuration("Parent") is configuration
+    assert configuration.elements["Parent"].relationships["children"].max_occurs == "*"
+
+    definition = dict(MODEL_DEFINITION["definitions"])
+    del definition["Child"]
+    definition_path.write_text(json.dumps({"definitions": definition}))
+    modified = os.stat(definition_path).st_mtime_ns + 1_000_000_000
+    os.utime(definition_path, ns=(modified, modified))
+
+    reloaded = first_loader.find_configuration("Parent")
+    assert reloaded is not configuration
+    assert "Child" not in reloaded.elements
+
+    LoadConfiguration.invalidate(tmp_path)
+    assert first_loader.find_configuration("Parent") is not reloaded
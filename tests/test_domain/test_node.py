@@ -0,0 +1,70 @@
+import re
+
+from digitalpy.core.domain.node import Node
+from digitalpy.core.main.object_factory import ObjectFactory
+from digitalpy.core.parsing.load_configuration import (
+    ConfigurationEntry,
+    ModelConfiguration,
+    Relationship,
+)
+from digitalpy.testing.domain_objects import ListObject, SimpleObject
+from digitalpy.testing.facade_utilities import test_environment
+
+MODEL = {"ListObject": ListObject, "SimpleObject": SimpleObject}
+MODEL_CONFIGURATION = ModelConfiguration(
+    elements={
+        "ListObject": ConfigurationEntry(
+            relationships={"list_data": Relationship(0, "*", "SimpleObject")}
+        ),
+        "SimpleObject": ConfigurationEntry(),
+    }
+)
+
+
+def _create_node(node_class: type, string: str = None, number: int = None) -> Node:
+    oid = ObjectFactory.get_instance(
+        "ObjectId", {"id": string or "list", "type": node_class.__name__}
+    )
+    node = node_class(MODEL_CONFIGURATION, MODEL, oid)
+    node.string = string
+    if number is not None:
+        node.number = number
+    return node
+
+
+def test_children_indexed_by_type_oid_and_role(test_environment):
+    """test that the children are looked up through the indexes and removed from them"""
+    parent = _create_node(ListObject)
+    first = _create_node(SimpleObject, "abc", 1)
+    second = _create_node(SimpleObject, "def", 2)
+    parent.list_data = first
+    parent.list_data = second
+
+    assert parent.get_children_ex(children_type="SimpleObject") == [first, second]
+    assert parent.get_children_ex(role="list_data") == [first, second]
+    assert parent.get_children_ex(oid=second.get_oid()) == [second]
+    assert parent.get_children_ex(oid=second.oid, role="other") == []
+
+    parent.delete_child(first.oid)
+
+    assert parent.list_data == [second]
+    assert parent.get_children_ex(role="list_data") == [second]
+
+
+def test_filter_with_compiled_predicates(test_environment):
+    """test that regular expressions, values and predicates are matched against the properties"""
+    parent = _create_node(ListObject)
+    first = _create_node(SimpleObject, "abc", 1)
+    second = _create_node(SimpleObject, "abd", 2)
+    parent.list_data = first
+    parent.list_data = second
+
+    assert parent.get_children_ex(properties={"string": "^ab"}) == [first, second]
+    assert parent.get_children_ex(properties={"string": "c$"}) == [first]
+    assert parent.get_children_ex(properties={"string": "ab"}, use_regex=False) == []
+    assert parent.get_children_ex(properties={"number": 2}, use_regex=False) == [second]
+
+    predicates = Node.compile_predicates(
+        {"string": re.compile("^ab"), "number": lambda number: number > 1}
+    )
+    assert parent.get_children_ex(properties=predicates) == [second]
@@ -5,7 +5,9 @@ from pathlib import Path
 
 import pytest
 
+from digitalpy.core.files.configuration.Files_constants import INDEXED_ATTRIBUTES
 from digitalpy.core.files.files_facade import Files
+from digitalpy.core.main.object_factory import ObjectFactory
 from digitalpy.testing.facade_utilities import (
     initialize_facade,
     test_environment
@@ -123,3 +125,23 @@ def test_update_file(files_facade: Files, temp_dir: tempfile.TemporaryDirectory)
     assert file_path.exists()
     with open(file_path, "rb") as f:
         assert f.read() == b"New content"
+
+
+def test_stored_files_are_indexed_on_registration(
+    files_facade: Files, temp_dir: tempfile.TemporaryDirectory
+):
+    """Test the files stored before the search is registered are indexed."""
+    # Arrange
+    file_path = Path(temp_dir) / "test_indexed_file.txt"
+    file_obj = files_facade.create_file(path=str(file_path), config_loader=None)
+    files_facade.persistence_controller.save_file(file_obj)
+    search = ObjectFactory.get_instance("IndexedSearch")
+    search.reset_index()
+
+    # Act
+    files_facade.persistence_controller.register_search(INDEXED_ATTRIBUTES)
+
+    # Assert
+    assert search.find_term("path", str(file_path)) == [str(file_obj.get_oid())]
+    files_facade.persistence_controller.remove_file(file_obj)
+    assert search.find_term("path", str(file_path)) == []
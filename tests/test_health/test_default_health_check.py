@@ -0,0 +1,39 @@
+import logging
+
+from digitalpy.core.health.impl.default_health_check import DefaultHealthCheckController
+from digitalpy.core.health.impl.log_health_evaluator import LogHealthEvaluator
+from digitalpy.core.main.impl.default_file_logger import DefaultFileLogger
+from digitalpy.testing.facade_utilities import test_environment
+
+
+def test_health_of_queued_logger(test_environment, tmp_path):
+    """test that the log file is found when the handlers of the logger were replaced by
+    a queue handler"""
+    request, response, configuration = test_environment
+    log_path = tmp_path / "component.log"
+    parent = logging.getLogger("HealthCheckTest")
+    parent.propagate = False
+    file_handler = logging.FileHandler(log_path)
+    file_handler.setFormatter(logging.Formatter("%(asctime)s %(name)-12s %(levelname)-8s %(message)s"))
+    parent.addHandler(file_handler)
+    DefaultFileLogger._enqueue_handlers(parent)
+    listener = DefaultFileLogger.queue_listeners[-1][2]
+    logger = logging.getLogger("HealthCheckTest.component")
+    try:
+        logger.critical("component failed")
+        # write the queued record
+        listener.stop()
+
+        controller = DefaultHealthCheckController(request, response, None, configuration)
+        controller.get_health(logger)
+
+        assert response.get_value("health") is False
+        assert "component failed" in response.get_value("error")
+    finally:
+        DefaultFileLogger.queue_listeners = [
+            entry for entry in DefaultFileLogger.queue_listeners if entry[2] is not listener
+        ]
+        for handler in list(parent.handlers):
+            parent.removeHandler(handler)
+        file_handler.close()
+        LogHealthEvaluator.clear()
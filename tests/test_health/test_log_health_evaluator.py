@@ -0,0 +1,72 @@
+import os
+
+from digitalpy.core.health.impl.log_health_evaluator import LogHealthEvaluator
+
+
+def _log(path, *lines: str):
+    with open(path, "a", encoding="utf-8") as log_file:
+        for line in lines:
+            log_file.write(f"2024-01-01 00:00:00,000 component {line}\n")
+
+
+def test_only_appended_lines_are_counted(tmp_path):
+    """test that every line is counted once and errors and warnings expire with the window"""
+    path = tmp_path / "component.log"
+    _log(path, "INFO     started", "WARNING  slow", "ERROR    failed")
+    evaluator = LogHealthEvaluator(str(path), window=60, bucket_size=10)
+
+    assert evaluator.evaluate(now=0) == {"health": True, "error": "", "errors": 1, "warnings": 1}
+
+    _log(path, "ERROR    failed again")
+    with open(path, "a", encoding="utf-8") as log_file:
+        log_file.write("2024-01-01 00:00:01,000 component CRITICAL ")
+
+    result = evaluator.evaluate(now=30)
+    assert result["health"] and result["errors"] == 2
+
+    # the critical line is counted once it is complete
+    with open(path, "a", encoding="utf-8") as log_file:
+        log_file.write("crashed\n")
+    result = evaluator.evaluate(now=35)
+    assert not result["health"]
+    assert result["error"].endswith("CRITICAL crashed")
+    assert result["errors"] == 3
+
+    result = evaluator.evaluate(now=75)
+    assert not result["health"]
+    assert result["errors"] == 2 and result["warnings"] == 0
+
+
+def test_rotated_and_truncated_log(tmp_path):
+    """test that the remainder of a rotated log is read before the new log"""
+    path = tmp_path / "component.log"
+    _log(path, "CRITICAL crashed")
+    evaluator = LogHealthEvaluator(str(path))
+    assert not evaluator.evaluate(now=0)["health"]
+
+    _log(path, "WARNING  before rotation")
+    os.rename(path, tmp_path / "component.log.1")
+    _log(path, "ERROR    after rotation")
+
+    assert evaluator.evaluate(now=1) == {"health": True, "error": "", "errors": 2, "warnings": 1}
+
+    _log(path, "CRITICAL crashed")
+    assert not evaluator.evaluate(now=2)["health"]
+
+    open(path, "w", encoding="utf-8").close()
+    _log(path, "INFO     restarted")
+    assert evaluator.evaluate(now=3)["health"]
+    evaluator.close()
+
+
+def test_evaluators_shared_by_path(tmp_path):
+    """test that the health checks of a process share the evaluator of a log file"""
+    path = str(tmp_path / "component.log")
+    try:
+        evaluator = LogHealthEvaluator.get_evaluator(path)
+        assert LogHealthEvaluator.get_evaluator(path) is evaluator
+        assert evaluator.evaluate()["health"]
+    finally:
+        LogHealthEvaluator.clear()
+    assert LogHealthEvaluator.get_evaluator(path) is not evaluator
+    LogHealthEvaluator.clear()
@@ -1,4 +1,5 @@
 from digitalpy.core.IAM.persistence.user import User
+from digitalpy.core.main.object_factory import ObjectFactory
 from digitalpy.testing.facade_utilities import test_environment, initialize_facade
 from digitalpy.core.IAM.configuration import iam_constants
 
@@ -47,4 +48,35 @@ def test_default_anonymous_instantiation(test_environment):
     assert anonymous_user.system_user.certificate_package_name == "anonymous"
 
     assert len(anonymous_user.system_user.system_user_groups) == 1
-    assert anonymous_user.system_user.system_user_groups[0].system_group.name == "unauthenticated_users"
\ No newline at end of file
+    assert anonymous_user.system_user.system_user_groups[0].system_group.name == "unauthenticated_users"
+
+def test_saved_users_are_indexed(test_environment):
+    """test that the users saved and removed by the persistence controller update the
+    configured indexed search"""
+    request, response, _ = test_environment
+    iam_facade = initialize_facade("digitalpy.core.IAM.IAM_facade.IAM", request, response)
+    search = ObjectFactory.get_instance("IndexedSearch")
+    user = User(uid="indexed-user", callsign="Indexed", CN="Indexed", status="connected")
+    user.system_user_uid = iam_facade.persistency_controller.get_all_system_users()[0].uid
+
+    iam_facade.persistency_controller.save_user(user)
+    assert search.find_term("callsign", "Indexed") == ["indexed-user"]
+
+    iam_facade.persistency_controller.remove_user(user)
+    assert search.find_term("callsign", "Indexed") == []
+
+def test_stored_users_are_indexed_on_registration(test_environment):
+    """test that the users stored before the search is registered are indexed and looked
+    up through the search"""
+    request, response, _ = test_environment
+    iam_facade = initialize_facade("digitalpy.core.IAM.IAM_facade.IAM", request, response)
+    search = ObjectFactory.get_instance("IndexedSearch")
+    search.reset_index()
+
+    iam_facade.persistency_controller.register_search(iam_constants.INDEXED_ATTRIBUTES)
+    uids = search.find_term("CN", "Administrator")
+    assert len(uids) == 1
+
+    request.set_value("cn", "Administrator")
+    iam_facade.execute("get_user_by_cn")
+    assert [user.uid for user in response.get_value("users")] == uids
@@ -0,0 +1,70 @@
+import json
+from unittest import mock
+
+import rule_engine
+
+from digitalpy.core.logic.impl.default_business_rule_controller import (
+    DefaultBusinessRuleController,
+    RuleSetIndex,
+)
+from digitalpy.core.main.object_factory import ObjectFactory
+from digitalpy.testing.facade_utilities import (
+    test_environment,
+)
+
+BUSINESS_RULES = {
+    "rules": {
+        'type == "a-f-G"': {"actions": ["HandleFriendly"]},
+        'type == "a-h-G" and speed > 10': {"actions": ["HandleFastHostile"]},
+        'type == "a-h-G"': {"actions": ["HandleHostile"]},
+        "speed > 100": {"actions": ["HandleFast"]},
+    }
+}
+
+
+def _create_controller(business_rules_path) -> DefaultBusinessRuleController:
+    return DefaultBusinessRuleController(
+        business_rules_path=str(business_rules_path),
+        internal_action_mapper=mock.MagicMock(),
+        request=ObjectFactory.get_new_instance("request"),
+        response=ObjectFactory.get_new_instance("response"),
+        action_mapper=None,
+        configuration=None,
+    )
+
+
+def test_rule_set_index_candidates():
+    """Test that only the rules which can match the value of the indexed attribute are visited"""
+    index = RuleSetIndex(BUSINESS_RULES)
+
+    assert index.attribute == "type"
+    assert index.candidates({"type": "a-h-G"}, rule_engine.resolve_item) == [
+        'type == "a-h-G" and speed > 10',
+        'type == "a-h-G"',
+        "speed > 100",
+    ]
+    assert index.candidates({"type": "b-t-f"}, rule_engine.resolve_item) == ["speed > 100"]
+    assert index.candidates({}, rule_engine.resolve_item) == list(BUSINESS_RULES["rules"])
+
+
+def test_business_rules_evaluated_with_cached_rules(test_environment, tmp_path):
+    """Test that the business rules and the compiled rules are shared between controllers"""
+    business_rules_path = tmp_path / "business_rules.json"
+    business_rules_path.write_text(json.dumps(BUSINESS_RULES))
+
+    controller = _create_controller(business_rules_path)
+    assert _create_controller(business_rules_path).business_rules is controller.business_rules
+
+    actions = []
+    controller.internal_action_mapper.process_action.side_effect = (
+        lambda request, response: actions.append(request.get_action())
+    )
+    controller.request.set_value("type", "a-h-G")
+    controller.request.set_value("speed", 20)
+    controller.evaluate_request()
+
+    assert actions == ["HandleFastHostile", "HandleHostile"]
+    assert (
+        DefaultBusinessRuleController.compile_rule('type == "a-h-G"', rule_engine.resolve_item)
+        is DefaultBusinessRuleController.compile_rule('type == "a-h-G"', rule_engine.resolve_item)
+    )
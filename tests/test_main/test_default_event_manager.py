@@ -0,0 +1,76 @@
+import pickle
+import threading
+
+from digitalpy.core.main.event import Event
+from digitalpy.core.main.impl.default_event_manager import DefaultEventManager
+from digitalpy.core.main.object_factory import ObjectFactory
+from digitalpy.testing.facade_utilities import test_environment
+
+
+class _Event(Event):
+    def __init__(self):
+        self.received = []
+
+
+def _fail():
+    raise AssertionError("the event must not be created without listeners")
+
+
+def test_listeners_per_instance():
+    """test that listeners are registered per event manager and notified until the event is stopped"""
+    first = DefaultEventManager()
+    second = DefaultEventManager()
+    first.add_listener("event", lambda event: event.received.append(1))
+    first.add_listener("event", lambda event: event.stop_propagation())
+    first.add_listener("event", lambda event: event.received.append(3))
+
+    event = _Event()
+    first.dispatch("event", event)
+
+    assert event.received == [1]
+    assert not second.has_listeners("event")
+    assert second.dispatch("event", _fail) is None
+
+
+def test_remove_listener():
+    """test that the event is not created once its last listener was removed"""
+    event_manager = DefaultEventManager()
+    received = []
+    event_manager.add_listener("event", received.append)
+    event_manager.dispatch("event", _Event)
+
+    event_manager.remove_listener("event", received.append)
+    event_manager.remove_listener("event", received.append)
+    event_manager.dispatch("event", _fail)
+
+    assert len(received) == 1
+    assert not event_manager.has_listeners("event")
+
+
+def test_asynchronous_dispatch():
+    """test that asynchronous events are dispatched by the executor"""
+    event_manager = DefaultEventManager(max_workers=1, max_pending=1)
+    threads = []
+    event_manager.add_listener("event", lambda event: threads.append(threading.current_thread()))
+    try:
+        futures = [event_manager.dispatch("event", _Event, asynchronous=True) for _ in range(3)]
+        for future in futures:
+            future.result(timeout=2)
+    finally:
+        event_manager.shutdown()
+
+    assert len(threads) == 3
+    assert threading.current_thread() not in threads
+
+    # the executor is not serialized with the event manager
+    restored = pickle.loads(pickle.dumps(DefaultEventManager()))
+    assert not restored.has_listeners("event")
+
+
+def test_event_manager_configured(test_environment):
+    """test that the event manager is created with its configured bounds"""
+    event_manager = ObjectFactory.get_instance("event_manager")
+
+    assert isinstance(event_manager, DefaultEventManager)
+    assert event_manager.max_workers == 4
+    assert event_manager.max_pending == 1000
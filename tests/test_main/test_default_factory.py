@@ -0,0 +1,82 @@
+from pathlib import PurePath
+
+from digitalpy.core.digipy_configuration.impl.inifile_configuration import InifileConfiguration
+from digitalpy.core.main.impl.default_factory import DefaultFactory
+
+
+class Dependency:
+    pass
+
+
+class Dependant:
+    def __init__(self, dependency: Dependency, name: str):
+        self.dependency = dependency
+        self.name = name
+
+
+class Optional:
+    def __init__(self, optional_dependency: Dependency = None):
+        self.optional_dependency = optional_dependency
+
+
+def _initialize_factory() -> DefaultFactory:
+    configuration = InifileConfiguration(
+        str(PurePath(__file__).parent / "test_main_resources") + "/"
+    )
+    configuration.add_configuration("factory_config.ini")
+    return DefaultFactory(configuration)
+
+
+def test_construction_plan_cached():
+    """Test that the construction plan of a class is compiled once and reused"""
+    factory = _initialize_factory()
+
+    first = factory.get_new_instance("Dependant")
+    second = factory.get_new_instance("Dependant")
+
+    assert first is not second
+    assert first.name == "configured"
+    assert isinstance(first.dependency, Dependency)
+    assert first.dependency is second.dependency
+    plan = factory.get_construction_plan("Dependant", "tests.test_main.test_default_factory.Dependant")
+    assert plan.instance_class is Dependant
+    assert [param.name for param in plan.parameters] == ["dependency", "name"]
+    assert plan is factory.get_construction_plan("Dependant", "tests.test_main.test_default_factory.Dependant")
+
+
+def test_construction_plan_invalidated_by_configuration_change():
+    """Test that the construction plans are recompiled when the configuration changes"""
+    factory = _initialize_factory()
+
+    assert factory.get_new_instance("Optional").optional_dependency is None
+
+    factory.configuration.add_configuration("factory_dependency_config.ini")
+
+    assert isinstance(factory.get_new_instance("Optional").optional_dependency, Dependency)
+
+
+def test_register_instance_publishes_new_registry():
+    """Test that registering an instance does not modify a registry snapshot held by a reader"""
+    factory = _initialize_factory()
+    snapshot = factory.instances
+    dependency = Dependency()
+
+    factory.register_instance("Dependency", dependency)
+
+    assert "dependency" not in snapshot
+    assert factory.get_instance("Dependency") is dependency
+
+    factory.clear_instance("Dependency")
+
+    assert factory.get_instance("Dependency") is not dependency
+
+
+def test_stack_tracking():
+    """Test that the instance stack is balanced with and without stack tracking"""
+    factory = _initialize_factory()
+    factory.get_new_instance("Dependant")
+    assert factory.current_stack == []
+
+    factory = DefaultFactory(factory.configuration, track_stack=True)
+    assert factory.get_new_instance("Dependant").name == "configured"
+    assert factory.current_stack == []
@@ -0,0 +1,62 @@
+import logging.config
+from logging.handlers import QueueHandler
+
+from digitalpy.core.main.impl.default_file_logger import DefaultFileLogger
+
+LOGGING_CONFIGURATION = """[loggers]
+keys=root,FileLoggerTest
+
+[handlers]
+keys=fileHandler
+
+[formatters]
+keys=formatter
+
+[logger_root]
+level=DEBUG
+handlers=
+
+[logger_FileLoggerTest]
+level=DEBUG
+qualname=FileLoggerTest
+handlers=fileHandler
+propagate=0
+
+[handler_fileHandler]
+class=FileHandler
+level=DEBUG
+formatter=formatter
+args=('%(logfilename)s',)
+
+[formatter_formatter]
+format=%(name)s %(message)s
+"""
+
+
+def test_logging_configuration_applied_once(tmp_path, monkeypatch):
+    """Test that the logging configuration of a component is applied once and the records
+    are written to the log file by the listener"""
+    config_file = tmp_path / "logging.conf"
+    config_file.write_text(LOGGING_CONFIGURATION)
+    monkeypatch.setattr(DefaultFileLogger, "base_logging_path", str(tmp_path / "logs"))
+    calls = []
+    file_config = logging.config.fileConfig
+    monkeypatch.setattr(
+        logging.config,
+        "fileConfig",
+        lambda *args, **kwargs: calls.append(args) or file_config(*args, **kwargs),
+    )
+
+    first = DefaultFileLogger("FileLoggerTest", str(config_file))
+    second = DefaultFileLogger("FileLoggerTest", str(config_file))
+
+    assert len(calls) == 1
+    assert first.get_logger() is second.get_logger()
+    assert isinstance(first.get_logger().handlers[0], QueueHandler)
+
+    first.info("queued message")
+    log_file = first.get_log_files()[0]
+    DefaultFileLogger.stop_listeners()
+
+    with open(log_file, encoding="utf-8") as log:
+        assert log.read() == "FileLoggerTest queued message\n"
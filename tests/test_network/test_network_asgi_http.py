@@ -0,0 +1,138 @@
+import asyncio
+import threading
+
+from digitalpy.core.main.object_factory import ObjectFactory
+from digitalpy.core.network.domain.client_status import ClientStatus
+from digitalpy.core.network.impl.network_asgi_http import (
+    NETWORK_ID_COOKIE,
+    ASGIHTTPNetwork,
+)
+from digitalpy.core.zmanager.response import Response
+from digitalpy.testing.facade_utilities import test_environment
+
+
+async def _call(network: ASGIHTTPNetwork, path: str, query: bytes = b"", cookie: bytes = None):
+    """call the ASGI application and return the status, headers and body of the response"""
+    headers = [(b"cookie", cookie)] if cookie else []
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": query,
+        "headers": headers,
+    }
+    events = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(event):
+        events.append(event)
+
+    await network.asgi_app(scope, receive, send)
+    return events[0]["status"], dict(events[0]["headers"]), events[1]["body"]
+
+
+def _respond_in_reverse(network: ASGIHTTPNetwork, count: int, disconnections: list):
+    """answer the requests of the network once all of them were received, in reverse order"""
+    requests = []
+    while len(requests) < count:
+        for request in network.service_connections(blocking=True, timeout=2000):
+            if request.get_value("action") == "disconnection":
+                disconnections.append(request)
+            else:
+                requests.append(request)
+    for request in reversed(requests):
+        response: Response = ObjectFactory.get_new_instance("Response")
+        response.set_id(request.get_id())
+        response.set_value("message", {"index": request.get_value("index")})
+        network.send_response(response)
+
+
+def test_concurrent_requests_receive_their_response(test_environment):
+    """test that concurrent requests awaiting the service receive the response to their request"""
+    network = ASGIHTTPNetwork(response_timeout=5, max_clients=4)
+    network.initialize_network("127.0.0.1", 0, available_endpoints=["echo"], start_server=False)
+    disconnections = []
+    service = threading.Thread(target=_respond_in_reverse, args=(network, 10, disconnections))
+    service.start()
+
+    async def run():
+        responses = await asyncio.gather(
+            *(_call(network, "/echo", f"index={i}".encode()) for i in range(10))
+        )
+        await network.dispatcher.stop()
+        return responses
+
+    try:
+        responses = asyncio.run(run())
+        service.join()
+    finally:
+        network.teardown_network()
+
+    for i, (status, _, body) in enumerate(responses):
+        assert status == 200
+        assert body == f'{{"index": "{i}"}}'.encode()
+    # the least recently active clients were disconnected
+    assert len(network.clients) == 4
+    assert len(disconnections) == 6
+    assert all(
+        request.get_value("client").status == ClientStatus.DISCONNECTED
+        for request in disconnections
+    )
+
+
+def test_client_identified_by_cookie(test_environment):
+    """test that requests with the network id cookie belong to the same client"""
+    network = ASGIHTTPNetwork(response_timeout=0.2)
+    network.initialize_network("127.0.0.1", 0, available_endpoints=["echo"], start_server=False)
+
+    async def run():
+        first = await _call(network, "/echo")
+        cookie = first[1][b"set-cookie"].split(b";")[0]
+        second = await _call(network, "/echo", cookie=cookie)
+        missing = await _call(network, "/missing")
+        await network.dispatcher.stop()
+        return first, second, missing, cookie
+
+    try:
+        first, second, missing, cookie = asyncio.run(run())
+        requests = network.service_connections()
+    finally:
+        network.teardown_network()
+
+    # the service didn't respond in time
+    assert first[0] == 504 and second[0] == 504
+    assert b"set-cookie" not in second[1]
+    assert missing[0] == 404
+    assert cookie.startswith(NETWORK_ID_COOKIE.encode())
+    assert len(requests) == 2
+    assert requests[0].get_value("client") is requests[1].get_value("client")
+
+
+def test_forged_cookie_is_a_new_client(test_environment):
+    """test that a network id cookie without a valid signature is not accepted"""
+    network = ASGIHTTPNetwork(response_timeout=0.2)
+    network.initialize_network("127.0.0.1", 0, available_endpoints=["echo"], start_server=False)
+
+    async def run():
+        first = await _call(network, "/echo")
+        cookie = first[1][b"set-cookie"].split(b";")[0]
+        network_id = cookie.split(b"=", 1)[1].rsplit(b".", 1)[0]
+        forged = await _call(
+            network, "/echo", cookie=NETWORK_ID_COOKIE.encode() + b"=" + network_id + b".0"
+        )
+        unsigned = await _call(network, "/echo", cookie=NETWORK_ID_COOKIE.encode() + b"=" + network_id)
+        await network.dispatcher.stop()
+        return forged, unsigned, network_id
+
+    try:
+        forged, unsigned, network_id = asyncio.run(run())
+        requests = network.service_connections()
+    finally:
+        network.teardown_network()
+
+    assert b"set-cookie" in forged[1] and b"set-cookie" in unsigned[1]
+    assert len(requests) == 3
+    assert len({request.get_value("client").id for request in requests}) == 3
+    assert requests[0].get_value("client").id == network_id
@@ -0,0 +1,44 @@
+from sqlalchemy import text
+
+from digitalpy.core.persistence.impl.engine_registry import EngineRegistry
+
+
+def test_engine_shared_and_pooled(tmp_path):
+    """Test that the engine of a database is created once per process and uses WAL mode"""
+    db_path = "sqlite:///" + str(tmp_path / "shared.db")
+
+    engine = EngineRegistry.get_engine(db_path)
+
+    assert EngineRegistry.get_engine(db_path) is engine
+    with engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+    assert engine.pool.checkedin() == 1
+    EngineRegistry.dispose_engine(db_path)
+
+
+def test_engine_recreated_in_forked_process(tmp_path, monkeypatch):
+    """Test that engines inherited from a parent process are not reused"""
+    db_path = "sqlite:///" + str(tmp_path / "forked.db")
+    engine = EngineRegistry.get_engine(db_path)
+
+    monkeypatch.setattr(EngineRegistry, "engine_pid", -1)
+
+    assert EngineRegistry.get_engine(db_path) is not engine
+    EngineRegistry.dispose_engine(db_path)
+
+
+def test_dispose_engines_under_path(tmp_path):
+    """Test that the engines of the databases of a deleted component are disposed"""
+    component_db = "sqlite:///" + str(tmp_path / "component" / "persistence" / "component.db")
+    other_db = "sqlite:///" + str(tmp_path / "other.db")
+    (tmp_path / "component" / "persistence").mkdir(parents=True)
+    component_engine = EngineRegistry.get_engine(component_db)
+    other_engine = EngineRegistry.get_engine(other_db)
+
+    EngineRegistry.dispose_engines(tmp_path / "component")
+
+    assert component_db not in EngineRegistry.engines
+    assert EngineRegistry.get_engine(component_db) is not component_engine
+    assert EngineRegistry.get_engine(other_db) is other_engine
+    EngineRegistry.dispose_engine(component_db)
+    EngineRegistry.dispose_engine(other_db)
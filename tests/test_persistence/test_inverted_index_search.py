@@ -0,0 +1,94 @@
+import pickle
+
+from digitalpy.core.main.object_factory import ObjectFactory
+from digitalpy.core.parsing.load_configuration import ModelConfiguration
+from digitalpy.core.persistence.impl.default_persistence_facade import (
+    DefaultPersistenceFacade,
+)
+from digitalpy.core.persistence.paging_info import PagingInfo
+from digitalpy.core.query.impl.inverted_index_search import InvertedIndexSearch
+from digitalpy.testing.domain_objects import SimpleObject
+from digitalpy.testing.facade_utilities import test_environment
+
+
+def _create_object(string: str, number: int) -> SimpleObject:
+    oid = ObjectFactory.get_instance("ObjectId", {"id": string, "type": "SimpleObject"})
+    node = SimpleObject(ModelConfiguration(), {}, oid)
+    node.string = string
+    node.number = number
+    return node
+
+
+def _create_search(tmp_path=None) -> InvertedIndexSearch:
+    index_path = str(tmp_path / "index.pickle") if tmp_path else None
+    return InvertedIndexSearch({"SimpleObject": ["string", "number"]}, index_path)
+
+
+def test_index_updated_by_persistence_hooks(test_environment):
+    """test that saved objects are indexed and deleted objects are removed from the index"""
+    search = _create_search()
+    facade = DefaultPersistenceFacade(None)
+    search.register(facade)
+    first = _create_object("alpha", 1)
+    second = _create_object("alpine", 2)
+
+    facade.object_saved(first)
+    facade.object_saved(second)
+    assert search.find_term("string", "alpha") == [first.oid]
+
+    second.string = "beta"
+    facade.object_saved(second)
+    assert search.find_prefix("string", "alp") == [first.oid]
+
+    facade.object_deleted(first.get_oid())
+    assert search.find_term("string", "alpha") == []
+    assert search.find_term("string", "beta") == [second.oid]
+
+
+def test_find_term_prefix_and_range(test_environment):
+    """test that the clauses of a search term are combined and the hits are paged"""
+    search = _create_search()
+    objects = [_create_object(f"name{i}", i) for i in range(10)]
+    for node in objects:
+        search.add_to_index(node)
+
+    assert list(search.find("number:[3 TO 5]")) == [node.oid for node in objects[3:6]]
+    assert list(search.find("number:[8 TO *]")) == [node.oid for node in objects[8:]]
+    assert list(search.find("string:name* number:[* TO 1]")) == [node.oid for node in objects[:2]]
+    assert list(search.find("string:name7")) == [objects[7].oid]
+    assert search.find("name7")[objects[7].oid]["summary"] == {"string": "name7", "number": 7}
+
+    paging_info = PagingInfo(4)
+    paging_info.set_page(3)
+    hits = search.find("string:name*", paging_info, create_summary=False)
+    assert list(hits) == [node.oid for node in objects[8:]]
+    assert paging_info.get_total_count() == 10
+    assert "summary" not in hits[objects[8].oid]
+
+
+def test_index_snapshot(test_environment, tmp_path):
+    """test that a committed index is read by a new search"""
+    search = _create_search(tmp_path)
+    node = _create_object("alpha", 1)
+    search.add_to_index(node)
+    search.commit_index()
+
+    restored = _create_search(tmp_path)
+
+    assert restored.find_term("string", "alpha") == [node.oid]
+    assert restored.find_range("number", 0, 1, include_low=False) == [node.oid]
+
+
+def test_pickled_facade_keeps_index(test_environment):
+    """test that a persistence facade is pickled with its registered index"""
+    search = _create_search()
+    facade = DefaultPersistenceFacade(None)
+    search.register(facade)
+    search.register(facade)
+    node = _create_object("alpha", 1)
+
+    restored: DefaultPersistenceFacade = pickle.loads(pickle.dumps(facade))
+    restored.object_saved(node)
+
+    assert len(restored.save_hooks) == 1
+    assert restored.save_hooks[0].__self__.find_term("string", "alpha") == [node.oid]
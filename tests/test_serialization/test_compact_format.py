@@ -0,0 +1,138 @@
+import pickle
+
+from digitalpy.core.main.object_factory import ObjectFactory
+from digitalpy.core.parsing.impl import compact_format as compact_format_module
+from digitalpy.core.parsing.impl.compact_format import CompactFormat, register_type
+from digitalpy.core.parsing.load_configuration import ModelConfiguration
+from digitalpy.core.serialization.controllers.serializer_container import (
+    SerializerContainer,
+)
+from digitalpy.core.zmanager.request import Request
+from digitalpy.testing.domain_objects import NestedObject, SimpleObject
+from digitalpy.testing.domain_utilities import initialize_nested_object
+from digitalpy.testing.facade_utilities import test_environment
+
+
+def _initialize_payload(request, response) -> NestedObject:
+    nested_obj = initialize_nested_object(request, response)
+    nested_obj.string = "parent"
+    child = nested_obj._model["SimpleObject"](
+        nested_obj._model_configuration,
+        nested_obj._model,
+        ObjectFactory.get_instance("ObjectId", {"id": "child", "type": "SimpleObject"}),
+    )
+    child.string = "child"
+    child.number = 7
+    nested_obj.nested = child
+    return nested_obj
+
+
+def test_compact_format_round_trip(test_environment):
+    """Test that nodes are restored with their values, children and relationships"""
+    request, response, _ = test_environment
+    nested_obj = _initialize_payload(request, response)
+
+    compact_format = CompactFormat()
+    message: Request = ObjectFactory.get_new_instance("Request")
+    message.set_value("model_object", nested_obj)
+    message.set_value("count", 1)
+    message.set_values(compact_format.serialize_values(message))
+    values = compact_format.deserialize_values(message)
+
+    restored: NestedObject = values["model_object"]
+    assert values["count"] == 1
+    assert isinstance(restored, NestedObject)
+    assert restored.string == "parent"
+    assert str(restored.oid) == str(nested_obj.oid)
+    assert isinstance(restored.nested, SimpleObject)
+    assert restored.nested.string == "child"
+    assert restored.nested.number == 7
+    assert restored.nested.get_parent() is restored
+    assert restored._relationship_definition is restored._model_configuration.elements["NestedObject"]
+    assert restored.mapper is None
+    assert "persistence_facade" not in restored.__dict__
+
+
+def test_compact_format_reattaches_registered_model(test_environment, monkeypatch):
+    """Test that the receiver re-attaches the model configuration registered for the type
+    of a node rather than the sent one"""
+    request, response, _ = test_environment
+    nested_obj = _initialize_payload(request, response)
+    message: Request = ObjectFactory.get_new_instance("Request")
+    message.set_value("model_object", nested_obj)
+    body = CompactFormat().serialize_values(message)
+
+    # the receiving process has a type table of its own
+    monkeypatch.setattr(compact_format_module, "_types", {})
+    receiver_configuration = ModelConfiguration(
+        elements=dict(nested_obj._model_configuration.elements)
+    )
+    register_type(NestedObject, receiver_configuration, nested_obj._model)
+    message.set_values(body)
+    restored: NestedObject = CompactFormat().deserialize_values(message)["model_object"]
+
+    assert restored._model_configuration is receiver_configuration
+    assert restored._relationship_definition is receiver_configuration.elements["NestedObject"]
+    # an unregistered type is received with the sent model configuration
+    assert restored.nested._relationship_definition is not None
+    assert restored.nested.get_parent() is restored
+    assert restored.get_children_ex(children_type="SimpleObject") == [restored.nested]
+
+
+def test_compact_format_sends_model_to_new_receiver(test_environment, monkeypatch):
+    """Test that a receiver without registered types can add children to the received
+    nodes, the model configuration is written once per message"""
+    request, response, _ = test_environment
+    nested_obj = _initialize_payload(request, response)
+    message: Request = ObjectFactory.get_new_instance("Request")
+    message.set_value("model_objects", [nested_obj, nested_obj.nested])
+    body = CompactFormat().serialize_values(message)
+    assert body.count(b"ModelConfiguration") == 1
+
+    monkeypatch.setattr(compact_format_module, "_types", {})
+    message.set_values(body)
+    restored: NestedObject = CompactFormat().deserialize_values(message)["model_objects"][0]
+
+    assert restored._relationship_definition.relationships
+    child = restored._model["SimpleObject"](
+        restored._model_configuration,
+        restored._model,
+        ObjectFactory.get_instance("ObjectId", {"id": "added", "type": "SimpleObject"}),
+    )
+    restored.nested.add_child(child)
+    assert child in restored.nested.get_children().values()
+
+
+def test_compact_format_smaller_than_pickle(test_environment):
+    """Test that the transient attributes of nodes are not written to the wire"""
+    request, response, _ = test_environment
+    nested_obj = _initialize_payload(request, response)
+    nested_obj.get_mapper()
+
+    message: Request = ObjectFactory.get_new_instance("Request")
+    message.set_value("model_object", nested_obj)
+    assert len(CompactFormat().serialize_values(message)) < len(
+        pickle.dumps(message.get_values())
+    )
+
+
+def test_serializer_container_selected_format(test_environment):
+    """Test that the frames are serialized in the format selected for the message"""
+    request, response, _ = test_environment
+    nested_obj = _initialize_payload(request, response)
+
+    serializer_container: SerializerContainer = ObjectFactory.get_instance(
+        "SerializerContainer"
+    )
+    message: Request = ObjectFactory.get_new_instance("Request")
+    message.action = "testAction"
+    message.context = "testContext"
+    message.set_format("compact")
+    message.set_value("model_object", nested_obj)
+
+    frames = serializer_container.to_zmanager_frames(message)
+    assert frames[2].endswith(b" compact")
+
+    deserialized = serializer_container.from_zmanager_frames(frames)
+    assert deserialized.get_format() == "compact"
+    assert deserialized.get_value("model_object").nested.number == 7
@@ -0,0 +1,60 @@
+from digitalpy.core.serialization.controllers.serialization_plan import SerializationPlan
+from digitalpy.testing.domain_objects import ListObject, SimpleObject
+from digitalpy.testing.domain_utilities import (
+    initialize_list_object,
+    initialize_simple_object,
+)
+from digitalpy.testing.facade_utilities import initialize_facade, test_environment
+from digitalpy.core.serialization.configuration.serialization_constants import Protocols
+
+
+class CustomPropertiesObject(SimpleObject):
+    def get_properties(self):
+        return ["string"]
+
+
+def test_plan_matches_node_properties(test_environment):
+    """test that the plan of a class is generated once and lists the properties of its nodes"""
+    request, response, _ = test_environment
+    simple_obj = initialize_simple_object(request, response)
+
+    plan = SerializationPlan.get_plan(SimpleObject)
+
+    assert SerializationPlan.get_plan(SimpleObject) is plan
+    assert [accessor.name for accessor in plan.get_properties(simple_obj)] == simple_obj.get_properties()
+    plan.get_accessor(simple_obj, "number").set(simple_obj, 5)
+    assert simple_obj.number == 5
+    assert plan.get_accessor(simple_obj, "missing") is None
+    assert SerializationPlan.get_plan(ListObject).is_relationship("list_data")
+    assert not plan.is_relationship("string")
+
+
+def test_plan_uses_overridden_properties(test_environment):
+    """test that classes overriding get_properties are asked for their properties"""
+    node = CustomPropertiesObject(model_configuration=None, model=None)
+
+    plan = SerializationPlan.get_plan(CustomPropertiesObject)
+
+    assert [accessor.name for accessor in plan.get_properties(node)] == ["string"]
+    assert plan.get_accessor(node, "number") is None
+
+
+def test_repeated_node_serialized_each_time(test_environment):
+    """test that the cycle guard only skips nodes which are being serialized"""
+    request, response, _ = test_environment
+    list_obj = initialize_list_object(request, response)
+    list_obj.string = "abc"
+
+    serialization_facade = initialize_facade(
+        "digitalpy.core.serialization.serialization_facade.Serialization",
+        request,
+        response,
+    )
+    request.set_value("protocol", Protocols.JSON)
+    request.set_value("message", [list_obj, list_obj])
+    serialization_facade.execute("serialize_node_to_json")
+
+    serialized_json: list = response.get_value("message")
+    assert len(serialized_json) == 2
+    assert serialized_json[0] == serialized_json[1]
+    assert serialized_json[0]["string"] == "abc"
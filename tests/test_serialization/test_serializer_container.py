@@ -126,3 +126,58 @@ def test_serializer_container_no_decorator_or_flow(test_environment):
     assert deserialized_request.flow_name == ""
     assert deserialized_request.get_value("test") == "test"
     assert deserialized_request != request
+
+
+def test_serializer_container_frames(test_environment):
+    """This test is used to test the multipart wire format of the SerializerContainer class."""
+
+    serializer_container: SerializerContainer = ObjectFactory.get_instance(
+        "SerializerContainer"
+    )
+
+    request: Request = ObjectFactory.get_new_instance("Request")
+
+    request.action = "testAction"
+    request.context = "testContext"
+    request.set_value("test", "test~with~delimiters")
+
+    frames = serializer_container.to_zmanager_frames(request)
+
+    assert len(frames) == 4
+    assert frames[0] == serializer_container.serializer_action_key.to_topic(request.action_key)
+
+    deserialized_request = serializer_container.from_zmanager_frames(
+        [memoryview(frame) for frame in frames]
+    )
+
+    assert deserialized_request.action == request.action
+    assert deserialized_request.context == request.context
+    assert deserialized_request.get_id() == request.get_id()
+    assert deserialized_request.get_value("test") == "test~with~delimiters"
+
+
+def test_serializer_container_split_frames(test_environment):
+    """This test is used to test splitting batched and delimited messages."""
+
+    serializer_container: SerializerContainer = ObjectFactory.get_instance(
+        "SerializerContainer"
+    )
+
+    request: Request = ObjectFactory.get_new_instance("Request")
+    request.action = "testAction"
+    request.set_value("test", "test")
+    frames = serializer_container.to_zmanager_frames(request)
+
+    assert len(serializer_container.split_zmanager_frames(frames * 3)) == 3
+
+    legacy_request: Request = ObjectFactory.get_new_instance("Request")
+    legacy_request.action = "testAction"
+    legacy_request.set_value("test", "test")
+    legacy_message = serializer_container.to_zmanager_message(legacy_request)
+    messages = serializer_container.split_zmanager_frames([legacy_message])
+
+    assert len(messages) == 1
+    assert serializer_container.from_zmanager_frames(messages[0]).get_value("test") == "test"
+
+    with pytest.raises(ValueError):
+        serializer_container.split_zmanager_frames(frames[:3])
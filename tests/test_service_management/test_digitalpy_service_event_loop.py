@@ -0,0 +1,128 @@
+import pickle
+import queue
+import threading
+import time
+from unittest import mock
+
+import zmq
+
+from digitalpy.core.main.object_factory import ObjectFactory
+from digitalpy.core.service_management.digitalpy_service import DigitalPyService
+from digitalpy.core.service_management.domain.model.service_configuration import (
+    ServiceConfiguration,
+)
+from digitalpy.core.service_management.domain.model.service_status_enum import (
+    ServiceStatusEnum,
+)
+from digitalpy.testing.facade_utilities import test_environment
+
+
+def _receive_all(sock: zmq.Socket) -> list:
+    messages = []
+    while True:
+        try:
+            messages.append(sock.recv(zmq.NOBLOCK))
+        except zmq.Again:
+            return messages
+
+
+def _create_service(subscriber_socket: zmq.Socket, network_sockets: list) -> DigitalPyService:
+    network = mock.Mock()
+    network.get_poll_sockets.return_value = network_sockets
+    network.service_connections.side_effect = lambda **kwargs: [
+        message for sock in network_sockets for message in _receive_all(sock)
+    ]
+    subscriber = mock.Mock()
+    subscriber.subscriber_socket = subscriber_socket
+    subscriber.fetch_integration_manager_response.side_effect = lambda: subscriber_socket.recv(
+        zmq.NOBLOCK
+    )
+    configuration = ServiceConfiguration()
+    configuration.protocol = "TestNetwork"
+    with mock.patch.object(ObjectFactory, "get_instance", return_value=network):
+        service = DigitalPyService(
+            "test.event_loop", configuration, subscriber, mock.Mock(), mock.Mock(), poll_interval=10
+        )
+    return service
+
+
+def _run_event_loop(service: DigitalPyService) -> threading.Thread:
+    service.status = ServiceStatusEnum.RUNNING.value
+    service.stop_event = threading.Event()
+    thread = threading.Thread(target=service.event_loop, daemon=True)
+    thread.start()
+    # wait until the control pipe of the event loop exists
+    while service._poller is None:
+        time.sleep(0.01)
+    return thread
+
+
+def test_event_loop_handles_responses_requests_and_stop(test_environment):
+    """test that the event loop wakes up for responses, requests and status changes"""
+    context = zmq.Context()
+    try:
+        subscriber_socket = context.socket(zmq.PAIR)
+        subscriber_socket.bind("inproc://responses")
+        response_sender = context.socket(zmq.PAIR)
+        response_sender.connect("inproc://responses")
+        network_socket = context.socket(zmq.PULL)
+        network_socket.bind("inproc://requests")
+        request_sender = context.socket(zmq.PUSH)
+        request_sender.connect("inproc://requests")
+
+        service = _create_service(subscriber_socket, [network_socket])
+        handled = queue.Queue()
+        service.response_handler = lambda response: handled.put(("response", response))
+        service.handle_inbound_message = lambda request: handled.put(("request", request))
+        thread = _run_event_loop(service)
+
+        response_sender.send(b"response")
+        request_sender.send(b"request")
+        received = {handled.get(timeout=1), handled.get(timeout=1)}
+        assert received == {("response", b"response"), ("request", b"request")}
+
+        # a status change from another thread is noticed before the idle timeout
+        started = time.monotonic()
+        service.status = ServiceStatusEnum.STOPPING.value
+        thread.join(timeout=0.5)
+        assert not thread.is_alive()
+        assert time.monotonic() - started < 0.5
+        assert service.stop_event.is_set()
+        assert service._control_sender is None
+    finally:
+        context.destroy(linger=0)
+
+
+def test_event_loop_polls_network_without_sockets(test_environment):
+    """test that a network without sockets is serviced every poll interval"""
+    context = zmq.Context()
+    try:
+        subscriber_socket = context.socket(zmq.PAIR)
+        subscriber_socket.bind("inproc://responses")
+        service = _create_service(subscriber_socket, [])
+        thread = _run_event_loop(service)
+        time.sleep(0.2)
+        service.status = ServiceStatusEnum.STOPPING.value
+        thread.join(timeout=0.5)
+
+        assert not thread.is_alive()
+        assert service.protocol.service_connections.call_count > 2
+    finally:
+        context.destroy(linger=0)
+
+
+def test_pickled_service_has_no_event_loop(test_environment):
+    """test that the control pipe of the event loop is not pickled with the service"""
+    service = _create_service(None, [])
+    service.protocol = None
+    service._integration_manager_subscriber = None
+    service.iam_facade = None
+    service._subject_pusher = None
+    service._integration_manager_pusher = None
+
+    restored: DigitalPyService = pickle.loads(pickle.dumps(service))
+
+    assert restored._control_sender is None
+    # the status of an unpickled service can be set before it's event loop runs
+    restored.status = ServiceStatusEnum.RUNNING.value
+    assert restored.status == ServiceStatusEnum.RUNNING.value
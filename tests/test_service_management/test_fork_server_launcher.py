@@ -0,0 +1,135 @@
+import os
+import signal
+import time
+from unittest import mock
+
+from digitalpy.core.main.object_factory import ObjectFactory
+from digitalpy.core.service_management.controllers.service_management_process_controller import (
+    ServiceManagementProcessController,
+)
+from digitalpy.core.service_management.digitalpy_service import DigitalPyService
+from digitalpy.core.service_management.domain.model.service_configuration import (
+    ServiceConfiguration,
+)
+from digitalpy.core.service_management.domain.model.service_status_enum import (
+    ServiceStatusEnum,
+)
+from digitalpy.core.service_management.impl.fork_server_launcher import (
+    ForkedServiceProcess,
+    ForkServerLauncher,
+)
+from digitalpy.testing.facade_utilities import test_environment
+
+
+class TemplateService(DigitalPyService):
+    """service writing the factory it was started with to a file"""
+
+    def __init__(self, path: str, exitcode: int = 0, duration: float = 0):
+        configuration = ServiceConfiguration()
+        configuration.protocol = "TestNetwork"
+        with mock.patch.object(ObjectFactory, "get_instance"):
+            super().__init__("test.template_service", configuration, None, None, None)
+        self.protocol = None
+        self.iam_facade = None
+        self.path = path
+        self.exitcode = exitcode
+        self.duration = duration
+
+    def start(self, object_factory, tracing_provider, conf_factory):
+        with open(self.path, "w", encoding="utf-8") as service_file:
+            service_file.write(f"{os.getpid()} {type(object_factory).__name__}")
+        time.sleep(self.duration)
+        raise SystemExit(self.exitcode)
+
+
+def _wait_for_file(path: str, timeout: float = 10) -> str:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if os.path.exists(path) and os.path.getsize(path):
+            with open(path, encoding="utf-8") as service_file:
+                return service_file.read()
+        time.sleep(0.01)
+    raise TimeoutError(f"{path} was not written")
+
+
+def test_forked_service_runs_and_exits(test_environment, tmp_path):
+    """test that a service forked from the template is started with the snapshot of the
+    factory and its exit code is reported"""
+    launcher = ForkServerLauncher()
+    try:
+        process = launcher.create_process(TemplateService(str(tmp_path / "service"), exitcode=3))
+        process.start()
+        process.join(10)
+
+        pid, factory = _wait_for_file(str(tmp_path / "service")).split()
+        assert int(pid) == process.pid != os.getpid()
+        assert factory == "DefaultFactory"
+        assert not process.is_alive()
+        assert process.exitcode == 3
+    finally:
+        launcher.shutdown()
+
+
+def test_forked_service_terminate(test_environment, tmp_path):
+    """test that a running service forked from the template can be terminated"""
+    launcher = ForkServerLauncher()
+    try:
+        launcher.start()
+        process = launcher.create_process(TemplateService(str(tmp_path / "service"), duration=30))
+        process.start()
+        _wait_for_file(str(tmp_path / "service"))
+        assert process.is_alive()
+
+        process.terminate()
+        process.join(10)
+
+        assert process.exitcode == -signal.SIGTERM
+    finally:
+        launcher.shutdown()
+
+
+def test_template_restarted_on_configuration_change(test_environment, tmp_path):
+    """test that a service started after the configuration changed is forked from a new
+    template process"""
+    launcher = ForkServerLauncher()
+    try:
+        launcher.start()
+        template = launcher.template
+        process = launcher.create_process(TemplateService(str(tmp_path / "first")))
+        process.start()
+        _wait_for_file(str(tmp_path / "first"))
+        assert launcher.template is template
+
+        ObjectFactory.get_instance("Configuration").revision += 1
+        process = launcher.create_process(TemplateService(str(tmp_path / "second")))
+        process.start()
+        _wait_for_file(str(tmp_path / "second"))
+
+        assert launcher.template is not template
+        assert not template.is_alive()
+        process.join(10)
+        assert process.exitcode == 0
+    finally:
+        launcher.shutdown()
+
+
+def test_process_controller_uses_launcher(test_environment, tmp_path):
+    """test that the process controller forks the services from a configured launcher"""
+    request, response, configuration = test_environment
+    launcher = ForkServerLauncher()
+    try:
+        controller = ServiceManagementProcessController(request, response, None, configuration)
+        service = TemplateService(str(tmp_path / "service"), duration=30)
+
+        with mock.patch.object(controller, "get_service_launcher", return_value=launcher):
+            controller.start_process(service)
+        _wait_for_file(str(tmp_path / "service"))
+        assert isinstance(service.process, ForkedServiceProcess)
+        assert service.status == ServiceStatusEnum.RUNNING.value
+
+        service.process.terminate()
+        controller.stop_process(service)
+        assert service.process is None
+        assert service.configuration.status == ServiceStatusEnum.STOPPED.value
+    finally:
+        launcher.shutdown()
@@ -0,0 +1,78 @@
+import pickle
+import threading
+
+from digitalpy.core.telemetry.latency_histogram import LatencyHistogram
+from digitalpy.core.zmanager.impl.hop_metrics import EXECUTE, HopMetrics
+from digitalpy.core.digipy_configuration.domain.model.actionkey import ActionKey
+from digitalpy.testing.facade_utilities import test_environment
+
+
+def test_latency_histogram_percentiles():
+    """Test that the percentiles of a histogram are within its precision"""
+    histogram = LatencyHistogram()
+    for value in range(1, 10_001):
+        histogram.record(value * 1000)
+
+    assert histogram.count == 10_000
+    assert histogram.max == 10_000_000
+    assert histogram.mean() == 5_000_500
+    for percentile in (50, 90, 99):
+        expected = percentile * 100_000
+        assert abs(histogram.value_at_percentile(percentile) - expected) <= expected * 0.04
+    assert histogram.value_at_percentile(100) == 10_000_000
+
+
+def test_latency_histogram_bucket_bounds():
+    """Test that every value is counted by a bucket which contains it"""
+    for value in [0, 1, 31, 32, 33, 63, 64, 65, 1000, 123_456_789, 2**39, 2**45]:
+        index = LatencyHistogram.bucket_index(value)
+        assert LatencyHistogram.bucket_value(index) >= min(value, 2**40 - 1)
+        if index > 0:
+            assert LatencyHistogram.bucket_value(index - 1) < value
+
+
+def test_hop_metrics_observations(test_environment):
+    """Test that the latencies are observed per action and reset after every observation"""
+    hop_metrics = HopMetrics()
+    action_key = ActionKey(None, None)
+    action_key.context = "TestContext"
+    action_key.action = "TestAction"
+    hop_metrics.record(EXECUTE, action_key, 2_000_000)
+    hop_metrics.record(EXECUTE, action_key, 4_000_000)
+    hop_metrics.record_error(action_key)
+
+    latencies = {labels["statistic"]: value for value, labels in hop_metrics.observe_latencies()}
+    assert latencies["max"] == 4
+    assert latencies["mean"] == 3
+    assert list(hop_metrics.observe_latencies()) == []
+    assert list(hop_metrics.observe_counts()) == [
+        (2, {"stage": EXECUTE, "context": "TestContext", "action": "TestAction"})
+    ]
+    assert list(hop_metrics.observe_errors()) == [
+        (1, {"context": "TestContext", "action": "TestAction"})
+    ]
+
+
+def test_hop_metrics_collected_while_recording(test_environment):
+    """Test that no latency is lost when the histograms are collected while recording"""
+    hop_metrics = HopMetrics()
+    action_key = ActionKey(None, None)
+    action_key.context = "TestContext"
+    action_key.action = "TestAction"
+
+    def run():
+        for _ in range(5000):
+            hop_metrics.record(EXECUTE, action_key, 1_000)
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    collected = 0
+    while any(thread.is_alive() for thread in threads):
+        collected += sum(histogram.count for histogram in hop_metrics.collect().values())
+    for thread in threads:
+        thread.join()
+    collected += sum(histogram.count for histogram in hop_metrics.collect().values())
+
+    assert collected == 20000
+    assert pickle.loads(pickle.dumps(hop_metrics)).counts == hop_metrics.counts
@@ -0,0 +1,82 @@
+import time
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import Status, StatusCode
+
+from digitalpy.core.main.object_factory import ObjectFactory
+from digitalpy.core.telemetry.impl.opentel_sampler import ActionKeySampler
+from digitalpy.core.telemetry.impl.opentel_span_processor import SamplingBatchSpanProcessor
+from digitalpy.core.telemetry.impl.opentel_tracing_exporter import OpenTelTracingExporter
+from digitalpy.testing.facade_utilities import test_environment
+
+
+def _create_tracer(sampler: ActionKeySampler, processor: SamplingBatchSpanProcessor):
+    provider = TracerProvider(sampler=sampler)
+    provider.add_span_processor(processor)
+    return provider.get_tracer("test")
+
+
+def test_head_sampling_with_overrides():
+    """test that the ratio of a span name is overridden by its longest matching prefix"""
+    exporter = InMemorySpanExporter()
+    processor = SamplingBatchSpanProcessor(exporter)
+    sampler = ActionKeySampler(0, "Domain.=1, Domain.get_health=0")
+    tracer = _create_tracer(sampler, processor)
+
+    for name in ["Domain.get_health", "Domain.create_node", "Files.get_file"]:
+        with tracer.start_as_current_span(name):
+            with tracer.start_as_current_span("child"):
+                pass
+    processor.shutdown()
+
+    spans = OpenTelTracingExporter(exporter).get_spans()
+    assert [span.name for span in spans] == ["child", "Domain.create_node"]
+    assert processor.dropped_spans == 0
+
+
+def test_tail_sampling_of_slow_and_failed_spans():
+    """test that spans which were not sampled are exported if they were slow or failed"""
+    exporter = InMemorySpanExporter()
+    processor = SamplingBatchSpanProcessor(exporter, slow_span_millis=20)
+    tracer = _create_tracer(ActionKeySampler(0, tail_sampling=True), processor)
+
+    with tracer.start_as_current_span("fast"):
+        pass
+    with tracer.start_as_current_span("slow"):
+        time.sleep(0.03)
+    with tracer.start_as_current_span("failed") as span:
+        span.set_status(Status(StatusCode.ERROR))
+
+    assert processor.force_flush()
+    assert sorted(span.name for span in exporter.get_finished_spans()) == ["failed", "slow"]
+    processor.shutdown()
+
+
+def test_spans_dropped_when_queue_full():
+    """test that spans are dropped instead of blocking once the queue is full"""
+    exporter = InMemorySpanExporter()
+    processor = SamplingBatchSpanProcessor(
+        exporter, max_queue_size=5, schedule_delay_millis=60000, max_export_batch_size=10
+    )
+    tracer = _create_tracer(ActionKeySampler(), processor)
+
+    for i in range(8):
+        with tracer.start_as_current_span(f"span {i}"):
+            pass
+    processor.shutdown()
+
+    assert len(exporter.get_finished_spans()) == 5
+    assert processor.dropped_spans == 3
+
+
+def test_tracing_provider_configured(test_environment):
+    """test that the tracing provider samples and processes spans as configured"""
+    provider = ObjectFactory.get_new_instance("TracingProvider")
+    provider.initialize_tracing()
+    try:
+        assert isinstance(provider.sampler, ActionKeySampler)
+        assert isinstance(provider.processor, SamplingBatchSpanProcessor)
+        assert provider.processor.queue_size == 2048
+    finally:
+        provider.provider.shutdown()
@@ -130,7 +130,7 @@ def test_integration_manager_flow_request(zmanager: ZmanagerSingleThreadSetup, d
         time.sleep(1)
 
         message = zmanager.receive_integration_manager_messages()[0]
-        response = serializer_container.from_zmanager_response(message)
+        response = serializer_container.from_zmanager_response_frames(message)
 
         # check that the worker received processed the message correctly
         assert response.action_key.config == "RESPONSE"
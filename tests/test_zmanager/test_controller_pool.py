@@ -0,0 +1,126 @@
+import threading
+
+from digitalpy.core.main.controller import Controller
+from digitalpy.core.main.object_factory import ObjectFactory
+from digitalpy.core.zmanager.impl.controller_pool import ControllerPool
+from digitalpy.testing.facade_utilities import (
+    initialize_facade,
+    test_environment,
+)
+
+POOLED_CONTROLLER = "tests.test_zmanager.test_controller_pool.PooledController"
+UNPOOLED_CONTROLLER = "tests.test_zmanager.test_controller_pool.UnpooledController"
+
+
+class PooledController(Controller):
+    pooled = True
+
+    def __init__(self, request, response):
+        super().__init__(request, response, None, None)
+
+
+class UnpooledController(Controller):
+    def __init__(self, request, response):
+        super().__init__(request, response, None, None)
+
+
+def test_controller_reused_after_checkin(test_environment):
+    """test that a checked in controller is rebound to the request of the next checkout"""
+    pool = ControllerPool()
+    request = ObjectFactory.get_new_instance("request")
+    response = ObjectFactory.get_new_instance("response")
+
+    controller = pool.checkout(POOLED_CONTROLLER, request, response)
+    assert controller.request is request
+    pool.checkin(POOLED_CONTROLLER, controller)
+    assert controller.request is None
+
+    next_request = ObjectFactory.get_new_instance("request")
+    assert pool.checkout(POOLED_CONTROLLER, next_request, response) is controller
+    assert controller.request is next_request
+
+
+def test_checked_out_controller_not_shared(test_environment):
+    """test that a sub-action of the same controller class gets another instance"""
+    pool = ControllerPool()
+    request = ObjectFactory.get_new_instance("request")
+    response = ObjectFactory.get_new_instance("response")
+
+    outer = pool.checkout(POOLED_CONTROLLER, request, response)
+    inner = pool.checkout(POOLED_CONTROLLER, request, response)
+
+    assert outer is not inner
+    assert outer.request is request
+
+
+def test_controller_opted_out_of_pooling(test_environment):
+    """test that controllers which opted out of pooling and surplus controllers are discarded"""
+    pool = ControllerPool(max_idle=1)
+    request = ObjectFactory.get_new_instance("request")
+    response = ObjectFactory.get_new_instance("response")
+
+    controller = pool.checkout(UNPOOLED_CONTROLLER, request, response)
+    pool.checkin(UNPOOLED_CONTROLLER, controller)
+    assert pool.checkout(UNPOOLED_CONTROLLER, request, response) is not controller
+
+    first = pool.checkout(POOLED_CONTROLLER, request, response)
+    second = pool.checkout(POOLED_CONTROLLER, request, response)
+    pool.checkin(POOLED_CONTROLLER, first)
+    pool.checkin(POOLED_CONTROLLER, second)
+    assert pool.idle[POOLED_CONTROLLER] == [first]
+
+
+def test_pool_emptied_in_forked_process(test_environment):
+    """test that controllers created by the parent process are not used by a forked process"""
+    pool = ControllerPool()
+    request = ObjectFactory.get_new_instance("request")
+    response = ObjectFactory.get_new_instance("response")
+    controller = pool.checkout(POOLED_CONTROLLER, request, response)
+    pool.checkin(POOLED_CONTROLLER, controller)
+
+    pool.pid = -1
+
+    assert pool.checkout(POOLED_CONTROLLER, request, response) is not controller
+
+
+def test_concurrent_checkout_never_shares_controller(test_environment):
+    """test that controllers checked out by concurrent threads are never handed out twice"""
+    pool = ControllerPool(max_idle=4)
+    request = ObjectFactory.get_new_instance("request")
+    response = ObjectFactory.get_new_instance("response")
+    checked_out = set()
+    shared = []
+    lock = threading.Lock()
+
+    def run():
+        for _ in range(200):
+            controller = pool.checkout(POOLED_CONTROLLER, request, response)
+            with lock:
+                if id(controller) in checked_out:
+                    shared.append(controller)
+                checked_out.add(id(controller))
+            with lock:
+                checked_out.discard(id(controller))
+            pool.checkin(POOLED_CONTROLLER, controller)
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert shared == []
+    assert len(pool.idle[POOLED_CONTROLLER]) <= 4
+
+
+def test_facade_reset_resets_sub_controllers(test_environment):
+    """test that resetting a pooled facade releases the request of its sub-controllers"""
+    request, response, _ = test_environment
+    domain = initialize_facade("digitalpy.core.domain.domain_facade.Domain", request, response)
+    assert domain.pooled is True
+    assert domain.domain_controller.request is request
+
+    domain.reset()
+
+    assert domain.request is None
+    assert domain.domain_controller.request is None
@@ -0,0 +1,39 @@
+from digitalpy.core.main.object_factory import ObjectFactory
+from digitalpy.core.zmanager.impl.integration_manager_subscriber import (
+    IntegrationManagerSubscriber,
+    get_covering_prefixes,
+)
+from digitalpy.testing.facade_utilities import test_environment
+
+
+def test_covering_prefixes():
+    """test that topics covered by a prefix of them are not subscribed"""
+    topics = [b"/a/b/c", b"/a/b", b"/a/bc", b"/a/b", b"/d", b"/e/f", b"/e/g"]
+
+    assert get_covering_prefixes(topics) == [b"/a/b", b"/d", b"/e/f", b"/e/g"]
+    assert get_covering_prefixes(topics + [b""]) == [b""]
+    assert get_covering_prefixes([]) == []
+
+
+def test_only_changed_prefixes_applied(test_environment, monkeypatch):
+    """test that only added and removed prefixes are subscribed and unsubscribed"""
+    subscriber: IntegrationManagerSubscriber = ObjectFactory.get_new_instance(
+        "IntegrationManagerSubscriber"
+    )
+    calls = []
+    monkeypatch.setattr(subscriber, "subscribe_to_topic", lambda topic: calls.append(("sub", topic)))
+    monkeypatch.setattr(
+        subscriber, "unsubscribe_from_topic", lambda topic: calls.append(("unsub", topic))
+    )
+
+    subscriber.set_subscriptions([b"/a/b", b"/a/b/c", b"/d"])
+    assert calls == [("sub", b"/a/b"), ("sub", b"/d")]
+
+    calls.clear()
+    added, removed = subscriber.set_subscriptions([b"/a/b/c", b"/d", b"/e"])
+    assert calls == [("sub", b"/a/b/c"), ("sub", b"/e"), ("unsub", b"/a/b")]
+    assert added == {b"/a/b/c", b"/e"} and removed == {b"/a/b"}
+
+    calls.clear()
+    subscriber.set_subscriptions([b"/e", b"/d", b"/a/b/c"])
+    assert calls == []
@@ -0,0 +1,89 @@
+import zmq
+
+from digitalpy.core.main.object_factory import ObjectFactory
+from digitalpy.core.zmanager.configuration.zmanager_constants import (
+    ZMANAGER_MESSAGE_FRAME_COUNT,
+)
+from digitalpy.core.zmanager.impl.integration_manager_pusher import IntegrationManagerPusher
+from digitalpy.core.zmanager.request import Request
+from digitalpy.testing.facade_utilities import (
+    test_environment,
+)
+
+
+def _create_pusher_and_puller():
+    context = zmq.Context()
+    puller = context.socket(zmq.PULL)
+    puller.setsockopt(zmq.LINGER, 0)
+    puller.setsockopt(zmq.RCVTIMEO, 2000)
+    port = puller.bind_to_random_port("tcp://127.0.0.1")
+
+    pusher = IntegrationManagerPusher(ObjectFactory.get_instance("formatter"))
+    pusher.pull_address = f"tcp://127.0.0.1:{port}"
+    pusher.setup()
+    return context, puller, pusher
+
+
+def _new_request(i: int) -> Request:
+    request: Request = ObjectFactory.get_new_instance("Request")
+    request.action = "testAction"
+    request.context = "testContext"
+    request.set_value("index", i)
+    return request
+
+
+def test_pusher_batches_messages(test_environment):
+    """test that a batching pusher sends batch_size messages as a single multipart message"""
+    context, puller, pusher = _create_pusher_and_puller()
+    try:
+        pusher.enable_batching(3, 10_000_000)
+        for i in range(3):
+            pusher.push_container(_new_request(i))
+
+        frames = puller.recv_multipart()
+
+        serializer_container = ObjectFactory.get_instance("SerializerContainer")
+        messages = serializer_container.split_zmanager_frames(frames)
+        assert len(messages) == 3
+        assert [
+            serializer_container.from_zmanager_frames(message).get_value("index")
+            for message in messages
+        ] == [0, 1, 2]
+    finally:
+        pusher.teardown()
+        puller.close()
+        context.term()
+
+
+def test_pusher_holds_batch_until_linger(test_environment):
+    """test that a batching pusher holds a partial batch until the linger time expires"""
+    context, puller, pusher = _create_pusher_and_puller()
+    try:
+        pusher.enable_batching(10, 10_000_000)
+        pusher.push_container(_new_request(0))
+
+        assert pusher.flush_timeout() > 0
+        assert puller.poll(100) == 0
+
+        pusher.flush()
+
+        assert len(puller.recv_multipart()) == ZMANAGER_MESSAGE_FRAME_COUNT
+        assert pusher.flush_timeout() is None
+    finally:
+        pusher.teardown()
+        puller.close()
+        context.term()
+
+
+def test_pusher_flushes_expired_batch(test_environment):
+    """test that a partial batch is sent once the linger time expired"""
+    context, puller, pusher = _create_pusher_and_puller()
+    try:
+        pusher.enable_batching(10, 0)
+        pusher.push_container(_new_request(0))
+
+        assert len(puller.recv_multipart()) == ZMANAGER_MESSAGE_FRAME_COUNT
+    finally:
+        pusher.teardown()
+        puller.close()
+        context.term()
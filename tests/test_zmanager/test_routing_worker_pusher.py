@@ -0,0 +1,224 @@
+import time
+
+import zmq
+
+from digitalpy.core.main.object_factory import ObjectFactory
+from digitalpy.core.zmanager.configuration.zmanager_constants import (
+    WORKER_ACK,
+    WORKER_READY,
+    WORKER_RETIRE,
+    ZMANAGER_MESSAGE_FRAME_COUNT,
+)
+from digitalpy.core.zmanager.impl.routing_worker_pusher import (
+    RoutingWorkerPusher,
+    RoutingWorkerState,
+)
+from digitalpy.core.zmanager.request import Request
+from digitalpy.core.zmanager.subject import Subject
+from digitalpy.testing.facade_utilities import (
+    test_environment,
+)
+
+
+def _create_pusher(context: zmq.Context) -> RoutingWorkerPusher:
+    # reserve a free port for the pusher to bind to
+    sock = context.socket(zmq.ROUTER)
+    port = sock.bind_to_random_port("tcp://127.0.0.1")
+    sock.close()
+
+    pusher = RoutingWorkerPusher(ObjectFactory.get_instance("formatter"))
+    pusher.pull_address = f"tcp://127.0.0.1:{port}"
+    pusher.setup(bind=True)
+    return pusher
+
+
+def _connect_worker(context: zmq.Context, pusher: RoutingWorkerPusher, identity: bytes, prefetch: int) -> zmq.Socket:
+    worker = context.socket(zmq.DEALER)
+    worker.setsockopt(zmq.LINGER, 0)
+    worker.setsockopt(zmq.RCVTIMEO, 2000)
+    worker.setsockopt(zmq.IDENTITY, identity)
+    worker.connect(pusher.pull_address)
+    worker.send_multipart([WORKER_READY, str(prefetch).encode()])
+    _wait_for(pusher, lambda: identity in pusher.routing_workers)
+    return worker
+
+
+def _wait_for(pusher: RoutingWorkerPusher, condition):
+    deadline = time.monotonic() + 2
+    while not condition():
+        assert time.monotonic() < deadline
+        pusher.pusher_socket.poll(50)
+        pusher.receive_acknowledgements()
+
+
+def _new_request(i: int) -> Request:
+    request: Request = ObjectFactory.get_new_instance("Request")
+    request.action = "testAction"
+    request.context = "testContext"
+    request.set_value("index", i)
+    return request
+
+
+def test_messages_held_until_worker_has_credit(test_environment):
+    """test that a worker receives no more messages than its credit until it acknowledges them"""
+    context = zmq.Context()
+    pusher = _create_pusher(context)
+    try:
+        worker = _connect_worker(context, pusher, b"worker-1", 2)
+        for i in range(3):
+            pusher.push_container(_new_request(i))
+
+        assert len(worker.recv_multipart()) == ZMANAGER_MESSAGE_FRAME_COUNT
+        assert len(worker.recv_multipart()) == ZMANAGER_MESSAGE_FRAME_COUNT
+        assert worker.poll(100) == 0
+        assert len(pusher.backlog) == 1
+        assert pusher.in_flight == 2
+
+        worker.send_multipart([WORKER_ACK, b"1"])
+        _wait_for(pusher, lambda: not pusher.backlog)
+
+        frames = worker.recv_multipart()
+        serializer_container = ObjectFactory.get_instance("SerializerContainer")
+        assert serializer_container.from_zmanager_frames(frames).get_value("index") == 2
+        assert pusher.in_flight == 2
+    finally:
+        pusher.teardown()
+        context.destroy(linger=0)
+
+
+def test_messages_sent_to_least_loaded_worker(test_environment):
+    """test that the first idle worker receives messages before a busy worker"""
+    context = zmq.Context()
+    pusher = _create_pusher(context)
+    try:
+        first = _connect_worker(context, pusher, b"worker-1", 10)
+        second = _connect_worker(context, pusher, b"worker-2", 10)
+
+        pusher.push_container(_new_request(0))
+        pusher.push_container(_new_request(1))
+
+        assert first.poll(1000) and second.poll(1000)
+        assert pusher.routing_workers[b"worker-1"].in_flight == 1
+        assert pusher.routing_workers[b"worker-2"].in_flight == 1
+
+        first.send_multipart([WORKER_ACK, b"1"])
+        second.send_multipart([WORKER_ACK, b"1"])
+        _wait_for(pusher, lambda: pusher.in_flight == 0)
+
+        pusher.push_container(_new_request(2))
+        assert pusher.routing_workers[b"worker-1"].in_flight == 1
+
+        pusher.retire_worker(b"worker-1")
+        pusher.push_container(_new_request(3))
+        assert pusher.routing_workers[b"worker-2"].in_flight == 1
+        # the messages sent before the worker was retired are received first
+        for _ in range(2):
+            assert len(first.recv_multipart()) == ZMANAGER_MESSAGE_FRAME_COUNT
+        assert first.recv_multipart() == [WORKER_RETIRE]
+    finally:
+        pusher.teardown()
+        context.destroy(linger=0)
+
+
+class _Process:
+    def __init__(self, alive: bool = True, exitcode=None):
+        self.alive = alive
+        self.exitcode = exitcode
+
+    def is_alive(self):
+        return self.alive
+
+    def terminate(self):
+        self.alive = False
+
+
+def _create_subject(monkeypatch) -> Subject:
+    subject: Subject = ObjectFactory.get_new_instance("Subject")
+    configuration = subject.zmanager_configuration
+    monkeypatch.setattr(configuration, "_min_worker_count", 1)
+    monkeypatch.setattr(configuration, "_max_worker_count", 3)
+    monkeypatch.setattr(configuration, "_worker_prefetch", 2)
+    monkeypatch.setattr(configuration, "_worker_idle_timeout", 0)
+    subject.routing_worker_pusher = RoutingWorkerPusher(ObjectFactory.get_instance("formatter"))
+    started = []
+
+    def start_worker():
+        worker_id = f"worker-{len(started)}"
+        started.append(worker_id)
+        subject.workers[worker_id] = _Process()
+        return worker_id
+
+    monkeypatch.setattr(subject, "_start_worker", start_worker)
+    monkeypatch.setattr(
+        subject,
+        "_retire_worker",
+        lambda worker_id: subject.retiring_workers.__setitem__(worker_id, time.monotonic() + 10),
+    )
+    return subject
+
+
+def _register_workers(subject: Subject):
+    for worker_id in subject.workers:
+        subject.routing_worker_pusher.routing_workers.setdefault(
+            worker_id.encode(), RoutingWorkerState(worker_id.encode(), 2)
+        )
+
+
+def test_subject_scales_workers_with_backlog(test_environment, monkeypatch):
+    """test that the subject starts workers for the backlog and retires idle workers"""
+    subject = _create_subject(monkeypatch)
+    subject._scale_workers(time.monotonic())
+    assert list(subject.workers) == ["worker-0"]
+
+    _register_workers(subject)
+    subject.routing_worker_pusher.backlog.extend([[b""]] * 3)
+    subject._scale_workers(time.monotonic())
+    assert list(subject.workers) == ["worker-0", "worker-1", "worker-2"]
+
+    # the started workers must take their share of the backlog before more are started
+    subject._scale_workers(time.monotonic())
+    assert len(subject.workers) == 3
+
+    _register_workers(subject)
+    subject.routing_worker_pusher.backlog.clear()
+    subject._scale_workers(time.monotonic())
+    assert list(subject.retiring_workers) == ["worker-2"]
+
+
+def test_subject_replaces_dead_worker(test_environment, monkeypatch):
+    """test that a worker which exited unexpectedly is replaced"""
+    subject = _create_subject(monkeypatch)
+    subject._scale_workers(time.monotonic())
+    subject.workers["worker-0"].alive = False
+
+    subject._reap_workers(time.monotonic())
+
+    assert list(subject.workers) == ["worker-1"]
+
+
+def test_subject_pauses_receiving_while_backlog_is_full(test_environment, monkeypatch):
+    """test that the frontend is not polled while the backlog exceeds its bound"""
+    subject = _create_subject(monkeypatch)
+    monkeypatch.setattr(subject.zmanager_configuration, "_backlog_factor", 1)
+    context = zmq.Context()
+    try:
+        subject.frontend_pull = context.socket(zmq.PULL)
+        subject.poller = zmq.Poller()
+        subject.poller.register(subject.frontend_pull, zmq.POLLIN)
+        backlog = subject.routing_worker_pusher.backlog
+
+        backlog.extend([[b""]] * (subject.max_backlog - 1))
+        subject._update_backpressure()
+        assert not subject.receiving_paused
+
+        backlog.append([b""])
+        subject._update_backpressure()
+        assert subject.receiving_paused
+        assert subject.frontend_pull not in dict(subject.poller.sockets)
+
+        backlog.clear()
+        subject._update_backpressure()
+        assert not subject.receiving_paused
+        assert dict(subject.poller.sockets)[subject.frontend_pull] == zmq.POLLIN
+    finally:
+        context.destroy(linger=0)
@@ -23,6 +23,8 @@ class ZManagerSetup:
         self.zmanager_configuration: ZManagerConfiguration = SingletonConfigurationFactory.get_configuration_object("ZManagerConfiguration")
 
         self.zmanager_configuration.worker_count = workers
+        self.zmanager_configuration.min_worker_count = workers
+        self.zmanager_configuration.max_worker_count = workers
 
         ObjectFactory.get_instance("Configuration").set_value(
             "__class",
@@ -80,13 +82,13 @@ class ZManagerSetup:
         time.sleep(0.2)
         sock.close()
 
-    def receive_integration_manager_messages(self) -> list[bytes]:
+    def receive_integration_manager_messages(self) -> list[list[bytes]]:
         """receive messages from the integration manager"""
         messages = []
         while True:
             try:
                 message = self.integration_manager_subscriber.recv_multipart(zmq.NOBLOCK)
-                messages.append(message[0])
+                messages.append(message)
             except zmq.error.Again:
                 break
         return messages
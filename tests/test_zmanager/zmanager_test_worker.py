@@ -1,3 +1,5 @@
+import uuid
+
 import zmq
 
 from digitalpy.core.main.factory import Factory
@@ -5,6 +7,11 @@ from digitalpy.core.serialization.controllers.serializer_container import (
     SerializerContainer,
 )
 from digitalpy.core.main.object_factory import ObjectFactory
+from digitalpy.core.zmanager.configuration.zmanager_constants import (
+    WORKER_ACK,
+    WORKER_READY,
+    WORKER_RETIRE,
+)
 from digitalpy.core.zmanager.domain.model.zmanager_configuration import (
     ZManagerConfiguration,
 )
@@ -29,11 +36,15 @@ class TestRoutingWorker:
     def initiate_sockets(self):
         """initiate all socket connections"""
         context = zmq.Context()
-        self.sock = context.socket(zmq.PULL)
-        self.sock.connect(self.zmanager_conf.subject_push_address)
+        self.sock = context.socket(zmq.DEALER)
+        self.sock.setsockopt(zmq.IDENTITY, self.worker_id.encode())
         # unlimited as trunkating can result in unsent data and broken messages
         # TODO: determine a sane default
         self.sock.setsockopt(zmq.RCVHWM, 0)
+        self.sock.connect(self.zmanager_conf.subject_push_address)
+        self.sock.send_multipart(
+            [WORKER_READY, str(self.zmanager_conf.worker_prefetch).encode()]
+        )
         self.integration_manager_sock = context.socket(zmq.PUSH)
         self.integration_manager_sock.connect(
             self.zmanager_conf.integration_manager_pull_address
@@ -42,16 +53,22 @@ class TestRoutingWorker:
         # TODO: determine a sane default
         self.integration_manager_sock.setsockopt(zmq.SNDHWM, 0)
 
-    def start(self, factory: Factory):
+    def start(self, factory: Factory, configuration_factory=None, worker_id: str = None):
+        self.worker_id = worker_id or str(uuid.uuid4())
         ObjectFactory.configure(factory)
         self.initiate_sockets()
         while True:
             try:
-                message = self.sock.recv_multipart().pop(0)
-                request = self.serializer_container.from_zmanager_message(message)
-                request.set_value("test", "testData")
-                self.integration_manager_sock.send(
-                    self.serializer_container.to_zmanager_message(request), copy=False
-                )
+                frames = self.sock.recv_multipart(copy=False)
+                if len(frames) == 1 and frames[0].bytes == WORKER_RETIRE:
+                    return
+                messages = self.serializer_container.split_zmanager_frames(frames)
+                for message in messages:
+                    request = self.serializer_container.from_zmanager_frames(message)
+                    request.set_value("test", "testData")
+                    self.integration_manager_sock.send_multipart(
+                        self.serializer_container.to_zmanager_frames(request), copy=False
+                    )
+                self.sock.send_multipart([WORKER_ACK, str(len(messages)).encode()])
             except Exception as ex:
                 print(f"exception thrown in worker {ex}")